@@ -128,6 +128,15 @@ REST_FRAMEWORK = {
     "DEFAULT_PERMISSION_CLASSES": [
         "rest_framework.permissions.IsAuthenticatedOrReadOnly",
     ],
+    "DEFAULT_RENDERER_CLASSES": [
+        "core.renderers.ORJSONRenderer",
+        "rest_framework.renderers.BrowsableAPIRenderer",
+    ],
+    "DEFAULT_PARSER_CLASSES": [
+        "core.parsers.ORJSONParser",
+        "rest_framework.parsers.FormParser",
+        "rest_framework.parsers.MultiPartParser",
+    ],
     "DEFAULT_PAGINATION_CLASS": "rest_framework.pagination.PageNumberPagination",
     "PAGE_SIZE": 12,
     "DEFAULT_FILTER_BACKENDS": [
@@ -157,17 +166,70 @@ SIMPLE_JWT = {
 
 COMPANY_NAME = env("COMPANY_NAME", default="Chapterly")
 
+# Agrupamento de notificações: eventos do mesmo tipo na mesma ideia dentro da
+# janela (em segundos) viram uma única notificação com contagem e atores
+# recentes. Tipos fora do dicionário não são agrupados.
+NOTIFICATION_COALESCE_WINDOWS = {
+    "voto": 60 * 60 * 24,  # 24 horas
+    "comentario": 60 * 60,  # 1 hora
+}
+
+# Retenção das notificações, em dias, por tipo: ``manage.py purge_notifications``
+# apaga (ou arquiva) as mais antigas. Tipos fora do dicionário não expiram.
+NOTIFICATION_RETENTION_DAYS = {
+    "voto": 90,
+    "comentario": 90,
+    "voluntario": 180,
+    "agendamento": 180,
+    "mencao": 365,
+}
+
+# Retenção dos itens da outbox, em dias, por status: entregues ficam alguns
+# dias para auditoria e as falhas definitivas um pouco mais. Itens pendentes
+# nunca são expurgados.
+NOTIFICATION_OUTBOX_RETENTION_DAYS = {
+    "enviado": 7,
+    "falhou": 30,
+}
+
+# Stream SSE de notificações (/api/notifications/stream/). O backend leva os
+# eventos do worker da outbox até os processos ASGI: LocalStreamBackend só
+# funciona no mesmo processo; em produção use o PostgresNotifyBackend.
+NOTIFICATION_STREAM_BACKEND = env(
+    "NOTIFICATION_STREAM_BACKEND",
+    default="talks.notifications.stream.LocalStreamBackend",
+)
+NOTIFICATION_STREAM_KEEPALIVE = 15  # segundos
+# Validade dos tickets de uso único que abrem o stream (POST
+# /api/notifications/stream_ticket/), em segundos
+NOTIFICATION_STREAM_TICKET_TTL = 30
+
 FILE_UPLOAD_MAX_MEMORY_SIZE = 5242880  # 5MB
 DATA_UPLOAD_MAX_MEMORY_SIZE = 5242880  # 5MB
 
-CACHES = {
-    "default": {
-        "BACKEND": "django.core.cache.backends.locmem.LocMemCache",
-        "LOCATION": "unique-snowflake",
-        "TIMEOUT": 3600,  # 1 hora
-        "OPTIONS": {"MAX_ENTRIES": 1000},
+# Cache compartilhado entre os processos (workers ASGI e worker da outbox):
+# carimbos de versão (ETag), cache de respostas anônimas e estatísticas
+# dependem dele. Sem REDIS_URL (desenvolvimento e testes) cai no
+# LocMemCache, que é por processo.
+REDIS_URL = env("REDIS_URL", default="")
+
+if REDIS_URL:
+    CACHES = {
+        "default": {
+            "BACKEND": "django.core.cache.backends.redis.RedisCache",
+            "LOCATION": REDIS_URL,
+            "TIMEOUT": 3600,  # 1 hora
+        }
+    }
+else:
+    CACHES = {
+        "default": {
+            "BACKEND": "django.core.cache.backends.locmem.LocMemCache",
+            "LOCATION": "unique-snowflake",
+            "TIMEOUT": 3600,  # 1 hora
+            "OPTIONS": {"MAX_ENTRIES": 1000},
+        }
     }
-}
 
 SPECTACULAR_SETTINGS = {
     "TITLE": "Chapterly API",
@@ -0,0 +1,99 @@
+import timeit
+from io import BytesIO
+from datetime import timedelta
+from decimal import Decimal
+
+from django.core.management.base import BaseCommand
+from django.utils import timezone
+from rest_framework.parsers import JSONParser
+from rest_framework.renderers import JSONRenderer
+
+from core.parsers import ORJSONParser
+from core.renderers import ORJSONRenderer
+
+
+def build_payload(items):
+    """
+    Payload no formato da listagem de ideias: usuários e tags aninhados,
+    percentuais Decimal e datetimes.
+    """
+    now = timezone.now()
+    user = {
+        "id": 1,
+        "username": "autor",
+        "avatar": None,
+        "email": "autor@example.com",
+        "first_name": "Autor",
+        "last_name": "Exemplo",
+    }
+    tags = [
+        {"id": i, "nome": f"Tag {i}", "cor": "#0066FF", "slug": f"tag-{i}"}
+        for i in range(3)
+    ]
+    results = [
+        {
+            "id": i,
+            "titulo": f"Ideia {i}",
+            "descricao": "Descrição da apresentação " * 5,
+            "autor": user,
+            "apresentador": user,
+            "tags": tags,
+            "status": "agendado",
+            "data_agendada": now + timedelta(days=i),
+            "vote_count": i,
+            "vote_percentage": Decimal("12.34"),
+            "has_voted": bool(i % 2),
+            "created_at": now,
+            "updated_at": now,
+        }
+        for i in range(items)
+    ]
+    return {"count": items, "next": None, "previous": None, "results": results}
+
+
+class Command(BaseCommand):
+    help = "Compara o tempo de render/parse do JSONRenderer padrão com o orjson"
+
+    def add_arguments(self, parser):
+        parser.add_argument(
+            "--items", type=int, default=12, help="Ideias por payload (padrão: 12)"
+        )
+        parser.add_argument(
+            "--iterations",
+            type=int,
+            default=2000,
+            help="Repetições por medição (padrão: 2000)",
+        )
+
+    def handle(self, *args, **options):
+        payload = build_payload(options["items"])
+        iterations = options["iterations"]
+        body = ORJSONRenderer().render(payload)
+
+        results = [
+            (
+                "render",
+                self._measure(lambda: JSONRenderer().render(payload), iterations),
+                self._measure(lambda: ORJSONRenderer().render(payload), iterations),
+            ),
+            (
+                "parse",
+                self._measure(lambda: JSONParser().parse(BytesIO(body)), iterations),
+                self._measure(lambda: ORJSONParser().parse(BytesIO(body)), iterations),
+            ),
+        ]
+
+        self.stdout.write(
+            f"Payload: {options['items']} ideias, {len(body)} bytes, "
+            f"{iterations} iterações"
+        )
+        for label, default, orjson in results:
+            self.stdout.write(
+                f"{label:>6}: padrão {default * 1e6:8.1f} µs | "
+                f"orjson {orjson * 1e6:8.1f} µs | "
+                + self.style.SUCCESS(f"{default / orjson:.1f}x mais rápido")
+            )
+
+    @staticmethod
+    def _measure(func, iterations):
+        return min(timeit.repeat(func, number=iterations, repeat=3)) / iterations
@@ -0,0 +1,18 @@
+# Generated by Django 6.0 on 2026-10-17 02:19
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('core', '0004_alter_systemconfiguration_retro_enabled'),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name='user',
+            name='notifications_last_read_at',
+            field=models.DateTimeField(blank=True, help_text='Notificações criadas até este instante contam como lidas', null=True),
+        ),
+    ]
@@ -0,0 +1,18 @@
+# Generated by Django 6.0 on 2026-10-17 03:05
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('core', '0005_user_notifications_last_read_at'),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name='user',
+            name='notifications_unread_count',
+            field=models.PositiveIntegerField(default=0, editable=False, help_text='Notificações não lidas (mantido por UnreadCounterService)'),
+        ),
+    ]
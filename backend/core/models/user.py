@@ -10,6 +10,16 @@ class User(AbstractUser):
         blank=True,
         help_text="Foto de perfil do usuário",
     )
+    notifications_last_read_at = models.DateTimeField(
+        null=True,
+        blank=True,
+        help_text="Notificações criadas até este instante contam como lidas",
+    )
+    notifications_unread_count = models.PositiveIntegerField(
+        default=0,
+        editable=False,
+        help_text="Notificações não lidas (mantido por UnreadCounterService)",
+    )
 
     def __str__(self):
         return self.username
@@ -0,0 +1,3 @@
+from core.parsers.orjson_parser import ORJSONParser
+
+__all__ = ["ORJSONParser"]
@@ -0,0 +1,3 @@
+from core.renderers.orjson_renderer import ORJSONRenderer
+
+__all__ = ["ORJSONRenderer"]
@@ -0,0 +1,44 @@
+from decimal import Decimal
+
+import orjson
+from rest_framework.renderers import JSONRenderer
+from rest_framework.utils.encoders import JSONEncoder
+
+
+class ORJSONRenderer(JSONRenderer):
+    """
+    Renderer JSON baseado em orjson (mesmo media type do ``JSONRenderer``).
+
+    datetime, date, time e UUID são serializados nativamente pelo orjson.
+    Decimal, strings lazy (``gettext_lazy``), timedelta, querysets etc.
+    caem no ``default``, que reaproveita o encoder do DRF para manter a
+    mesma saída do renderer padrão.
+    """
+
+    options = orjson.OPT_UTC_Z | orjson.OPT_NON_STR_KEYS
+    encoder = JSONEncoder()
+
+    def default(self, obj):
+        # Decimal é o tipo não nativo mais comum nos payloads (percentuais)
+        if isinstance(obj, Decimal):
+            return float(obj)
+        return self.encoder.default(obj)
+
+    def render(self, data, accepted_media_type=None, renderer_context=None):
+        if data is None:
+            return b""
+
+        options = self.options
+        if self.get_indent(accepted_media_type or "", renderer_context or {}):
+            options |= orjson.OPT_INDENT_2
+
+        try:
+            ret = orjson.dumps(data, default=self.default, option=options)
+        except orjson.JSONEncodeError:
+            # orjson recusa inteiros fora de 64 bits; o renderer padrão aceita
+            return super().render(data, accepted_media_type, renderer_context)
+
+        # Mesmo escape do JSONRenderer: U+2028/U+2029 quebram JS embutido
+        return ret.replace(b"\xe2\x80\xa8", b"\\u2028").replace(
+            b"\xe2\x80\xa9", b"\\u2029"
+        )
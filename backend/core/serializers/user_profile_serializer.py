@@ -38,11 +38,11 @@ class UserProfileSerializer(serializers.ModelSerializer):
     def get_ideias_criadas(self, obj):
         from talks.serializers import IdeaListSerializer
 
-        ideias = obj.ideias_criadas.all().order_by("-created_at")[:5]
+        ideias = obj.ideias_criadas.optimized().order_by("-created_at")[:5]
         return IdeaListSerializer(ideias, many=True, context=self.context).data
 
     def get_ideias_apresentando(self, obj):
         from talks.serializers import IdeaListSerializer
 
-        ideias = obj.ideias_apresentando.all().order_by("-created_at")[:5]
+        ideias = obj.ideias_apresentando.optimized().order_by("-created_at")[:5]
         return IdeaListSerializer(ideias, many=True, context=self.context).data
@@ -0,0 +1,74 @@
+"""
+Unit tests for the orjson renderer and parser.
+"""
+
+import uuid
+from datetime import date, datetime, timedelta, timezone
+from decimal import Decimal
+from io import BytesIO
+
+from django.test import SimpleTestCase
+from django.utils.translation import gettext_lazy
+from rest_framework.exceptions import ParseError
+from rest_framework.parsers import JSONParser
+from rest_framework.renderers import JSONRenderer
+
+from core.parsers import ORJSONParser
+from core.renderers import ORJSONRenderer
+
+
+class ORJSONRendererTest(SimpleTestCase):
+    """Test that ORJSONRenderer matches DRF's JSONRenderer output."""
+
+    def assertSameOutput(self, data, accepted_media_type=None):
+        expected = JSONRenderer().render(data, accepted_media_type)
+        rendered = ORJSONRenderer().render(data, accepted_media_type)
+        self.assertEqual(
+            JSONParser().parse(BytesIO(rendered)), JSONParser().parse(BytesIO(expected))
+        )
+        return rendered
+
+    def test_renders_datetimes_decimals_and_lazy_strings(self):
+        data = {
+            "created_at": datetime(2026, 1, 2, 3, 4, 5, 6000, tzinfo=timezone.utc),
+            "data": date(2026, 1, 2),
+            "duracao": timedelta(minutes=5),
+            "percentual": Decimal("12.50"),
+            "status": gettext_lazy("agendado"),
+            "uuid": uuid.UUID(int=1),
+        }
+
+        rendered = self.assertSameOutput(data)
+
+        self.assertIn(b'"created_at":"2026-01-02T03:04:05.006000Z"', rendered)
+        self.assertIn(b'"percentual":12.5', rendered)
+
+    def test_renders_non_string_keys_and_nested_lists(self):
+        self.assertSameOutput({1: [{"id": 1}, {"id": 2}], "vazio": None})
+
+    def test_escapes_line_separators(self):
+        rendered = self.assertSameOutput({"texto": "a\u2028b\u2029c"})
+        self.assertNotIn("\u2028".encode(), rendered)
+
+    def test_integers_beyond_64_bits_fall_back_to_json_renderer(self):
+        rendered = self.assertSameOutput({"total": 2**64, "items": [-(2**70)]})
+        self.assertIn(b"18446744073709551616", rendered)
+
+    def test_none_renders_empty_body(self):
+        self.assertEqual(ORJSONRenderer().render(None), b"")
+
+    def test_indent_from_accept_header(self):
+        rendered = ORJSONRenderer().render({"a": 1}, "application/json; indent=4")
+        self.assertEqual(rendered, b'{\n  "a": 1\n}')
+
+
+class ORJSONParserTest(SimpleTestCase):
+    """Test ORJSONParser parsing and error handling."""
+
+    def test_parses_utf8_json(self):
+        data = ORJSONParser().parse(BytesIO('{"titulo": "Introdução"}'.encode()))
+        self.assertEqual(data, {"titulo": "Introdução"})
+
+    def test_invalid_json_raises_parse_error(self):
+        with self.assertRaises(ParseError):
+            ORJSONParser().parse(BytesIO(b"{invalid"))
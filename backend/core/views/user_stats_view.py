@@ -1,3 +1,4 @@
+from django.db.models import Sum
 from django.utils import timezone
 from drf_spectacular.utils import extend_schema
 from rest_framework.permissions import IsAuthenticated
@@ -38,7 +39,9 @@ class UserStatsView(APIView):
         ).count()
 
         # Votos recebidos nas ideias criadas
-        votos_recebidos = sum(idea.vote_count for idea in user.ideias_criadas.all())
+        votos_recebidos = (
+            user.ideias_criadas.aggregate(total=Sum("vote_count"))["total"] or 0
+        )
 
         stats = {
             "ideias_criadas": ideias_criadas,
@@ -1,16 +1,19 @@
 from django.contrib import admin
+from django.utils import timezone
 from django.utils.html import format_html
 
 from .models import (
     Comment,
     Idea,
     Notification,
+    NotificationOutbox,
     Retro,
     RetroItem,
     RetroTemplate,
     Tag,
     Vote,
 )
+from .notifications.unread_counter import UnreadCounterService
 
 
 @admin.register(Tag)
@@ -124,6 +127,21 @@ class VoteAdmin(admin.ModelAdmin):
         qs = super().get_queryset(request)
         return qs.select_related("user", "idea")
 
+    def save_model(self, request, obj, form, change):
+        super().save_model(request, obj, form, change)
+        # Votos editados no admin não passam por Idea.toggle_vote
+        idea_ids = {obj.idea_id, form.initial.get("idea")} - {None}
+        Idea.objects.filter(pk__in=idea_ids).refresh_vote_count()
+
+    def delete_model(self, request, obj):
+        super().delete_model(request, obj)
+        Idea.objects.filter(pk=obj.idea_id).refresh_vote_count()
+
+    def delete_queryset(self, request, queryset):
+        idea_ids = list(queryset.values_list("idea_id", flat=True).distinct())
+        super().delete_queryset(request, queryset)
+        Idea.objects.filter(pk__in=idea_ids).refresh_vote_count()
+
 
 @admin.register(Comment)
 class CommentAdmin(admin.ModelAdmin):
@@ -163,18 +181,57 @@ class NotificationAdmin(admin.ModelAdmin):
     actions = ["mark_as_read", "mark_as_unread"]
 
     def mark_as_read(self, request, queryset):
+        user_ids = set(queryset.values_list("user_id", flat=True))
         updated = queryset.update(lido=True)
+        UnreadCounterService.refresh(*user_ids)
         self.message_user(request, f"{updated} notificações marcadas como lidas.")
 
     mark_as_read.short_description = "Marcar como lida"
 
     def mark_as_unread(self, request, queryset):
+        user_ids = set(queryset.values_list("user_id", flat=True))
         updated = queryset.update(lido=False)
+        UnreadCounterService.refresh(*user_ids)
         self.message_user(request, f"{updated} notificações marcadas como não lidas.")
 
     mark_as_unread.short_description = "Marcar como não lida"
 
 
+@admin.register(NotificationOutbox)
+class NotificationOutboxAdmin(admin.ModelAdmin):
+    list_display = [
+        "recipient",
+        "tipo",
+        "status",
+        "tentativas",
+        "disponivel_em",
+        "created_at",
+    ]
+    list_filter = ["status", "tipo", "created_at"]
+    search_fields = ["recipient__username", "mensagem", "ultimo_erro"]
+    readonly_fields = [
+        "created_at",
+        "enviado_em",
+        "ultimo_erro",
+        "servicos_entregues",
+    ]
+    date_hierarchy = "created_at"
+
+    def get_queryset(self, request):
+        qs = super().get_queryset(request)
+        return qs.select_related("recipient", "idea")
+
+    actions = ["retry_now"]
+
+    def retry_now(self, request, queryset):
+        updated = queryset.exclude(status="enviado").update(
+            status="pendente", tentativas=0, disponivel_em=timezone.now()
+        )
+        self.message_user(request, f"{updated} notificações reenfileiradas.")
+
+    retry_now.short_description = "Reenfileirar agora"
+
+
 @admin.register(RetroTemplate)
 class RetroTemplateAdmin(admin.ModelAdmin):
     list_display = ["nome", "is_default", "is_system", "total_retros", "created_at"]
@@ -318,3 +375,8 @@ class RetroItemAdmin(admin.ModelAdmin):
         return 0
 
     vote_count_display.short_description = "Votos"
+
+    def save_related(self, request, form, formsets, change):
+        super().save_related(request, form, formsets, change)
+        # Votos editados pelo filter_horizontal não passam por toggle_vote
+        RetroItem.objects.filter(pk=form.instance.pk).refresh_vote_count()
@@ -5,4 +5,12 @@ class TalksConfig(AppConfig):
     name = "talks"
 
     def ready(self):
+        from talks import handlers
+
+        handlers.connect()
+
+        import talks.checks  # noqa
         import talks.notifications.handlers  # noqa
+        import talks.search.handlers  # noqa
+        import talks.services.idea_stats  # noqa
+        import talks.versioning.handlers  # noqa
@@ -0,0 +1,27 @@
+from django.conf import settings
+from django.core.checks import Tags, Warning, register
+
+# Backends cujo conteúdo não é visto pelos outros processos
+PROCESS_LOCAL_CACHES = {
+    "django.core.cache.backends.locmem.LocMemCache",
+    "django.core.cache.backends.dummy.DummyCache",
+}
+
+
+@register(Tags.caches, deploy=True)
+def check_shared_cache(app_configs, **kwargs):
+    """
+    ``manage.py check --deploy``: carimbos de ``ResourceVersion`` e o cache de
+    respostas anônimas só são coerentes com um cache compartilhado.
+    """
+    backend = settings.CACHES.get("default", {}).get("BACKEND")
+    if backend not in PROCESS_LOCAL_CACHES:
+        return []
+    return [
+        Warning(
+            "O cache 'default' é local ao processo: ETags e respostas anônimas "
+            "em cache ficam divergentes entre os workers.",
+            hint="Defina REDIS_URL para usar o Redis como cache compartilhado.",
+            id="talks.W001",
+        )
+    ]
@@ -1,3 +1,4 @@
 from talks.filters.idea_filter import IdeaFilter
+from talks.filters.notification_filter import NotificationFilter
 
-__all__ = ["IdeaFilter"]
+__all__ = ["IdeaFilter", "NotificationFilter"]
@@ -1,7 +1,7 @@
 import django_filters
-from django.db.models import Q
 
 from talks.models import Idea, Tag
+from talks.search import get_search_backend
 
 
 class IdeaFilter(django_filters.FilterSet):
@@ -54,7 +54,8 @@ class IdeaFilter(django_filters.FilterSet):
     )
 
     search = django_filters.CharFilter(
-        method="filter_search", help_text="Buscar em título ou descrição"
+        method="filter_search",
+        help_text="Busca textual em título, descrição e conteúdo (ordenada por relevância)",
     )
 
     data_agendada_antes = django_filters.DateTimeFilter(
@@ -110,15 +111,7 @@ class IdeaFilter(django_filters.FilterSet):
         return queryset.filter(tags__slug__iexact=value).distinct()
 
     def filter_search(self, queryset, name, value):
-        return queryset.filter(
-            Q(titulo__icontains=value)
-            | Q(descricao__icontains=value)
-            | Q(conteudo__icontains=value)
-        ).distinct()
+        return get_search_backend(queryset.db).search(queryset, value)
 
     def filter_votos_minimos(self, queryset, name, value):
-        from django.db.models import Count
-
-        return queryset.annotate(total_votes=Count("votos")).filter(
-            total_votes__gte=value
-        )
+        return queryset.filter(vote_count__gte=value)
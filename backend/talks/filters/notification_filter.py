@@ -0,0 +1,20 @@
+import django_filters
+
+from talks.models import Notification
+
+
+class NotificationFilter(django_filters.FilterSet):
+    lido = django_filters.BooleanFilter(
+        method="filter_lido",
+        help_text="Filtrar por lidas/não lidas (considera marcar todas como lidas)",
+    )
+
+    class Meta:
+        model = Notification
+        fields = ["tipo", "lido"]
+
+    def filter_lido(self, queryset, name, value):
+        last_read_at = self.request.user.notifications_last_read_at
+        if value:
+            return queryset.read(last_read_at)
+        return queryset.unread(last_read_at)
@@ -0,0 +1,137 @@
+"""
+Receivers que mantêm os contadores desnormalizados (ideias e itens de retro)
+a partir de mudanças em usuários e comentários.
+
+Ficam todos aqui, conectados explicitamente por ``TalksConfig.ready`` via
+``connect()``, para que a ordem entre eles seja a deste módulo e não a de
+importação dos models/services.
+
+Ativação de usuário: ``track_user_activation`` (pre_save) compara o
+``is_active`` com o valor no banco e guarda o resultado na instância;
+``on_user_saved`` (post_save) lê esse resultado com ``activation_changed``.
+"""
+
+from django.conf import settings
+from django.db.models import F
+from django.db.models.signals import post_delete, post_save, pre_delete, pre_save
+
+from talks.models import Idea, RetroItem
+from talks.notifications.signals import comment_created, comment_deleted
+from talks.services.idea_stats import IdeaStatsService
+from talks.services.population_stats import PopulationStatsService
+
+ACTIVATION_CHANGED_ATTR = "_is_active_changed"
+
+
+def activation_changed(user) -> bool:
+    """
+    Indica se o último ``save()`` do usuário alterou ``is_active``.
+
+    Só é confiável dentro de receivers de post_save: o valor é calculado por
+    ``track_user_activation`` no pre_save do mesmo ``save()``.
+    """
+    return getattr(user, ACTIVATION_CHANGED_ATTR, False)
+
+
+def track_user_activation(sender, instance, update_fields=None, **kwargs):
+    setattr(instance, ACTIVATION_CHANGED_ATTR, False)
+    if instance.pk is None:
+        return
+    if update_fields is not None and "is_active" not in update_fields:
+        return
+
+    previous = (
+        sender.objects.filter(pk=instance.pk)
+        .values_list("is_active", flat=True)
+        .first()
+    )
+    setattr(
+        instance,
+        ACTIVATION_CHANGED_ATTR,
+        previous is not None and previous != instance.is_active,
+    )
+
+
+def on_user_saved(sender, instance, created, **kwargs):
+    changed = activation_changed(instance)
+    if changed:
+        # Votos de usuários inativos não contam em vote_count
+        Idea.objects.filter(votos__user=instance).refresh_vote_count()
+        IdeaStatsService.invalidate()
+
+    if created or changed:
+        PopulationStatsService.invalidate()
+
+
+def collect_user_relations(sender, instance, **kwargs):
+    # O CASCADE apaga votos e comentários: guarda as ideias e os itens de
+    # retro afetados antes
+    instance._voted_idea_ids = list(
+        Idea.objects.filter(votos__user=instance).values_list("pk", flat=True)
+    )
+    instance._commented_idea_ids = list(
+        Idea.objects.filter(comentarios__user=instance)
+        .values_list("pk", flat=True)
+        .distinct()
+    )
+    instance._voted_retro_item_ids = list(
+        instance.retro_items_votados.values_list("pk", flat=True)
+    )
+
+
+def on_user_deleted(sender, instance, **kwargs):
+    idea_ids = getattr(instance, "_voted_idea_ids", None)
+    if idea_ids:
+        Idea.objects.filter(pk__in=idea_ids).refresh_vote_count()
+
+    idea_ids = getattr(instance, "_commented_idea_ids", None)
+    if idea_ids:
+        Idea.objects.filter(pk__in=idea_ids).refresh_comment_stats()
+
+    item_ids = getattr(instance, "_voted_retro_item_ids", None)
+    if item_ids:
+        RetroItem.objects.filter(pk__in=item_ids).refresh_vote_count()
+
+    PopulationStatsService.invalidate()
+
+
+def increment_comment_count(sender, comment, **kwargs):
+    Idea.objects.filter(pk=comment.idea_id).update(
+        comment_count=F("comment_count") + 1,
+        last_comment_at=comment.created_at,
+    )
+
+
+def refresh_comment_stats_on_delete(sender, comment, **kwargs):
+    # Deletar um comentário remove a thread inteira: recontar é mais simples
+    # (e exato) que descontar a sub-árvore
+    Idea.objects.filter(pk=comment.idea_id).refresh_comment_stats()
+
+
+def connect():
+    """Conecta os receivers deste módulo. Chamado por ``TalksConfig.ready``."""
+    user_model = settings.AUTH_USER_MODEL
+
+    pre_save.connect(
+        track_user_activation,
+        sender=user_model,
+        dispatch_uid="talks.track_user_activation",
+    )
+    post_save.connect(
+        on_user_saved, sender=user_model, dispatch_uid="talks.on_user_saved"
+    )
+    pre_delete.connect(
+        collect_user_relations,
+        sender=user_model,
+        dispatch_uid="talks.collect_user_relations",
+    )
+    post_delete.connect(
+        on_user_deleted, sender=user_model, dispatch_uid="talks.on_user_deleted"
+    )
+    comment_created.connect(
+        increment_comment_count, dispatch_uid="talks.increment_comment_count"
+    )
+    comment_deleted.connect(
+        refresh_comment_stats_on_delete,
+        dispatch_uid="talks.refresh_comment_stats_on_delete",
+    )
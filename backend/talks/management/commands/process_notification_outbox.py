@@ -0,0 +1,61 @@
+import time
+
+from django.core.management.base import BaseCommand
+from django.db import close_old_connections
+
+from talks.notifications.outbox import NotificationOutboxService
+
+
+class Command(BaseCommand):
+    help = "Entrega as notificações pendentes da outbox (worker)"
+
+    def add_arguments(self, parser):
+        parser.add_argument(
+            "--batch-size",
+            type=int,
+            default=100,
+            help="Notificações reservadas por lote (padrão: 100)",
+        )
+        parser.add_argument(
+            "--interval",
+            type=float,
+            default=2.0,
+            help="Segundos de espera quando a fila está vazia (padrão: 2)",
+        )
+        parser.add_argument(
+            "--once",
+            action="store_true",
+            help="Esvazia a fila disponível e encerra (ex: cron)",
+        )
+
+    def handle(self, *args, **options):
+        total_delivered = total_failed = 0
+
+        try:
+            while True:
+                # Processo de longa duração: descarta conexões quebradas ou
+                # além de CONN_MAX_AGE entre os lotes
+                close_old_connections()
+                delivered, failed = NotificationOutboxService.process_batch(
+                    options["batch_size"]
+                )
+                total_delivered += delivered
+                total_failed += failed
+
+                if delivered or failed:
+                    self.stdout.write(
+                        f"⟳ {delivered} entregues, {failed} com falha (reagendadas)"
+                    )
+                    continue
+
+                if options["once"]:
+                    break
+                time.sleep(options["interval"])
+        except KeyboardInterrupt:
+            pass
+
+        self.stdout.write(
+            self.style.SUCCESS(
+                f"✅ Concluído! {total_delivered} entregues, {total_failed} com falha."
+            )
+        )
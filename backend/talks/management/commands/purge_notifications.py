@@ -0,0 +1,120 @@
+import gzip
+import time
+
+from django.core.management.base import BaseCommand
+
+from talks.notifications.retention import NotificationRetentionService
+
+
+class Command(BaseCommand):
+    help = (
+        "Expurga as notificações mais antigas que a retenção do seu tipo "
+        "(NOTIFICATION_RETENTION_DAYS) e os itens processados da outbox "
+        "(NOTIFICATION_OUTBOX_RETENTION_DAYS), em lotes"
+    )
+
+    def add_arguments(self, parser):
+        parser.add_argument(
+            "--batch-size",
+            type=int,
+            default=1000,
+            help="Linhas apagadas por transação (padrão: 1000)",
+        )
+        parser.add_argument(
+            "--sleep",
+            type=float,
+            default=0.0,
+            help="Pausa em segundos entre lotes, para aliviar o banco (padrão: 0)",
+        )
+        parser.add_argument(
+            "--archive",
+            help="Arquivo JSON Lines (.gz para compactar) que recebe as "
+            "notificações antes de serem apagadas",
+        )
+        parser.add_argument(
+            "--dry-run",
+            action="store_true",
+            help="Apenas conta as notificações expiradas de cada tipo",
+        )
+
+    def handle(self, *args, **options):
+        cutoffs = NotificationRetentionService.cutoffs()
+        outbox_cutoffs = NotificationRetentionService.outbox_cutoffs()
+        if not cutoffs and not outbox_cutoffs:
+            self.stdout.write(self.style.WARNING("Nenhuma retenção configurada."))
+            return
+
+        if options["dry_run"]:
+            total = 0
+            for tipo, cutoff in cutoffs.items():
+                count = NotificationRetentionService.expired(tipo, cutoff).count()
+                total += count
+                self.stdout.write(
+                    f"⟳ {tipo}: {count} expiradas (antes de {cutoff:%Y-%m-%d})"
+                )
+            for status, cutoff in outbox_cutoffs.items():
+                count = NotificationRetentionService.expired_outbox(
+                    status, cutoff
+                ).count()
+                self.stdout.write(
+                    f"⟳ outbox {status}: {count} expirados "
+                    f"(antes de {cutoff:%Y-%m-%d})"
+                )
+            self.stdout.write(
+                self.style.WARNING(
+                    f"\n{total} notificações expiradas (dry-run, nada alterado)."
+                )
+            )
+            return
+
+        archive = None
+        if options["archive"]:
+            opener = gzip.open if options["archive"].endswith(".gz") else open
+            archive = opener(options["archive"], "ab")
+
+        total = 0
+        try:
+            for tipo, cutoff in cutoffs.items():
+                purged = self.purge(
+                    lambda: NotificationRetentionService.purge_batch(
+                        tipo, cutoff, options["batch_size"], archive
+                    ),
+                    options["sleep"],
+                )
+                if purged:
+                    self.stdout.write(f"⟳ {tipo}: {purged} expurgadas")
+                total += purged
+        finally:
+            if archive is not None:
+                archive.close()
+
+        outbox_total = 0
+        for status, cutoff in outbox_cutoffs.items():
+            purged = self.purge(
+                lambda: NotificationRetentionService.purge_outbox_batch(
+                    status, cutoff, options["batch_size"]
+                ),
+                options["sleep"],
+            )
+            if purged:
+                self.stdout.write(f"⟳ outbox {status}: {purged} expurgados")
+            outbox_total += purged
+
+        self.stdout.write(
+            self.style.SUCCESS(
+                f"✅ Concluído! {total} notificações e {outbox_total} itens da "
+                "outbox expurgados."
+            )
+        )
+
+    @staticmethod
+    def purge(purge_batch, sleep: float) -> int:
+        """Chama ``purge_batch`` até não restar nada; retorna o total apagado."""
+        purged = 0
+        while True:
+            deleted = purge_batch()
+            if not deleted:
+                return purged
+            purged += deleted
+            if sleep:
+                time.sleep(sleep)
@@ -0,0 +1,52 @@
+from django.core.management.base import BaseCommand
+from django.db.models import F
+
+from talks.models import Idea
+from talks.models.idea import active_vote_count_subquery
+from talks.versioning import ResourceVersion
+from talks.versioning.handlers import IDEAS, idea_scope
+
+
+class Command(BaseCommand):
+    help = "Recalcula o contador persistido de votos ativos das ideias"
+
+    def add_arguments(self, parser):
+        parser.add_argument(
+            "--dry-run",
+            action="store_true",
+            help="Apenas lista as ideias com contador divergente",
+        )
+
+    def handle(self, *args, **options):
+        divergentes = list(
+            Idea.objects.annotate(votos_reais=active_vote_count_subquery())
+            .exclude(vote_count=F("votos_reais"))
+            .values_list("id", "titulo", "vote_count", "votos_reais")
+        )
+
+        if not divergentes:
+            self.stdout.write(
+                self.style.SUCCESS("✅ Todos os contadores estão corretos.")
+            )
+            return
+
+        for idea_id, titulo, atual, real in divergentes:
+            self.stdout.write(
+                self.style.WARNING(f'⟳ Ideia #{idea_id} "{titulo}": {atual} → {real}')
+            )
+
+        if options["dry_run"]:
+            self.stdout.write(
+                self.style.WARNING(
+                    f"\n{len(divergentes)} contadores divergentes (dry-run, nada alterado)."
+                )
+            )
+            return
+
+        idea_ids = [idea_id for idea_id, *_ in divergentes]
+        updated = Idea.objects.filter(pk__in=idea_ids).refresh_vote_count()
+        ResourceVersion.bump(IDEAS, *(idea_scope(idea_id) for idea_id in idea_ids))
+
+        self.stdout.write(
+            self.style.SUCCESS(f"\n✅ Concluído! {updated} contadores corrigidos.")
+        )
@@ -0,0 +1,41 @@
+# Generated by Django 6.0 on 2026-10-17 00:59
+
+from django.conf import settings
+from django.db import migrations, models
+from django.db.models import Count, OuterRef, Subquery
+from django.db.models.functions import Coalesce
+
+
+def backfill_vote_count(apps, schema_editor):
+    Idea = apps.get_model("talks", "Idea")
+    Vote = apps.get_model("talks", "Vote")
+
+    active_votes = (
+        Vote.objects.filter(idea=OuterRef("pk"), user__is_active=True)
+        .order_by()
+        .values("idea")
+        .annotate(total=Count("id"))
+        .values("total")
+    )
+    Idea.objects.update(vote_count=Coalesce(Subquery(active_votes), 0))
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('talks', '0004_retrotemplate_retro_retroitem_and_more'),
+        migrations.swappable_dependency(settings.AUTH_USER_MODEL),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name='idea',
+            name='vote_count',
+            field=models.PositiveIntegerField(default=0, editable=False, help_text='Total de votos de usuários ativos (mantido por toggle_vote)'),
+        ),
+        migrations.AddIndex(
+            model_name='idea',
+            index=models.Index(fields=['-vote_count', '-created_at'], name='talks_idea_vote_co_d64a07_idx'),
+        ),
+        migrations.RunPython(backfill_vote_count, migrations.RunPython.noop),
+    ]
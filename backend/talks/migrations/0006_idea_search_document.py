@@ -0,0 +1,96 @@
+# Generated by Django 6.0 on 2026-10-17 01:20
+
+import re
+from html import unescape
+
+from django.db import migrations, models
+from django.utils.html import strip_tags
+
+# Cópia congelada do que a migration precisa de ``talks.search``: mudanças
+# futuras no código da app não podem alterar o que esta migration faz.
+SEARCH_CONFIG = 'portuguese_unaccent'
+SEARCH_INDEX = 'talks_idea_search_gin'
+FTS_TABLE = 'talks_idea_fts'
+
+WHITESPACE = re.compile(r'\s+')
+
+
+def build_search_document(titulo, descricao, conteudo):
+    parts = [titulo or '', descricao or '', strip_tags(conteudo or '')]
+    text = unescape(' '.join(parts))
+    return WHITESPACE.sub(' ', text).strip()
+
+
+def backfill_search_document(apps, schema_editor):
+    Idea = apps.get_model("talks", "Idea")
+
+    for idea in Idea.objects.only("id", "titulo", "descricao", "conteudo").iterator():
+        idea.search_document = build_search_document(
+            idea.titulo, idea.descricao, idea.conteudo
+        )
+        idea.save(update_fields=["search_document"])
+
+
+def setup_search_index(apps, schema_editor):
+    Idea = apps.get_model("talks", "Idea")
+    vendor = schema_editor.connection.vendor
+
+    if vendor == 'postgresql':
+        from django.contrib.postgres.indexes import GinIndex
+        from django.contrib.postgres.search import SearchVector
+
+        schema_editor.execute('CREATE EXTENSION IF NOT EXISTS unaccent')
+        schema_editor.execute(f"""
+            DO $$
+            BEGIN
+                IF NOT EXISTS (
+                    SELECT 1 FROM pg_ts_config WHERE cfgname = '{SEARCH_CONFIG}'
+                ) THEN
+                    CREATE TEXT SEARCH CONFIGURATION {SEARCH_CONFIG} (COPY = portuguese);
+                    ALTER TEXT SEARCH CONFIGURATION {SEARCH_CONFIG}
+                        ALTER MAPPING FOR hword, hword_part, word
+                        WITH unaccent, portuguese_stem;
+                END IF;
+            END
+            $$;
+            """)
+        schema_editor.add_index(
+            Idea,
+            GinIndex(SearchVector('search_document', config=SEARCH_CONFIG), name=SEARCH_INDEX),
+        )
+    elif vendor == 'sqlite':
+        schema_editor.execute(
+            f"CREATE VIRTUAL TABLE IF NOT EXISTS {FTS_TABLE} USING fts5("
+            "document, tokenize = 'unicode61 remove_diacritics 2')"
+        )
+        schema_editor.execute(
+            f"INSERT INTO {FTS_TABLE} (rowid, document) "
+            f"SELECT id, search_document FROM {Idea._meta.db_table}"
+        )
+
+
+def teardown_search_index(apps, schema_editor):
+    vendor = schema_editor.connection.vendor
+
+    if vendor == 'postgresql':
+        schema_editor.execute(f'DROP INDEX IF EXISTS {SEARCH_INDEX}')
+        schema_editor.execute(f'DROP TEXT SEARCH CONFIGURATION IF EXISTS {SEARCH_CONFIG}')
+    elif vendor == 'sqlite':
+        schema_editor.execute(f'DROP TABLE IF EXISTS {FTS_TABLE}')
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('talks', '0005_idea_vote_count'),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name='idea',
+            name='search_document',
+            field=models.TextField(blank=True, default='', editable=False, help_text='Título, descrição e conteúdo em texto puro (índice de busca)'),
+        ),
+        migrations.RunPython(backfill_search_document, migrations.RunPython.noop),
+        migrations.RunPython(setup_search_index, teardown_search_index),
+    ]
@@ -0,0 +1,69 @@
+# Generated by Django 6.0 on 2026-10-17 01:32
+
+from django.conf import settings
+from django.db import migrations, models
+
+PATH_STEP = 10
+BATCH_SIZE = 1000
+
+
+def backfill_comment_path(apps, schema_editor):
+    Comment = apps.get_model("talks", "Comment")
+
+    parents = dict(Comment.objects.values_list("id", "parent_id"))
+    paths = {}
+    depths = {}
+
+    def resolve(comment_id):
+        # Sobe até o primeiro ancestral já resolvido (ou a raiz)
+        chain = []
+        while comment_id is not None and comment_id not in paths:
+            chain.append(comment_id)
+            comment_id = parents[comment_id]
+
+        parent_path = paths.get(comment_id, "")
+        depth = depths.get(comment_id, -1)
+        for current in reversed(chain):
+            depth += 1
+            parent_path = f"{parent_path}{current:0{PATH_STEP}d}/"
+            paths[current] = parent_path
+            depths[current] = depth
+
+    for comment_id in parents:
+        resolve(comment_id)
+
+    comments = [
+        Comment(id=comment_id, path=paths[comment_id], depth=depths[comment_id])
+        for comment_id in parents
+    ]
+    Comment.objects.bulk_update(comments, ["path", "depth"], batch_size=BATCH_SIZE)
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('talks', '0006_idea_search_document'),
+        migrations.swappable_dependency(settings.AUTH_USER_MODEL),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name='comment',
+            name='depth',
+            field=models.PositiveSmallIntegerField(default=0, editable=False, help_text='Nível na árvore (0 = comentário raiz)'),
+        ),
+        migrations.AddField(
+            model_name='comment',
+            name='path',
+            field=models.CharField(blank=True, default='', editable=False, help_text='Caminho materializado (IDs dos ancestrais e do próprio comentário)', max_length=255),
+        ),
+        migrations.AddIndex(
+            model_name='comment',
+            index=models.Index(fields=['idea', 'path'], name='talks_comme_idea_id_61bc5c_idx'),
+        ),
+        migrations.AddIndex(
+            model_name='comment',
+            index=models.Index(fields=['path'], name='talks_comment_path_like', opclasses=['varchar_pattern_ops']),
+        ),
+        migrations.RunPython(backfill_comment_path, migrations.RunPython.noop),
+    ]
@@ -0,0 +1,47 @@
+# Generated by Django 6.0 on 2026-10-17 01:36
+
+from django.conf import settings
+from django.db import migrations, models
+from django.db.models import Count, Max, OuterRef, Subquery
+from django.db.models.functions import Coalesce
+
+
+def backfill_comment_stats(apps, schema_editor):
+    Idea = apps.get_model("talks", "Idea")
+    Comment = apps.get_model("talks", "Comment")
+
+    comments = Comment.objects.filter(idea=OuterRef("pk")).order_by().values("idea")
+    Idea.objects.update(
+        comment_count=Coalesce(
+            Subquery(comments.annotate(total=Count("id")).values("total")), 0
+        ),
+        last_comment_at=Subquery(
+            comments.annotate(ultimo=Max("created_at")).values("ultimo")
+        ),
+    )
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('talks', '0007_comment_path'),
+        migrations.swappable_dependency(settings.AUTH_USER_MODEL),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name='idea',
+            name='comment_count',
+            field=models.PositiveIntegerField(default=0, editable=False, help_text='Total de comentários (mantido pelos signals de comentário)'),
+        ),
+        migrations.AddField(
+            model_name='idea',
+            name='last_comment_at',
+            field=models.DateTimeField(blank=True, editable=False, help_text='Data do comentário mais recente', null=True),
+        ),
+        migrations.AddIndex(
+            model_name='idea',
+            index=models.Index(fields=['-comment_count', '-created_at'], name='talks_idea_comment_aac1a3_idx'),
+        ),
+        migrations.RunPython(backfill_comment_stats, migrations.RunPython.noop),
+    ]
@@ -0,0 +1,19 @@
+# Generated by Django 6.0 on 2026-10-17 01:40
+
+from django.conf import settings
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('talks', '0008_idea_comment_count'),
+        migrations.swappable_dependency(settings.AUTH_USER_MODEL),
+    ]
+
+    operations = [
+        migrations.AddIndex(
+            model_name='vote',
+            index=models.Index(fields=['idea', '-created_at'], name='talks_vote_idea_id_aab6e1_idx'),
+        ),
+    ]
@@ -0,0 +1,40 @@
+# Generated by Django 6.0 on 2026-10-17 01:46
+
+import django.db.models.deletion
+import django.utils.timezone
+from django.conf import settings
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('talks', '0009_vote_idea_created_at'),
+        migrations.swappable_dependency(settings.AUTH_USER_MODEL),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name='NotificationOutbox',
+            fields=[
+                ('id', models.BigAutoField(auto_created=True, primary_key=True, serialize=False, verbose_name='ID')),
+                ('tipo', models.CharField(choices=[('voto', 'Novo Voto'), ('voluntario', 'Novo Voluntário'), ('agendamento', 'Apresentação Agendada'), ('comentario', 'Novo Comentário'), ('mencao', 'Menção')], max_length=20)),
+                ('mensagem', models.TextField()),
+                ('metadata', models.JSONField(blank=True, default=dict)),
+                ('status', models.CharField(choices=[('pendente', 'Pendente'), ('enviado', 'Enviado'), ('falhou', 'Falhou')], default='pendente', max_length=10)),
+                ('tentativas', models.PositiveSmallIntegerField(default=0)),
+                ('disponivel_em', models.DateTimeField(default=django.utils.timezone.now, help_text='Próxima tentativa de entrega (backoff exponencial)')),
+                ('ultimo_erro', models.TextField(blank=True)),
+                ('created_at', models.DateTimeField(auto_now_add=True)),
+                ('enviado_em', models.DateTimeField(blank=True, null=True)),
+                ('idea', models.ForeignKey(blank=True, null=True, on_delete=django.db.models.deletion.CASCADE, related_name='+', to='talks.idea')),
+                ('recipient', models.ForeignKey(on_delete=django.db.models.deletion.CASCADE, related_name='notificacoes_pendentes', to=settings.AUTH_USER_MODEL)),
+            ],
+            options={
+                'verbose_name': 'Notificação na Fila',
+                'verbose_name_plural': 'Fila de Notificações',
+                'ordering': ['id'],
+                'indexes': [models.Index(fields=['status', 'disponivel_em'], name='talks_notif_status_30dcfb_idx')],
+            },
+        ),
+    ]
@@ -0,0 +1,35 @@
+# Generated by Django 6.0 on 2026-10-17 01:55
+
+import django.db.models.deletion
+from django.conf import settings
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('talks', '0010_notificationoutbox'),
+        migrations.swappable_dependency(settings.AUTH_USER_MODEL),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name='notification',
+            name='atores',
+            field=models.JSONField(blank=True, default=list, help_text='Autores mais recentes dos eventos agrupados ({id, username})'),
+        ),
+        migrations.AddField(
+            model_name='notification',
+            name='contagem',
+            field=models.PositiveIntegerField(default=1, help_text='Eventos agrupados nesta notificação'),
+        ),
+        migrations.AddField(
+            model_name='notificationoutbox',
+            name='actor',
+            field=models.ForeignKey(blank=True, null=True, on_delete=django.db.models.deletion.SET_NULL, related_name='+', to=settings.AUTH_USER_MODEL),
+        ),
+        migrations.AddIndex(
+            model_name='notification',
+            index=models.Index(fields=['idea', 'tipo', '-created_at'], name='talks_notif_idea_id_0c6051_idx'),
+        ),
+    ]
@@ -0,0 +1,39 @@
+# Generated by Django 6.0 on 2026-10-17 02:14
+
+from django.conf import settings
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('talks', '0011_notification_coalescing'),
+        migrations.swappable_dependency(settings.AUTH_USER_MODEL),
+    ]
+
+    operations = [
+        migrations.AlterModelOptions(
+            name='notification',
+            options={'ordering': ['-created_at', '-id'], 'verbose_name': 'Notificação', 'verbose_name_plural': 'Notificações'},
+        ),
+        migrations.AddIndex(
+            model_name='notification',
+            index=models.Index(fields=['user', '-created_at', '-id'], name='talks_notif_user_recent_idx'),
+        ),
+        migrations.AddIndex(
+            model_name='notification',
+            index=models.Index(condition=models.Q(('lido', False)), fields=['user', '-created_at', '-id'], name='talks_notif_user_unread_idx'),
+        ),
+        migrations.AddIndex(
+            model_name='notification',
+            index=models.Index(fields=['tipo', 'created_at'], name='talks_notif_tipo_6dded2_idx'),
+        ),
+        migrations.RemoveIndex(
+            model_name='notification',
+            name='talks_notif_user_id_94b325_idx',
+        ),
+        migrations.RemoveIndex(
+            model_name='notification',
+            name='talks_notif_created_02cd1a_idx',
+        ),
+    ]
@@ -0,0 +1,48 @@
+# Generated by Django 6.0 on 2026-10-17 02:24
+
+from django.conf import settings
+from django.db import migrations, models
+from django.db.models import Count, OuterRef, Subquery
+from django.db.models.functions import Coalesce
+
+
+def backfill_vote_count(apps, schema_editor):
+    RetroItem = apps.get_model("talks", "RetroItem")
+
+    votes = (
+        RetroItem.votes.through.objects.filter(retroitem=OuterRef("pk"))
+        .order_by()
+        .values("retroitem")
+        .annotate(total=Count("id"))
+        .values("total")
+    )
+    RetroItem.objects.update(vote_count=Coalesce(Subquery(votes), 0))
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('talks', '0012_notification_inbox_indexes'),
+        migrations.swappable_dependency(settings.AUTH_USER_MODEL),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name='retroitem',
+            name='vote_count',
+            field=models.PositiveIntegerField(default=0, editable=False, help_text='Total de votos (mantido por toggle_vote)'),
+        ),
+        migrations.AddIndex(
+            model_name='retroitem',
+            index=models.Index(fields=['retro', 'categoria', '-vote_count', 'ordem', '-created_at'], name='talks_retro_retro_i_c92a18_idx'),
+        ),
+        migrations.RemoveIndex(
+            model_name='retroitem',
+            name='talks_retro_retro_i_40caf7_idx',
+        ),
+        migrations.AlterModelOptions(
+            name='retroitem',
+            options={'ordering': ['categoria', '-vote_count', 'ordem', '-created_at'], 'verbose_name': 'Item de Retrospectiva', 'verbose_name_plural': 'Itens de Retrospectiva'},
+        ),
+        migrations.RunPython(backfill_vote_count, migrations.RunPython.noop),
+    ]
@@ -0,0 +1,52 @@
+# Generated by Django 6.0 on 2026-10-17 02:55
+
+import django.utils.timezone
+from django.conf import settings
+from django.db import migrations, models
+from django.db.models import F
+
+
+def backfill_coalescing_fields(apps, schema_editor):
+    Notification = apps.get_model("talks", "Notification")
+
+    # Sem histórico do primeiro evento: a janela passa a contar do último
+    Notification.objects.update(primeiro_evento_em=F("created_at"))
+
+    batch = []
+    for notification in Notification.objects.exclude(atores=[]).only("id", "atores").iterator():
+        notification.atores_ids = [ator["id"] for ator in notification.atores]
+        batch.append(notification)
+        if len(batch) == 1000:
+            Notification.objects.bulk_update(batch, ["atores_ids"])
+            batch = []
+    Notification.objects.bulk_update(batch, ["atores_ids"])
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('talks', '0013_retroitem_vote_count'),
+        migrations.swappable_dependency(settings.AUTH_USER_MODEL),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name='notification',
+            name='atores_ids',
+            field=models.JSONField(blank=True, default=list, help_text='IDs distintos de todos os autores dos eventos agrupados'),
+        ),
+        migrations.AddField(
+            model_name='notification',
+            name='primeiro_evento_em',
+            field=models.DateTimeField(default=django.utils.timezone.now, help_text='Primeiro evento agrupado; a janela de agrupamento conta daqui'),
+        ),
+        migrations.RunPython(backfill_coalescing_fields, migrations.RunPython.noop),
+        migrations.AddIndex(
+            model_name='notification',
+            index=models.Index(fields=['idea', 'tipo', '-primeiro_evento_em'], name='talks_notif_idea_id_d0bf35_idx'),
+        ),
+        migrations.RemoveIndex(
+            model_name='notification',
+            name='talks_notif_idea_id_0c6051_idx',
+        ),
+    ]
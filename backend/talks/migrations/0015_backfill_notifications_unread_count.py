@@ -0,0 +1,33 @@
+# Generated by Django 6.0 on 2026-10-17 03:05
+
+from django.conf import settings
+from django.db import migrations
+
+
+def backfill_unread_count(apps, schema_editor):
+    User = apps.get_model("core", "User")
+    Notification = apps.get_model("talks", "Notification")
+
+    users = (
+        User.objects.filter(notificacoes__lido=False)
+        .distinct()
+        .values_list("pk", "notifications_last_read_at")
+    )
+    for user_id, last_read_at in users.iterator():
+        unread = Notification.objects.filter(user_id=user_id, lido=False)
+        if last_read_at is not None:
+            unread = unread.filter(created_at__gt=last_read_at)
+        User.objects.filter(pk=user_id).update(notifications_unread_count=unread.count())
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('talks', '0014_notification_coalesce_first_event'),
+        ('core', '0006_user_notifications_unread_count'),
+        migrations.swappable_dependency(settings.AUTH_USER_MODEL),
+    ]
+
+    operations = [
+        migrations.RunPython(backfill_unread_count, migrations.RunPython.noop),
+    ]
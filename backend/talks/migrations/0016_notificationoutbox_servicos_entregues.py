@@ -0,0 +1,18 @@
+# Generated by Django 6.0 on 2026-10-17 04:10
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('talks', '0015_backfill_notifications_unread_count'),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name='notificationoutbox',
+            name='servicos_entregues',
+            field=models.JSONField(blank=True, default=list, help_text='Serviços que já entregaram o item; as novas tentativas os pulam'),
+        ),
+    ]
@@ -1,6 +1,7 @@
 from talks.models.comment import Comment
 from talks.models.idea import Idea
 from talks.models.notification import Notification
+from talks.models.notification_outbox import NotificationOutbox
 from talks.models.retro import Retro
 from talks.models.retro_item import RetroItem
 from talks.models.retro_template import RetroTemplate
@@ -13,6 +14,7 @@ __all__ = [
     "Idea",
     "Comment",
     "Notification",
+    "NotificationOutbox",
     "Retro",
     "RetroItem",
     "RetroTemplate",
@@ -1,5 +1,86 @@
 from django.conf import settings
-from django.db import models
+from django.db import models, transaction
+from django.db.models import Count, F, OuterRef, Subquery, Window
+from django.db.models.functions import Coalesce, RowNumber
+
+PATH_STEP = 10
+
+
+def build_path(parent_path, pk):
+    """
+    Caminho materializado: IDs dos ancestrais e do próprio comentário com
+    largura fixa (ex: ``0000000001/0000000007/``), para que a ordem
+    lexicográfica seja a ordem da árvore.
+    """
+    return f"{parent_path}{pk:0{PATH_STEP}d}/"
+
+
+def reply_count_subquery():
+    """
+    Subquery com o total de respostas diretas do comentário externo.
+    """
+    replies = (
+        Comment.objects.filter(parent=OuterRef("pk"))
+        .order_by()
+        .values("parent")
+        .annotate(total=Count("id"))
+        .values("total")
+    )
+    return Coalesce(Subquery(replies), 0)
+
+
+class CommentQuerySet(models.QuerySet):
+    def subtree(self, comment, include_self=True):
+        """
+        Comentário e todos os seus descendentes, em ordem de árvore, com uma
+        única busca por faixa no índice de ``path``.
+        """
+        queryset = self.filter(path__startswith=comment.path)
+        if not include_self:
+            queryset = queryset.exclude(pk=comment.pk)
+        return queryset.order_by("path")
+
+    def with_reply_count(self):
+        return self.annotate(reply_count=reply_count_subquery())
+
+    def first_replies(self, limit):
+        """
+        As ``limit`` primeiras respostas (em ordem cronológica) de cada
+        comentário pai, em uma única query com ``ROW_NUMBER()``.
+        """
+        return (
+            self.filter(parent__isnull=False)
+            .annotate(
+                posicao_na_thread=Window(
+                    RowNumber(),
+                    partition_by=[F("parent_id")],
+                    order_by=[F("created_at").asc(), F("id").asc()],
+                )
+            )
+            .filter(posicao_na_thread__lte=limit)
+            .order_by("parent_id", "created_at", "id")
+        )
+
+    def as_tree(self):
+        """
+        Carrega os comentários com seus usuários em uma única query e monta
+        a árvore de respostas em memória.
+
+        Retorna os comentários raiz; cada comentário recebe
+        ``respostas_carregadas`` com suas respostas em ordem cronológica.
+        """
+        comments = list(self.select_related("user").order_by("created_at", "id"))
+        by_id = {comment.pk: comment for comment in comments}
+
+        roots = []
+        for comment in comments:
+            comment.respostas_carregadas = []
+        for comment in comments:
+            if comment.parent_id is None:
+                roots.append(comment)
+            elif comment.parent_id in by_id:
+                by_id[comment.parent_id].respostas_carregadas.append(comment)
+        return roots
 
 
 class Comment(models.Model):
@@ -18,16 +99,64 @@ class Comment(models.Model):
         null=True,
         help_text="Comentário pai (para respostas)",
     )
+    path = models.CharField(
+        max_length=255,
+        blank=True,
+        default="",
+        editable=False,
+        help_text="Caminho materializado (IDs dos ancestrais e do próprio comentário)",
+    )
+    depth = models.PositiveSmallIntegerField(
+        default=0,
+        editable=False,
+        help_text="Nível na árvore (0 = comentário raiz)",
+    )
     created_at = models.DateTimeField(auto_now_add=True)
     updated_at = models.DateTimeField(auto_now=True)
 
+    objects = CommentQuerySet.as_manager()
+
+    # Profundidade máxima de uma resposta (raiz = 0)
+    MAX_DEPTH = 8
+
     class Meta:
         verbose_name = "Comentário"
         verbose_name_plural = "Comentários"
         ordering = ["created_at"]
         indexes = [
             models.Index(fields=["idea", "created_at"]),
+            models.Index(fields=["idea", "path"]),
+            # LIKE 'prefixo%' usa o índice no Postgres (ignorado nos demais)
+            models.Index(
+                fields=["path"],
+                name="talks_comment_path_like",
+                opclasses=["varchar_pattern_ops"],
+            ),
         ]
 
     def __str__(self):
         return f'{self.user.username} comentou em "{self.idea.titulo}"'
+
+    def save(self, *args, **kwargs):
+        if not self._state.adding or self.path:
+            return super().save(*args, **kwargs)
+
+        # O path depende do pk: insere e grava o path na mesma transação
+        parent_path = ""
+        if self.parent_id is not None:
+            parent_path = self.parent.path
+            self.depth = self.parent.depth + 1
+
+        with transaction.atomic(using=kwargs.get("using")):
+            super().save(*args, **kwargs)
+            self.path = build_path(parent_path, self.pk)
+            Comment.objects.filter(pk=self.pk).update(path=self.path)
+
+    def delete(self, *args, **kwargs):
+        """
+        Remove o comentário com toda a sub-árvore a partir de uma única busca
+        por ``path`` (em vez de percorrer as respostas nível a nível).
+        """
+        if not self.path:
+            return super().delete(*args, **kwargs)
+        return Comment.objects.subtree(self).delete()
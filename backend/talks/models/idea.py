@@ -1,12 +1,61 @@
 from typing import TYPE_CHECKING
 
 from django.conf import settings
-from django.contrib.auth import get_user_model
 from django.core.validators import FileExtensionValidator
-from django.db import models
-from django.db.models import Case, Count, DecimalField, F, Q, When
+from django.db import models, transaction
+from django.db.models import (
+    Case,
+    Count,
+    DecimalField,
+    F,
+    Max,
+    OuterRef,
+    Prefetch,
+    Subquery,
+    When,
+)
+from django.db.models.functions import Coalesce
 from django.utils import timezone
 
+from talks.search.document import build_search_document
+from talks.services.population_stats import PopulationStatsService
+
+
+def active_vote_count_subquery():
+    """
+    Subquery com o total de votos de usuários ativos da ideia externa.
+
+    Usada apenas para reconstruir o contador persistido ``Idea.vote_count``.
+    """
+    from talks.models.vote import Vote
+
+    active_votes = (
+        Vote.objects.filter(idea=OuterRef("pk"), user__is_active=True)
+        .order_by()
+        .values("idea")
+        .annotate(total=Count("id"))
+        .values("total")
+    )
+    return Coalesce(Subquery(active_votes), 0)
+
+
+def comment_stats_subqueries():
+    """
+    Subqueries com o total de comentários e a data do último comentário da
+    ideia externa (para reconstruir ``comment_count``/``last_comment_at``).
+    """
+    from talks.models.comment import Comment
+
+    comments = Comment.objects.filter(idea=OuterRef("pk")).order_by().values("idea")
+    return {
+        "comment_count": Coalesce(
+            Subquery(comments.annotate(total=Count("id")).values("total")), 0
+        ),
+        "last_comment_at": Subquery(
+            comments.annotate(ultimo=Max("created_at")).values("ultimo")
+        ),
+    }
+
 
 class IdeaQuerySet(models.QuerySet):
 
@@ -14,53 +63,122 @@ class IdeaQuerySet(models.QuerySet):
         """
         Anota o queryset com estatísticas de votos otimizadas.
 
+        O total de votos vem do contador persistido ``vote_count``, então
+        nenhuma junção com ``Vote``/``User`` é necessária.
+
         Adiciona:
-        - vote_count_annotated: Total de votos (apenas usuários ativos)
         - vote_percentage_decimal: Porcentagem de votos em decimal (0-100)
         """
-        User = get_user_model()
-        total_active_users = User.objects.filter(is_active=True).count()
+        total_active_users = PopulationStatsService.active_user_count()
 
         if total_active_users == 0:
-            return self.annotate(
-                vote_count_annotated=Count(
-                    "votos",
-                    filter=Q(votos__user__is_active=True),
-                    distinct=True,
-                ),
-                vote_percentage_decimal=0.0,
-            )
+            return self.annotate(vote_percentage_decimal=0.0)
 
         return self.annotate(
-            vote_count_annotated=Count(
-                "votos",
-                filter=Q(votos__user__is_active=True),
-                distinct=True,
-            ),
             vote_percentage_decimal=Case(
                 When(
-                    vote_count_annotated__gt=0,
-                    then=F("vote_count_annotated") * 100.0 / total_active_users,
+                    vote_count__gt=0,
+                    then=F("vote_count") * 100.0 / total_active_users,
                 ),
                 default=0.0,
                 output_field=DecimalField(max_digits=5, decimal_places=2),
             ),
         )
 
+    def refresh_vote_count(self):
+        """
+        Recalcula ``vote_count`` a partir da tabela de votos.
+
+        Retorna o número de ideias atualizadas.
+        """
+        return self.update(vote_count=active_vote_count_subquery())
+
+    def refresh_comment_stats(self):
+        """
+        Recalcula ``comment_count`` e ``last_comment_at`` a partir da tabela de
+        comentários.
+
+        Retorna o número de ideias atualizadas.
+        """
+        return self.update(**comment_stats_subqueries())
+
     def optimized(self):
-        return self.select_related("autor", "apresentador").prefetch_related(
-            "tags", "votos"
-        )
+        return self.select_related("autor", "apresentador").prefetch_related("tags")
+
+    def for_fields(self, fields=None):
+        """
+        Carrega apenas o necessário para os campos de serializer informados.
+
+        ``fields=None`` carrega tudo (equivalente ao serializer de detalhe).
+        Relações só entram em select_related/prefetch_related se pedidas, e
+        as colunas de texto longas ficam em ``defer()`` quando não usadas.
+        """
+        if fields is None:
+            fields = {
+                "autor",
+                "apresentador",
+                "tags",
+                "votos_resumo",
+                "vote_percentage",
+                "descricao",
+                "conteudo",
+            }
+        fields = set(fields)
+        queryset = self
+
+        related = [name for name in ("autor", "apresentador") if name in fields]
+        if related:
+            queryset = queryset.select_related(*related)
+
+        if "tags" in fields:
+            queryset = queryset.prefetch_related("tags")
+
+        if "votos" in fields:
+            from talks.models.vote import Vote
+
+            queryset = queryset.prefetch_related(
+                Prefetch("votos", queryset=Vote.objects.select_related("user"))
+            )
+
+        if "votos_resumo" in fields:
+            from talks.models.vote import ROSTER_PREVIEW_SIZE, Vote
+
+            # Prefetch fatiado: só os primeiros votantes de cada ideia
+            queryset = queryset.prefetch_related(
+                Prefetch(
+                    "votos",
+                    queryset=Vote.objects.roster()[:ROSTER_PREVIEW_SIZE],
+                    to_attr="votos_recentes",
+                )
+            )
+
+        if "vote_percentage" in fields:
+            queryset = queryset.with_vote_stats()
+
+        deferred = [name for name in ("descricao", "conteudo") if name not in fields]
+        return queryset.defer("search_document", *deferred)
 
 
 class IdeaManager(models.Manager):
 
     def get_queryset(self):
-        return IdeaQuerySet(self.model, using=self._db).optimized()
+        return IdeaQuerySet(self.model, using=self._db)
+
+    def optimized(self):
+        return self.get_queryset().optimized()
+
+    def for_fields(self, fields=None):
+        return self.get_queryset().for_fields(fields)
 
     def with_vote_stats(self):
         return self.get_queryset().with_vote_stats()
 
+    def refresh_vote_count(self):
+        return self.get_queryset().refresh_vote_count()
+
+    def refresh_comment_stats(self):
+        return self.get_queryset().refresh_comment_stats()
+
 
 class Idea(models.Model):
 
@@ -104,6 +222,28 @@ class Idea(models.Model):
     data_agendada = models.DateTimeField(
         blank=True, null=True, help_text="Data e hora da apresentação"
     )
+    vote_count = models.PositiveIntegerField(
+        default=0,
+        editable=False,
+        help_text="Total de votos de usuários ativos (mantido por toggle_vote)",
+    )
+    comment_count = models.PositiveIntegerField(
+        default=0,
+        editable=False,
+        help_text="Total de comentários (mantido pelos signals de comentário)",
+    )
+    last_comment_at = models.DateTimeField(
+        blank=True,
+        null=True,
+        editable=False,
+        help_text="Data do comentário mais recente",
+    )
+    search_document = models.TextField(
+        blank=True,
+        default="",
+        editable=False,
+        help_text="Título, descrição e conteúdo em texto puro (índice de busca)",
+    )
     created_at = models.DateTimeField(auto_now_add=True)
     updated_at = models.DateTimeField(auto_now=True)
 
@@ -116,13 +256,26 @@ class Idea(models.Model):
         indexes = [
             models.Index(fields=["-created_at"]),
             models.Index(fields=["data_agendada"]),
+            models.Index(fields=["-vote_count", "-created_at"]),
+            models.Index(fields=["-comment_count", "-created_at"]),
         ]
 
     def __str__(self):
         return self.titulo
 
+    SEARCH_SOURCE_FIELDS = {"titulo", "descricao", "conteudo"}
+
+    def save(self, *args, **kwargs):
+        update_fields = kwargs.get("update_fields")
+        if update_fields is None or self.SEARCH_SOURCE_FIELDS & set(update_fields):
+            self.search_document = build_search_document(
+                self.titulo, self.descricao, self.conteudo
+            )
+            if update_fields is not None:
+                kwargs["update_fields"] = {*update_fields, "search_document"}
+        super().save(*args, **kwargs)
+
     if TYPE_CHECKING:
-        vote_count_annotated: int
         vote_percentage_decimal: float
 
     @property
@@ -144,10 +297,37 @@ class Idea(models.Model):
 
         return "concluido"
 
-    @property
-    def vote_count(self):
-        return self.votos.count()
-
     @property
     def precisa_apresentador(self):
-        return self.apresentador is None
+        return self.apresentador_id is None
+
+    def toggle_vote(self, user):
+        """
+        Adiciona ou remove o voto do usuário e atualiza ``vote_count`` na
+        mesma transação.
+
+        Retorna True se o voto foi registrado e False se foi removido.
+        """
+        from talks.models.vote import Vote
+
+        with transaction.atomic():
+            # Trava a linha da ideia: cliques concorrentes (duplo clique)
+            # passam um após o outro e só quem de fato mudou o voto aplica delta
+            Idea.objects.select_for_update().only("pk").get(pk=self.pk)
+
+            _, deleted = Vote.objects.filter(user=user, idea=self).delete()
+            removed = deleted.get(Vote._meta.label, 0)
+            if removed:
+                created, delta = False, -removed
+            else:
+                _, created = Vote.objects.get_or_create(user=user, idea=self)
+                delta = 1 if created else 0
+
+            if user.is_active and delta:
+                Idea.objects.filter(pk=self.pk).update(
+                    vote_count=F("vote_count") + delta
+                )
+
+            self.refresh_from_db(fields=["vote_count"])
+
+        return created
@@ -1,5 +1,25 @@
 from django.conf import settings
 from django.db import models
+from django.db.models import Q
+from django.utils import timezone
+
+
+class NotificationQuerySet(models.QuerySet):
+    def unread(self, last_read_at=None):
+        """
+        Não lidas: ``lido=False`` e criadas depois da marca d'água do usuário
+        (``User.notifications_last_read_at``, movida por "marcar todas como
+        lidas").
+        """
+        queryset = self.filter(lido=False)
+        if last_read_at is not None:
+            queryset = queryset.filter(created_at__gt=last_read_at)
+        return queryset
+
+    def read(self, last_read_at=None):
+        if last_read_at is None:
+            return self.filter(lido=True)
+        return self.filter(Q(lido=True) | Q(created_at__lte=last_read_at))
 
 
 class Notification(models.Model):
@@ -25,16 +45,54 @@ class Notification(models.Model):
         null=True,
     )
     lido = models.BooleanField(default=False)
+    contagem = models.PositiveIntegerField(
+        default=1, help_text="Eventos agrupados nesta notificação"
+    )
+    atores = models.JSONField(
+        default=list,
+        blank=True,
+        help_text="Autores mais recentes dos eventos agrupados ({id, username})",
+    )
+    atores_ids = models.JSONField(
+        default=list,
+        blank=True,
+        help_text="IDs distintos de todos os autores dos eventos agrupados",
+    )
+    primeiro_evento_em = models.DateTimeField(
+        default=timezone.now,
+        help_text="Primeiro evento agrupado; a janela de agrupamento conta daqui",
+    )
     created_at = models.DateTimeField(auto_now_add=True)
 
+    objects = NotificationQuerySet.as_manager()
+
     class Meta:
         verbose_name = "Notificação"
         verbose_name_plural = "Notificações"
-        ordering = ["-created_at"]
+        ordering = ["-created_at", "-id"]
         indexes = [
-            models.Index(fields=["user", "lido"]),
-            models.Index(fields=["-created_at"]),
+            # Caixa de entrada: notificações do usuário, mais recentes primeiro
+            models.Index(
+                fields=["user", "-created_at", "-id"],
+                name="talks_notif_user_recent_idx",
+            ),
+            # Não lidas (filtro lido=false e COUNT do badge); parcial, só
+            # cresce com o que ainda não foi lido
+            models.Index(
+                fields=["user", "-created_at", "-id"],
+                condition=Q(lido=False),
+                name="talks_notif_user_unread_idx",
+            ),
+            # Expurgo por política de retenção (purge_notifications)
+            models.Index(fields=["tipo", "created_at"]),
+            # Agrupamento: notificação da mesma ideia/tipo aberta na janela
+            models.Index(fields=["idea", "tipo", "-primeiro_evento_em"]),
         ]
 
     def __str__(self):
         return f"{self.tipo} para {self.user.username}"
+
+    def is_read(self, last_read_at=None) -> bool:
+        return self.lido or (
+            last_read_at is not None and self.created_at <= last_read_at
+        )
@@ -0,0 +1,70 @@
+from django.conf import settings
+from django.db import models
+from django.utils import timezone
+
+from talks.models.notification import Notification
+
+
+class NotificationOutbox(models.Model):
+    """
+    Notificação pendente de entrega (outbox transacional).
+
+    Os handlers de sinais apenas gravam aqui; a entrega pelos serviços do
+    ``NotificationDispatcher`` é feita pelo worker
+    ``manage.py process_notification_outbox``.
+    """
+
+    STATUS_CHOICES = [
+        ("pendente", "Pendente"),
+        ("enviado", "Enviado"),
+        ("falhou", "Falhou"),
+    ]
+
+    recipient = models.ForeignKey(
+        settings.AUTH_USER_MODEL,
+        on_delete=models.CASCADE,
+        related_name="notificacoes_pendentes",
+    )
+    actor = models.ForeignKey(
+        settings.AUTH_USER_MODEL,
+        on_delete=models.SET_NULL,
+        related_name="+",
+        blank=True,
+        null=True,
+    )
+    tipo = models.CharField(max_length=20, choices=Notification.TIPO_CHOICES)
+    mensagem = models.TextField()
+    idea = models.ForeignKey(
+        "talks.Idea",
+        on_delete=models.CASCADE,
+        related_name="+",
+        blank=True,
+        null=True,
+    )
+    metadata = models.JSONField(default=dict, blank=True)
+
+    status = models.CharField(max_length=10, choices=STATUS_CHOICES, default="pendente")
+    tentativas = models.PositiveSmallIntegerField(default=0)
+    disponivel_em = models.DateTimeField(
+        default=timezone.now,
+        help_text="Próxima tentativa de entrega (backoff exponencial)",
+    )
+    ultimo_erro = models.TextField(blank=True)
+    servicos_entregues = models.JSONField(
+        default=list,
+        blank=True,
+        help_text="Serviços que já entregaram o item; as novas tentativas os pulam",
+    )
+    created_at = models.DateTimeField(auto_now_add=True)
+    enviado_em = models.DateTimeField(null=True, blank=True)
+
+    class Meta:
+        verbose_name = "Notificação na Fila"
+        verbose_name_plural = "Fila de Notificações"
+        ordering = ["id"]
+        indexes = [
+            models.Index(fields=["status", "disponivel_em"]),
+        ]
+
+    def __str__(self):
+        return f"{self.tipo} para {self.recipient_id} ({self.status})"
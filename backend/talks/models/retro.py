@@ -1,7 +1,20 @@
 from django.db import models
+from django.db.models import Count, OuterRef, Prefetch, Subquery, Sum
+from django.db.models.functions import Coalesce
 from django.utils import timezone
 from core.models import User
 
+# Ideias recentes do autor na listagem (mesmo recorte do UserProfileSerializer)
+AUTHOR_IDEAS_PREVIEW = 5
+
+
+def count_subquery(queryset):
+    """Subquery com o total de linhas de ``queryset`` (correlacionado por OuterRef)."""
+    return Coalesce(
+        Subquery(queryset.order_by().annotate(total=Count("id")).values("total")),
+        0,
+    )
+
 
 class RetroStatus(models.TextChoices):
     RASCUNHO = "rascunho", "Rascunho"
@@ -9,6 +22,72 @@ class RetroStatus(models.TextChoices):
     CONCLUIDA = "concluida", "Concluída"
 
 
+class RetroQuerySet(models.QuerySet):
+    def with_totals(self):
+        """
+        Anota ``items_count``, ``participantes_count`` e ``votos_count`` com
+        subqueries correlacionadas (sem join nas tabelas de itens, votos e
+        participantes, que multiplicariam as linhas). ``votos_count`` soma o
+        contador persistido ``RetroItem.vote_count``.
+        """
+        from talks.models.retro_item import RetroItem
+
+        items = (
+            RetroItem.objects.filter(retro=OuterRef("pk")).order_by().values("retro")
+        )
+        participantes = (
+            Retro.participantes.through.objects.filter(retro=OuterRef("pk"))
+            .order_by()
+            .values("retro")
+        )
+        return self.annotate(
+            items_count=Coalesce(
+                Subquery(items.annotate(total=Count("id")).values("total")), 0
+            ),
+            votos_count=Coalesce(
+                Subquery(items.annotate(total=Sum("vote_count")).values("total")), 0
+            ),
+            participantes_count=Coalesce(
+                Subquery(participantes.annotate(total=Count("id")).values("total")),
+                0,
+            ),
+        )
+
+    def with_author_profile(self):
+        """
+        Carrega o autor com tudo o que o perfil dele exibe na listagem:
+        contadores anotados (``ideias_criadas_total``, ``apresentacoes_total``,
+        ``votos_total``) e as ideias recentes em prefetches fatiados
+        (``ideias_criadas_recentes``, ``ideias_apresentando_recentes``). O
+        número de queries não depende de quantas retros ou autores há na
+        página.
+        """
+        from talks.models.idea import Idea
+        from talks.models.vote import Vote
+
+        def recent(field):
+            return Prefetch(
+                field,
+                queryset=Idea.objects.optimized().order_by("-created_at")[
+                    :AUTHOR_IDEAS_PREVIEW
+                ],
+                to_attr=f"{field}_recentes",
+            )
+
+        authors = User.objects.annotate(
+            ideias_criadas_total=count_subquery(
+                Idea.objects.filter(autor=OuterRef("pk")).values("autor")
+            ),
+            apresentacoes_total=count_subquery(
+                Idea.objects.filter(apresentador=OuterRef("pk")).values("apresentador")
+            ),
+            votos_total=count_subquery(
+                Vote.objects.filter(user=OuterRef("pk")).values("user")
+            ),
+        ).prefetch_related(recent("ideias_criadas"), recent("ideias_apresentando"))
+        return self.prefetch_related(Prefetch("autor", queryset=authors))
+
+
 class Retro(models.Model):
     titulo = models.CharField(
         max_length=200, help_text="Título da retrospectiva (ex: 'Retro Sprint 15')"
@@ -53,6 +132,8 @@ class Retro(models.Model):
     created_at = models.DateTimeField(auto_now_add=True)
     updated_at = models.DateTimeField(auto_now=True)
 
+    objects = RetroQuerySet.as_manager()
+
     class Meta:
         ordering = ["-data", "-created_at"]
         verbose_name = "Retrospectiva"
@@ -68,12 +149,18 @@ class Retro(models.Model):
 
     @property
     def total_items(self):
+        if hasattr(self, "items_count"):
+            return self.items_count
         return self.items.count()
 
     @property
     def total_participantes(self):
+        if hasattr(self, "participantes_count"):
+            return self.participantes_count
         return self.participantes.count()
 
     @property
     def total_votos(self):
+        if hasattr(self, "votos_count"):
+            return self.votos_count
         return sum(item.vote_count for item in self.items.all())
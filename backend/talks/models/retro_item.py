@@ -1,11 +1,34 @@
 from core.models import User
-from django.db import models
-from django.db.models import Count
+from django.db import models, transaction
+from django.db.models import Count, F, OuterRef, Subquery
+from django.db.models.functions import Coalesce
+
+
+def vote_count_subquery():
+    """
+    Subquery com o total de votos do item externo (tabela M2M ``votes``).
+
+    Usada apenas para reconstruir o contador persistido ``RetroItem.vote_count``
+    (reparo e exclusão de usuários); ``toggle_vote`` aplica deltas.
+    """
+    votes = (
+        RetroItem.votes.through.objects.filter(retroitem=OuterRef("pk"))
+        .order_by()
+        .values("retroitem")
+        .annotate(total=Count("id"))
+        .values("total")
+    )
+    return Coalesce(Subquery(votes), 0)
+
 
+class RetroItemQuerySet(models.QuerySet):
+    def refresh_vote_count(self):
+        """
+        Recalcula ``vote_count`` a partir da tabela de votos.
 
-class RetroItemManager(models.Manager):
-    def with_vote_stats(self):
-        return self.annotate(vote_count=Count("votes", distinct=True))
+        Retorna o número de itens atualizados.
+        """
+        return self.update(vote_count=vote_count_subquery())
 
 
 class RetroItem(models.Model):
@@ -41,17 +64,26 @@ class RetroItem(models.Model):
         default=0, help_text="Ordem de exibição dentro da categoria"
     )
 
+    vote_count = models.PositiveIntegerField(
+        default=0,
+        editable=False,
+        help_text="Total de votos (mantido por toggle_vote)",
+    )
+
     created_at = models.DateTimeField(auto_now_add=True)
     updated_at = models.DateTimeField(auto_now=True)
 
-    objects = RetroItemManager()
+    objects = RetroItemQuerySet.as_manager()
 
     class Meta:
-        ordering = ["categoria", "-votes__id", "ordem", "-created_at"]
+        ordering = ["categoria", "-vote_count", "ordem", "-created_at"]
         verbose_name = "Item de Retrospectiva"
         verbose_name_plural = "Itens de Retrospectiva"
         indexes = [
-            models.Index(fields=["retro", "categoria"]),
+            # Board: itens da retro por categoria, mais votados primeiro
+            models.Index(
+                fields=["retro", "categoria", "-vote_count", "ordem", "-created_at"]
+            ),
             models.Index(fields=["autor"]),
         ]
 
@@ -61,19 +93,36 @@ class RetroItem(models.Model):
             preview += "..."
         return f"[{self.categoria}] {preview}"
 
-    @property
-    def vote_count(self):
-        return self.votes.count()
-
     def has_voted(self, user):
-        return (
-            self.votes.filter(id=user.id).exists() if user.is_authenticated else False
-        )
+        if not user.is_authenticated:
+            return False
+        # Board do retrieve: votos já vêm no prefetch
+        if "votes" in getattr(self, "_prefetched_objects_cache", {}):
+            return any(voter.pk == user.pk for voter in self.votes.all())
+        return self.votes.filter(id=user.id).exists()
 
     def toggle_vote(self, user):
-        if self.has_voted(user):
-            self.votes.remove(user)
-            return False
-        else:
-            self.votes.add(user)
-            return True
+        """
+        Adiciona ou remove o voto do usuário e atualiza ``vote_count`` na
+        mesma transação.
+
+        Retorna True se o voto foi registrado e False se foi removido.
+        """
+        with transaction.atomic():
+            # Trava a linha do item: cliques concorrentes no mesmo item leem
+            # o voto um após o outro, e o delta abaixo fica exato
+            RetroItem.objects.select_for_update().only("pk").get(pk=self.pk)
+
+            voted = not self.votes.filter(id=user.id).exists()
+            if voted:
+                self.votes.add(user)
+            else:
+                self.votes.remove(user)
+
+            delta = 1 if voted else -1
+            RetroItem.objects.filter(pk=self.pk).update(
+                vote_count=F("vote_count") + delta
+            )
+            self.refresh_from_db(fields=["vote_count"])
+
+        return voted
@@ -2,6 +2,23 @@
 from django.conf import settings
 from django.db import models
 
+# Votantes exibidos no resumo do detalhe da ideia
+ROSTER_PREVIEW_SIZE = 5
+
+
+class VoteQuerySet(models.QuerySet):
+
+    def roster(self):
+        """
+        Votos de usuários ativos com o usuário carregado, mais recentes
+        primeiro (mesmos votos contados em ``Idea.vote_count``).
+        """
+        return (
+            self.filter(user__is_active=True)
+            .select_related("user")
+            .order_by("-created_at", "-id")
+        )
+
 
 class Vote(models.Model):
 
@@ -11,6 +28,8 @@ class Vote(models.Model):
     idea = models.ForeignKey("talks.Idea", on_delete=models.CASCADE, related_name="votos")
     created_at = models.DateTimeField(auto_now_add=True)
 
+    objects = VoteQuerySet.as_manager()
+
     class Meta:
         verbose_name = "Voto"
         verbose_name_plural = "Votos"
@@ -18,6 +37,7 @@ class Vote(models.Model):
         ordering = ["-created_at"]
         indexes = [
             models.Index(fields=["user", "idea"]),
+            models.Index(fields=["idea", "-created_at"]),
         ]
 
     def __str__(self):
@@ -6,6 +6,7 @@ from .signals import (
     idea_rescheduled,
     comment_created,
 )
+from .outbox import NotificationOutboxService
 from .services.database import DatabaseNotificationService
 from .services.base import NotificationContext
 from .templates.messages import TEMPLATES
@@ -14,6 +15,14 @@ logger = logging.getLogger(__name__)
 
 
 class NotificationDispatcher:
+    """
+    Entrega a notificação em todos os serviços habilitados.
+
+    Chamado pelo worker da outbox (``process_notification_outbox``); os
+    handlers abaixo só enfileiram via ``NotificationOutboxService.enqueue``.
+    O worker entrega o lote todo com ``dispatch_many``.
+    """
+
     def __init__(self):
         self.services = [
             DatabaseNotificationService(),
@@ -22,17 +31,36 @@ class NotificationDispatcher:
         ]
 
     def dispatch(self, context: NotificationContext) -> list:
-        results = []
+        return self.dispatch_many([context])[0]
+
+    def dispatch_many(self, contexts: list, skip: list | None = None) -> list:
+        """
+        Agrupa os contextos por serviço: cada serviço recebe uma única chamada
+        ``send_many`` com todos os contextos que aceita.
+
+        ``skip`` (opcional, paralelo a ``contexts``) traz, por contexto, os
+        nomes dos serviços que já o entregaram numa tentativa anterior.
+
+        Retorna, para cada contexto, a lista de (serviço, sucesso).
+        """
+        results = [[] for _ in contexts]
+        skip = skip or [()] * len(contexts)
         for service in self.services:
-            if service.can_send(context):
-                try:
-                    success = service.send(context)
-                    results.append((service.__class__.__name__, success))
-                except Exception as e:
-                    logger.error(
-                        f"Erro no serviço {service.__class__.__name__}: {str(e)}"
-                    )
-                    results.append((service.__class__.__name__, False))
+            name = service.__class__.__name__
+            indexes = [
+                i
+                for i, context in enumerate(contexts)
+                if name not in skip[i] and service.can_send(context)
+            ]
+            if not indexes:
+                continue
+            try:
+                sent = service.send_many([contexts[i] for i in indexes])
+            except Exception as e:
+                logger.error(f"Erro no serviço {name}: {str(e)}")
+                sent = [False] * len(indexes)
+            for i, success in zip(indexes, sent):
+                results[i].append((name, success))
         return results
 
 
@@ -49,8 +77,9 @@ def handle_idea_voted(sender, idea, user, voted, **kwargs):
         notification_type="voto",
         message=message,
         idea=idea,
+        actor=user,
     )
-    dispatcher.dispatch(context)
+    NotificationOutboxService.enqueue(context)
 
 
 @receiver(volunteer_registered)
@@ -64,8 +93,9 @@ def handle_volunteer_registered(sender, idea, user, **kwargs):
         notification_type="voluntario",
         message=message,
         idea=idea,
+        actor=user,
     )
-    dispatcher.dispatch(context)
+    NotificationOutboxService.enqueue(context)
 
 
 @receiver(idea_rescheduled)
@@ -77,14 +107,17 @@ def handle_idea_rescheduled(sender, idea, user, **kwargs):
         recipients.add(idea.apresentador)
 
     message = TEMPLATES["agendamento"](user, idea)
-    for recipient in recipients:
-        context = NotificationContext(
+    contexts = [
+        NotificationContext(
             recipient=recipient,
             notification_type="agendamento",
             message=message,
             idea=idea,
+            actor=user,
         )
-        dispatcher.dispatch(context)
+        for recipient in recipients
+    ]
+    NotificationOutboxService.enqueue_many(contexts)
 
 
 @receiver(comment_created)
@@ -99,5 +132,6 @@ def handle_comment_created(sender, comment, user, **kwargs):
         message=message,
         idea=comment.idea,
         metadata={"comment_id": comment.id},
+        actor=user,
     )
-    dispatcher.dispatch(context)
+    NotificationOutboxService.enqueue(context)
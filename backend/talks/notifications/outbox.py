@@ -0,0 +1,162 @@
+import logging
+from datetime import timedelta
+
+from django.db import transaction
+from django.utils import timezone
+
+from talks.models import NotificationOutbox
+
+from .services.base import NotificationContext
+
+logger = logging.getLogger(__name__)
+
+
+class NotificationOutboxService:
+    """
+    Outbox transacional das notificações.
+
+    ``enqueue`` grava a notificação na fila só depois do commit da transação
+    que a originou (nada é gravado se ela sofrer rollback). O worker
+    ``process_notification_outbox`` chama ``process_batch``, que entrega cada
+    item pelo ``NotificationDispatcher`` e reagenda as falhas com backoff
+    exponencial até ``MAX_ATTEMPTS``; cada retentativa só passa pelos serviços
+    que ainda não entregaram o item (``servicos_entregues``).
+    """
+
+    MAX_ATTEMPTS = 5
+    BACKOFF_BASE = 30  # segundos
+    BACKOFF_MAX = 3600  # 1 hora
+    # Itens reservados por um worker ficam invisíveis aos demais por esse
+    # tempo; se o worker cair, voltam para a fila
+    LEASE = 300  # 5 minutos
+
+    @staticmethod
+    def enqueue(context: NotificationContext) -> None:
+        NotificationOutboxService.enqueue_many([context])
+
+    @staticmethod
+    def enqueue_many(contexts: list[NotificationContext]) -> None:
+        """
+        Enfileira várias notificações com um único INSERT (fan-out).
+        """
+        entries = [
+            NotificationOutbox(
+                recipient_id=context.recipient.pk,
+                actor_id=context.actor.pk if context.actor is not None else None,
+                tipo=context.notification_type,
+                mensagem=context.message,
+                idea_id=context.idea.pk if context.idea is not None else None,
+                metadata=context.metadata,
+            )
+            for context in contexts
+            if context.recipient is not None
+        ]
+        if entries:
+            transaction.on_commit(
+                lambda: NotificationOutbox.objects.bulk_create(entries)
+            )
+
+    @staticmethod
+    def backoff(tentativas: int) -> timedelta:
+        seconds = NotificationOutboxService.BACKOFF_BASE * 2 ** (tentativas - 1)
+        return timedelta(seconds=min(seconds, NotificationOutboxService.BACKOFF_MAX))
+
+    @staticmethod
+    def claim(batch_size: int) -> list:
+        """
+        Reserva até ``batch_size`` itens disponíveis (``SKIP LOCKED`` permite
+        vários workers em paralelo no Postgres).
+        """
+        now = timezone.now()
+        with transaction.atomic():
+            ids = list(
+                NotificationOutbox.objects.select_for_update(skip_locked=True)
+                .filter(status="pendente", disponivel_em__lte=now)
+                .order_by("id")
+                .values_list("id", flat=True)[:batch_size]
+            )
+            if not ids:
+                return []
+            NotificationOutbox.objects.filter(pk__in=ids).update(
+                disponivel_em=now + timedelta(seconds=NotificationOutboxService.LEASE)
+            )
+
+        return list(
+            NotificationOutbox.objects.filter(pk__in=ids)
+            .select_related("recipient", "actor", "idea")
+            .order_by("id")
+        )
+
+    @staticmethod
+    def build_context(entry: NotificationOutbox) -> NotificationContext:
+        return NotificationContext(
+            recipient=entry.recipient,
+            notification_type=entry.tipo,
+            message=entry.mensagem,
+            idea=entry.idea,
+            metadata=entry.metadata,
+            actor=entry.actor,
+        )
+
+    @staticmethod
+    def reschedule(
+        entry: NotificationOutbox, failed: list[str], succeeded: list[str], now
+    ) -> None:
+        entry.tentativas += 1
+        entry.servicos_entregues = [*entry.servicos_entregues, *succeeded]
+        entry.ultimo_erro = f"Falha em: {', '.join(failed)}"
+        if entry.tentativas >= NotificationOutboxService.MAX_ATTEMPTS:
+            entry.status = "falhou"
+            logger.error(
+                f"Notificação {entry.pk} descartada após {entry.tentativas} tentativas"
+            )
+        else:
+            entry.disponivel_em = now + NotificationOutboxService.backoff(
+                entry.tentativas
+            )
+        entry.save(
+            update_fields=[
+                "status",
+                "tentativas",
+                "ultimo_erro",
+                "disponivel_em",
+                "servicos_entregues",
+            ]
+        )
+
+    @staticmethod
+    def process_batch(batch_size: int = 100, dispatcher=None) -> tuple[int, int]:
+        """
+        Entrega um lote da fila com uma chamada ``send_many`` por serviço.
+
+        Returns:
+            tuple: (entregues, falhas)
+        """
+        if dispatcher is None:
+            from .handlers import dispatcher
+
+        entries = NotificationOutboxService.claim(batch_size)
+        if not entries:
+            return 0, 0
+
+        # Retentativas só passam pelos serviços que ainda não entregaram o
+        # item (evita notificação duplicada nos que já tiveram sucesso)
+        results = dispatcher.dispatch_many(
+            [NotificationOutboxService.build_context(entry) for entry in entries],
+            skip=[entry.servicos_entregues for entry in entries],
+        )
+
+        now = timezone.now()
+        delivered_ids = []
+        for entry, result in zip(entries, results):
+            failed = [name for name, success in result if not success]
+            if failed:
+                succeeded = [name for name, success in result if success]
+                NotificationOutboxService.reschedule(entry, failed, succeeded, now)
+            else:
+                delivered_ids.append(entry.pk)
+
+        NotificationOutbox.objects.filter(pk__in=delivered_ids).update(
+            status="enviado", enviado_em=now
+        )
+        return len(delivered_ids), len(entries) - len(delivered_ids)
@@ -0,0 +1,121 @@
+import logging
+from datetime import datetime, timedelta
+
+import orjson
+from django.conf import settings
+from django.db import transaction
+from django.utils import timezone
+
+from talks.models import Notification, NotificationOutbox
+from talks.notifications.unread_counter import UnreadCounterService
+
+logger = logging.getLogger(__name__)
+
+
+class NotificationRetentionService:
+    """
+    Política de retenção das notificações (``settings.NOTIFICATION_RETENTION_DAYS``).
+
+    O expurgo é feito em lotes pequenos, cada um na sua transação, para que
+    nenhum DELETE segure locks por muito tempo numa tabela grande. Os lotes
+    são localizados pelo índice ``(tipo, created_at)``.
+
+    Os itens já processados da outbox seguem
+    ``settings.NOTIFICATION_OUTBOX_RETENTION_DAYS`` (por status).
+    """
+
+    # Colunas gravadas no arquivo (uma linha JSON por notificação)
+    ARCHIVE_FIELDS = (
+        "id",
+        "user_id",
+        "tipo",
+        "mensagem",
+        "idea_id",
+        "lido",
+        "contagem",
+        "atores",
+        "created_at",
+    )
+
+    @staticmethod
+    def cutoffs(now: datetime | None = None) -> dict[str, datetime]:
+        """
+        Data limite de cada tipo com retenção configurada.
+        """
+        now = now or timezone.now()
+        retention = getattr(settings, "NOTIFICATION_RETENTION_DAYS", {})
+        return {tipo: now - timedelta(days=days) for tipo, days in retention.items()}
+
+    @staticmethod
+    def expired(tipo: str, cutoff: datetime):
+        return Notification.objects.filter(tipo=tipo, created_at__lt=cutoff)
+
+    @staticmethod
+    def purge_batch(tipo: str, cutoff: datetime, batch_size: int, archive=None) -> int:
+        """
+        Apaga até ``batch_size`` notificações expiradas de ``tipo``.
+
+        Se ``archive`` (arquivo binário) for informado, as linhas são gravadas
+        nele antes do DELETE.
+
+        Returns:
+            int: quantidade apagada (0 quando não há mais nada a expurgar)
+        """
+        ids = list(
+            NotificationRetentionService.expired(tipo, cutoff)
+            .order_by("created_at", "id")
+            .values_list("id", flat=True)[:batch_size]
+        )
+        if not ids:
+            return 0
+
+        with transaction.atomic():
+            batch = Notification.objects.filter(pk__in=ids)
+            if archive is not None:
+                for row in batch.values(*NotificationRetentionService.ARCHIVE_FIELDS):
+                    archive.write(orjson.dumps(row) + b"\n")
+            # Contadores ajustados em lote; o DELETE direto não carrega as
+            # instâncias nem dispara o post_delete de cada linha
+            UnreadCounterService.discount(batch)
+            deleted = batch._raw_delete(batch.db)
+
+        logger.info(f"{deleted} notificações '{tipo}' expurgadas")
+        return deleted
+
+    @staticmethod
+    def outbox_cutoffs(now: datetime | None = None) -> dict[str, datetime]:
+        """
+        Data limite de cada status da outbox com retenção configurada
+        (``pendente`` nunca expira).
+        """
+        now = now or timezone.now()
+        retention = getattr(settings, "NOTIFICATION_OUTBOX_RETENTION_DAYS", {})
+        return {
+            status: now - timedelta(days=days)
+            for status, days in retention.items()
+            if status != "pendente"
+        }
+
+    @staticmethod
+    def expired_outbox(status: str, cutoff: datetime):
+        return NotificationOutbox.objects.filter(status=status, created_at__lt=cutoff)
+
+    @staticmethod
+    def purge_outbox_batch(status: str, cutoff: datetime, batch_size: int) -> int:
+        """
+        Apaga até ``batch_size`` itens da outbox com ``status`` expirados.
+
+        Returns:
+            int: quantidade apagada (0 quando não há mais nada a expurgar)
+        """
+        ids = list(
+            NotificationRetentionService.expired_outbox(status, cutoff)
+            .order_by("id")
+            .values_list("id", flat=True)[:batch_size]
+        )
+        if not ids:
+            return 0
+
+        deleted, _ = NotificationOutbox.objects.filter(pk__in=ids).delete()
+        logger.info(f"{deleted} itens '{status}' expurgados da outbox")
+        return deleted
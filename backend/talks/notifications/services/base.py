@@ -1,6 +1,6 @@
 from abc import ABC, abstractmethod
 from dataclasses import dataclass, field
-from typing import Any, Dict, Optional
+from typing import Any, Dict, List, Optional
 
 
 @dataclass
@@ -10,6 +10,7 @@ class NotificationContext:
     message: str
     idea: Optional[Any] = None
     comment: Optional[Any] = None
+    actor: Optional[Any] = None
     metadata: Dict[str, Any] = field(default_factory=dict)
 
 
@@ -21,3 +22,13 @@ class AbstractNotificationService(ABC):
     @abstractmethod
     def can_send(self, context: NotificationContext) -> bool:
         pass
+
+    def send_many(self, contexts: List[NotificationContext]) -> List[bool]:
+        """
+        Envia um lote; retorna o resultado de cada contexto, na mesma ordem.
+
+        O padrão envia um a um. Serviços que suportam envio em lote (ex:
+        ``bulk_create``, APIs de push com múltiplos destinatários) devem
+        sobrescrever.
+        """
+        return [self.send(context) for context in contexts]
@@ -1,30 +1,209 @@
 import logging
+from collections import Counter
+from datetime import timedelta
+from functools import reduce
+from operator import or_
+from typing import Dict, List, Tuple
+
+from django.conf import settings
+from django.db import transaction
+from django.db.models import Q
+from django.utils import timezone
+
 from talks.models import Notification
+from talks.serializers import NotificationSerializer
 from .base import AbstractNotificationService, NotificationContext
+from ..stream import get_stream_backend
+from ..templates.messages import COALESCED_TEMPLATES
+from ..unread_counter import UnreadCounterService
 
 logger = logging.getLogger(__name__)
 
+# (user_id, tipo, idea_id)
+CoalesceKey = Tuple[int, str, int]
+
 
 class DatabaseNotificationService(AbstractNotificationService):
+    """
+    Grava as notificações na tabela ``Notification`` (um INSERT por lote).
+
+    Eventos de tipos em ``settings.NOTIFICATION_COALESCE_WINDOWS`` são
+    agrupados: se o usuário já tem uma notificação do mesmo tipo na mesma
+    ideia dentro da janela, ela é atualizada (``contagem``, ``atores``,
+    mensagem) e volta ao topo como não lida, em vez de gerar outra linha.
+
+    Depois do commit, cada notificação gravada é publicada no stream SSE do
+    destinatário (``talks.notifications.stream``).
+    """
+
+    notification_fields = {
+        field.attname for field in Notification._meta.concrete_fields
+    }
+    max_atores = 3
+
+    def build(self, context: NotificationContext) -> Notification:
+        # metadata pode trazer chaves de outros canais (ex: comment_id)
+        extra = {
+            name: value
+            for name, value in context.metadata.items()
+            if name in self.notification_fields
+        }
+        return Notification(
+            user=context.recipient,
+            tipo=context.notification_type,
+            mensagem=context.message,
+            idea=context.idea,
+            **extra,
+        )
+
     def send(self, context: NotificationContext) -> bool:
+        return self.send_many([context])[0]
+
+    def send_many(self, contexts: List[NotificationContext]) -> List[bool]:
         try:
-            Notification.objects.create(
-                user=context.recipient,
-                tipo=context.notification_type,
-                mensagem=context.message,
-                idea=context.idea,
-                **context.metadata,
+            with transaction.atomic():
+                notifications, unread = self.save_batch(contexts)
+                # Contador no mesmo commit das notificações
+                UnreadCounterService.incr_many(unread)
+                transaction.on_commit(lambda: self.publish(notifications))
+            logger.info(f"{len(contexts)} notificações gravadas")
+            return [True] * len(contexts)
+        except Exception as e:
+            logger.error(f"Erro ao gravar {len(contexts)} notificações: {str(e)}")
+            return [False] * len(contexts)
+
+    def save_batch(
+        self, contexts: List[NotificationContext]
+    ) -> Tuple[List[Notification], Counter]:
+        """
+        Grava o lote e retorna as notificações gravadas e, por usuário, quantas
+        passaram a ser não lidas (novas ou agrupadas numa notificação já lida).
+        """
+        windows = getattr(settings, "NOTIFICATION_COALESCE_WINDOWS", {})
+
+        created = []
+        groups: Dict[CoalesceKey, List[NotificationContext]] = {}
+        for context in contexts:
+            if (
+                context.notification_type in windows
+                and context.idea is not None
+                and context.actor is not None
+            ):
+                key = (
+                    context.recipient.pk,
+                    context.notification_type,
+                    context.idea.pk,
+                )
+                groups.setdefault(key, []).append(context)
+            else:
+                created.append(self.build(context))
+
+        updated = []
+        unread = Counter()
+        if groups:
+            now = timezone.now()
+            existing = self.find_coalescable(groups, windows, now)
+            for key, group in groups.items():
+                notification = existing.get(key)
+                if notification is None:
+                    notification = self.build(group[0])
+                    notification.contagem = 0
+                    created.append(notification)
+                else:
+                    # Lida (flag ou marca d'água do destinatário) volta a ser não lida
+                    last_read_at = group[0].recipient.notifications_last_read_at
+                    if notification.is_read(last_read_at):
+                        unread[notification.user_id] += 1
+                    notification.created_at = now
+                    notification.idea = group[-1].idea
+                    updated.append(notification)
+                self.fold(notification, group)
+
+        Notification.objects.bulk_create(created)
+        if updated:
+            Notification.objects.bulk_update(
+                updated,
+                ["contagem", "atores", "atores_ids", "mensagem", "lido", "created_at"],
             )
-            logger.info(
-                f"Notificação criada: {context.notification_type} para {context.recipient.username}"
+
+        unread.update(notification.user_id for notification in created)
+        return created + updated, unread
+
+    def publish(self, notifications: List[Notification]) -> None:
+        # O contador não vai no evento: o stream lê o valor atual ao
+        # encaminhar, já que um mark_read pode acontecer nesse meio tempo
+        backend = get_stream_backend()
+        for notification in notifications:
+            event = {"notification": NotificationSerializer(notification).data}
+            try:
+                backend.publish(notification.user_id, event)
+            except Exception as e:
+                # O stream é best-effort: a notificação já está gravada
+                logger.error(f"Erro ao publicar notificação no stream: {str(e)}")
+
+    def find_coalescable(self, groups, windows, now) -> Dict[CoalesceKey, Notification]:
+        """
+        Notificações mais recentes, dentro da janela, para cada chave (uma
+        única query para o lote inteiro).
+        """
+        conditions = []
+        for tipo in {tipo for _, tipo, _ in groups}:
+            keys = [key for key in groups if key[1] == tipo]
+            conditions.append(
+                Q(
+                    tipo=tipo,
+                    # A janela conta do primeiro evento: agrupar de novo
+                    # renova created_at, mas não estende a janela
+                    primeiro_evento_em__gte=now - timedelta(seconds=windows[tipo]),
+                    user_id__in={user_id for user_id, _, _ in keys},
+                    idea_id__in={idea_id for _, _, idea_id in keys},
+                )
             )
-            return True
-        except Exception as e:
-            logger.error(
-                f"Erro ao criar notificação: {context.notification_type} "
-                f"para {context.recipient.username}: {str(e)}"
+
+        existing = {}
+        queryset = (
+            Notification.objects.select_for_update()
+            .filter(reduce(or_, conditions))
+            .order_by("created_at", "id")
+        )
+        for notification in queryset:
+            key = (notification.user_id, notification.tipo, notification.idea_id)
+            if key in groups:
+                existing[key] = notification
+        return existing
+
+    def fold(self, notification: Notification, group: List[NotificationContext]):
+        """
+        Acrescenta os eventos de ``group`` (em ordem cronológica) à notificação.
+        """
+        atores = [
+            {"id": context.actor.pk, "username": context.actor.username}
+            for context in reversed(group)
+        ] + list(notification.atores)
+        unicos = []
+        for ator in atores:
+            if all(ator["id"] != visto["id"] for visto in unicos):
+                unicos.append(ator)
+
+        atores_ids = list(notification.atores_ids)
+        for context in group:
+            if context.actor.pk not in atores_ids:
+                atores_ids.append(context.actor.pk)
+
+        notification.contagem += len(group)
+        notification.atores = unicos[: self.max_atores]
+        notification.atores_ids = atores_ids
+        notification.lido = False
+        template = COALESCED_TEMPLATES.get(notification.tipo)
+        if notification.contagem == 1 or template is None:
+            notification.mensagem = group[-1].message
+        else:
+            notification.mensagem = template(
+                unicos[0]["username"],
+                len(atores_ids),
+                notification.contagem,
+                group[-1].idea,
             )
-            return False
 
     def can_send(self, context: NotificationContext) -> bool:
         return context.recipient is not None
@@ -0,0 +1,18 @@
+from talks.notifications.stream.backends import (
+    BaseStreamBackend,
+    LocalStreamBackend,
+    PostgresNotifyBackend,
+    get_stream_backend,
+)
+from talks.notifications.stream.broker import NotificationBroker, broker
+from talks.notifications.stream.tickets import StreamTicketService
+
+__all__ = [
+    "BaseStreamBackend",
+    "LocalStreamBackend",
+    "PostgresNotifyBackend",
+    "get_stream_backend",
+    "NotificationBroker",
+    "broker",
+    "StreamTicketService",
+]
@@ -0,0 +1,103 @@
+import logging
+import select
+import threading
+import time
+from functools import lru_cache
+
+import orjson
+from django.conf import settings
+from django.db import connection, connections
+from django.utils.module_loading import import_string
+
+from .broker import NotificationBroker, broker
+
+logger = logging.getLogger(__name__)
+
+
+class BaseStreamBackend:
+    """
+    Transporte dos eventos entre o processo que entrega as notificações
+    (worker da outbox) e os processos ASGI que mantêm as conexões SSE.
+
+    ``publish`` roda no processo que entrega; ``start`` roda em cada processo
+    ASGI e encaminha os eventos recebidos para o ``NotificationBroker`` local.
+    """
+
+    def publish(self, user_id: int, event: dict) -> None:
+        raise NotImplementedError
+
+    def start(self, broker: NotificationBroker) -> None:
+        pass
+
+
+class LocalStreamBackend(BaseStreamBackend):
+    """
+    Publica direto no broker do próprio processo (testes e desenvolvimento
+    com worker e servidor no mesmo processo).
+    """
+
+    def publish(self, user_id: int, event: dict) -> None:
+        broker.publish(user_id, event)
+
+
+class PostgresNotifyBackend(BaseStreamBackend):
+    """
+    Usa ``LISTEN/NOTIFY`` do Postgres: o worker emite ``pg_notify`` e cada
+    processo ASGI mantém uma conexão dedicada escutando o canal numa thread.
+    Não exige infraestrutura além do banco que já usamos.
+    """
+
+    channel = "talks_notifications"
+    poll_timeout = 5.0
+    reconnect_delay = 5.0
+
+    def __init__(self):
+        self._lock = threading.Lock()
+        self._thread = None
+
+    def publish(self, user_id: int, event: dict) -> None:
+        payload = orjson.dumps({"user_id": user_id, "event": event}).decode()
+        with connection.cursor() as cursor:
+            cursor.execute("SELECT pg_notify(%s, %s)", [self.channel, payload])
+
+    def start(self, broker: NotificationBroker) -> None:
+        with self._lock:
+            if self._thread is None:
+                self._thread = threading.Thread(
+                    target=self.listen,
+                    args=(broker,),
+                    name="notification-stream-listener",
+                    daemon=True,
+                )
+                self._thread.start()
+
+    def listen(self, broker: NotificationBroker) -> None:
+        while True:
+            try:
+                self.listen_forever(broker)
+            except Exception as e:
+                logger.error(f"Listener de notificações desconectado: {str(e)}")
+                time.sleep(self.reconnect_delay)
+
+    def listen_forever(self, broker: NotificationBroker) -> None:
+        wrapper = connections["default"]
+        conn = wrapper.get_new_connection(wrapper.get_connection_params())
+        try:
+            conn.autocommit = True
+            with conn.cursor() as cursor:
+                cursor.execute(f"LISTEN {self.channel}")
+            while True:
+                if select.select([conn], [], [], self.poll_timeout) == ([], [], []):
+                    continue
+                conn.poll()
+                while conn.notifies:
+                    notify = conn.notifies.pop(0)
+                    message = orjson.loads(notify.payload)
+                    broker.publish(message["user_id"], message["event"])
+        finally:
+            conn.close()
+
+
+@lru_cache(maxsize=None)
+def get_stream_backend() -> BaseStreamBackend:
+    return import_string(settings.NOTIFICATION_STREAM_BACKEND)()
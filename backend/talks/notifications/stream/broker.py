@@ -0,0 +1,63 @@
+import asyncio
+import logging
+import threading
+from collections import defaultdict
+
+logger = logging.getLogger(__name__)
+
+
+class NotificationBroker:
+    """
+    Pub/sub em memória entre as notificações entregues e as conexões SSE
+    abertas neste processo.
+
+    Cada conexão assina com uma ``asyncio.Queue`` no seu próprio event loop;
+    ``publish`` pode ser chamado de qualquer thread (worker, listener do
+    backend) e entrega via ``call_soon_threadsafe``. Conexões lentas perdem
+    eventos em vez de acumular memória: o evento seguinte traz o contador
+    atualizado e o frontend recarrega a lista.
+    """
+
+    QUEUE_SIZE = 100
+
+    def __init__(self):
+        self._lock = threading.Lock()
+        self._subscribers = defaultdict(set)
+
+    def subscribe(self, user_id: int) -> asyncio.Queue:
+        queue = asyncio.Queue(maxsize=self.QUEUE_SIZE)
+        subscription = (asyncio.get_running_loop(), queue)
+        with self._lock:
+            self._subscribers[user_id].add(subscription)
+        return queue
+
+    def unsubscribe(self, user_id: int, queue: asyncio.Queue) -> None:
+        with self._lock:
+            subscriptions = self._subscribers.get(user_id, set())
+            subscriptions -= {sub for sub in subscriptions if sub[1] is queue}
+            if not subscriptions:
+                self._subscribers.pop(user_id, None)
+
+    def subscriber_count(self, user_id: int) -> int:
+        with self._lock:
+            return len(self._subscribers.get(user_id, ()))
+
+    def publish(self, user_id: int, event: dict) -> None:
+        with self._lock:
+            subscriptions = list(self._subscribers.get(user_id, ()))
+        for loop, queue in subscriptions:
+            try:
+                loop.call_soon_threadsafe(self._put, queue, event)
+            except RuntimeError:
+                # Loop já encerrado; a conexão será removida no unsubscribe
+                pass
+
+    @staticmethod
+    def _put(queue: asyncio.Queue, event: dict) -> None:
+        try:
+            queue.put_nowait(event)
+        except asyncio.QueueFull:
+            logger.warning("Fila SSE cheia; evento de notificação descartado")
+
+
+broker = NotificationBroker()
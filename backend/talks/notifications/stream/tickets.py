@@ -0,0 +1,39 @@
+import secrets
+
+from django.conf import settings
+from django.core.cache import cache
+
+
+class StreamTicketService:
+    """
+    Tickets de uso único para abrir o stream SSE.
+
+    O ``EventSource`` do navegador não envia headers, e o JWT na query string
+    acabaria em logs de acesso e no histórico. O cliente troca o JWT (enviado
+    no header de um POST autenticado) por um ticket aleatório de vida curta,
+    guardado no cache compartilhado, e abre o stream com ``?ticket=``. O
+    ticket é consumido na conexão: uma reconexão pede um novo.
+    """
+
+    KEY_PREFIX = "notifications:stream-ticket:"
+
+    @staticmethod
+    def issue(user_id: int) -> str:
+        ticket = secrets.token_urlsafe(32)
+        cache.set(
+            StreamTicketService.KEY_PREFIX + ticket,
+            user_id,
+            timeout=settings.NOTIFICATION_STREAM_TICKET_TTL,
+        )
+        return ticket
+
+    @staticmethod
+    def redeem(ticket: str) -> int | None:
+        """Consome o ticket e retorna o id do usuário, ou None se inválido."""
+        key = StreamTicketService.KEY_PREFIX + ticket
+        user_id = cache.get(key)
+        # Só quem de fato apagou a chave leva o ticket: duas conexões
+        # concorrentes com o mesmo ticket não passam ambas
+        if user_id is None or not cache.delete(key):
+            return None
+        return user_id
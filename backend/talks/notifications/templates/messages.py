@@ -19,6 +19,20 @@ class MessageTemplate:
     @staticmethod
     def comment_created(user: Any, idea: Any) -> str:
         return f"{user.username} comentou em '{idea.titulo}'"
+    
+    @staticmethod
+    def votes_coalesced(username: str, actors: int, count: int, idea: Any) -> str:
+        others = actors - 1
+        if others == 0:
+            return f"{username} votou na sua ideia '{idea.titulo}'"
+        pessoas = "pessoa" if others == 1 else "pessoas"
+        return f"{username} e mais {others} {pessoas} votaram na sua ideia '{idea.titulo}'"
+    
+    @staticmethod
+    def comments_coalesced(username: str, actors: int, count: int, idea: Any) -> str:
+        if actors == 1:
+            return f"{username} comentou em '{idea.titulo}' ({count} comentários)"
+        return f"{username} e outros comentaram em '{idea.titulo}' ({count} comentários)"
 
 
 TEMPLATES: Dict[str, Callable[[Any, Any], str]] = {
@@ -28,6 +42,13 @@ TEMPLATES: Dict[str, Callable[[Any, Any], str]] = {
     "comentario": MessageTemplate.comment_created,
 }
 
+# Mensagens das notificações agrupadas (username do ator mais recente, total
+# de autores distintos, total de eventos agrupados, ideia)
+COALESCED_TEMPLATES: Dict[str, Callable[[str, int, int, Any], str]] = {
+    "voto": MessageTemplate.votes_coalesced,
+    "comentario": MessageTemplate.comments_coalesced,
+}
+
 
 def get_message(notification_type: str, user: Any, idea: Any) -> str:
     template_fn = TEMPLATES[notification_type]
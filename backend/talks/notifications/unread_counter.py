@@ -0,0 +1,137 @@
+from django.contrib.auth import get_user_model
+from django.db.models import Count, F, Q
+from django.db.models.functions import Greatest
+from django.db.models.signals import post_delete, post_save
+from django.dispatch import receiver
+
+from talks.models import Notification
+
+
+class UnreadCounterService:
+    """
+    Contador de notificações não lidas por usuário, guardado na coluna
+    ``User.notifications_unread_count``.
+
+    Todos os processos (workers ASGI e worker da outbox) leem e escrevem a
+    mesma linha: a leitura do badge é um SELECT pela PK e as escritas são
+    ``UPDATE ... SET n = n + delta`` atômicos. Entregas incrementam na mesma
+    transação que grava as notificações, ``mark_read`` decrementa e
+    ``mark_all_read`` (marca d'água de leitura) zera. Alterações fora desses
+    caminhos (admin) recalculam com ``refresh``.
+    """
+
+    FIELD = "notifications_unread_count"
+
+    @staticmethod
+    def get(user_id: int) -> int:
+        count = (
+            get_user_model()
+            .objects.filter(pk=user_id)
+            .values_list(UnreadCounterService.FIELD, flat=True)
+            .first()
+        )
+        return count or 0
+
+    @staticmethod
+    def incr(user_id: int, delta: int = 1) -> None:
+        UnreadCounterService.incr_many({user_id: delta})
+
+    @staticmethod
+    def incr_many(deltas: dict) -> None:
+        """
+        Aplica ``{user_id: delta}`` com um UPDATE por valor de delta (no
+        fan-out de um evento, todos os destinatários recebem +1 de uma vez).
+        """
+        by_delta = {}
+        for user_id, delta in deltas.items():
+            if delta:
+                by_delta.setdefault(delta, []).append(user_id)
+
+        field = UnreadCounterService.FIELD
+        for delta, user_ids in by_delta.items():
+            get_user_model().objects.filter(pk__in=user_ids).update(
+                **{field: Greatest(F(field) + delta, 0)}
+            )
+
+    @staticmethod
+    def decr(user_id: int, delta: int = 1) -> None:
+        UnreadCounterService.incr(user_id, -delta)
+
+    @staticmethod
+    def reset(user_id: int, last_read_at) -> None:
+        """Move a marca d'água de leitura e zera o contador num único UPDATE."""
+        get_user_model().objects.filter(pk=user_id).update(
+            notifications_last_read_at=last_read_at,
+            **{UnreadCounterService.FIELD: 0},
+        )
+
+    @staticmethod
+    def discount(notifications) -> None:
+        """
+        Desconta dos contadores as notificações de ``notifications`` que
+        contam como não lidas, com um UPDATE por valor de delta. Usado antes
+        de apagá-las em massa sem passar pelos signals (expurgo).
+        """
+        unread = (
+            notifications.filter(lido=False)
+            .filter(
+                Q(user__notifications_last_read_at__isnull=True)
+                | Q(user__notifications_last_read_at__lt=F("created_at"))
+            )
+            .order_by()
+            .values("user_id")
+            .annotate(total=Count("id"))
+        )
+        UnreadCounterService.incr_many(
+            {row["user_id"]: -row["total"] for row in unread}
+        )
+
+    @staticmethod
+    def refresh(*user_ids: int) -> None:
+        """Recalcula o contador a partir das notificações (reparo)."""
+        User = get_user_model()
+        users = User.objects.filter(pk__in=user_ids).values_list(
+            "pk", "notifications_last_read_at"
+        )
+        for user_id, last_read_at in users:
+            count = (
+                Notification.objects.filter(user_id=user_id)
+                .unread(last_read_at)
+                .count()
+            )
+            User.objects.filter(pk=user_id).update(
+                **{UnreadCounterService.FIELD: count}
+            )
+
+
+def unread_for_user(notification):
+    """
+    Filtro do destinatário de ``notification`` se ela conta como não lida
+    para ele (marca d'água anterior à notificação).
+    """
+    return Q(pk=notification.user_id) & (
+        Q(notifications_last_read_at__isnull=True)
+        | Q(notifications_last_read_at__lt=notification.created_at)
+    )
+
+
+@receiver(post_save, sender=Notification)
+def update_unread_counter_on_save(sender, instance, created, **kwargs):
+    # Entregas do DatabaseNotificationService usam bulk_create/bulk_update e
+    # atualizam o contador por conta própria; aqui entram saves avulsos
+    if not created:
+        UnreadCounterService.refresh(instance.user_id)
+    elif not instance.lido:
+        field = UnreadCounterService.FIELD
+        get_user_model().objects.filter(unread_for_user(instance)).update(
+            **{field: F(field) + 1}
+        )
+
+
+@receiver(post_delete, sender=Notification)
+def update_unread_counter_on_delete(sender, instance, **kwargs):
+    if not instance.lido:
+        field = UnreadCounterService.FIELD
+        get_user_model().objects.filter(unread_for_user(instance)).update(
+            **{field: Greatest(F(field) - 1, 0)}
+        )
@@ -0,0 +1,187 @@
+import json
+from base64 import b64decode, b64encode
+from functools import reduce
+from operator import or_
+
+from django.db.models import Q
+from rest_framework.exceptions import NotFound, ValidationError
+from rest_framework.pagination import BasePagination
+from rest_framework.response import Response
+from rest_framework.settings import api_settings
+from rest_framework.utils.urls import replace_query_param
+
+
+class KeysetPagination(BasePagination):
+    """
+    Paginação por cursor (keyset) sobre uma ordenação composta e única.
+
+    Em vez de OFFSET + COUNT(*), cada página filtra pela posição do último
+    item da página anterior, ex: ``(created_at, id) < (x, y)``. O custo de uma
+    página é o mesmo em qualquer profundidade. Paginação apenas para frente
+    (infinite scroll): a resposta traz ``next`` e ``results``.
+
+    A view define a ordenação em ``keyset_ordering`` (último campo deve ser
+    único, normalmente ``id``). Essa ordenação é fixa: ``?ordering=`` junto
+    com o cursor é rejeitado com 400 em vez de ser ignorado.
+    """
+
+    cursor_query_param = "cursor"
+    page_size = 12
+    page_size_query_param = "page_size"
+    max_page_size = 100
+    ordering = ("-created_at", "-id")
+    invalid_cursor_message = "Cursor inválido."
+    ordering_not_allowed_message = (
+        "A paginação por cursor usa uma ordenação fixa; remova o parâmetro ordering."
+    )
+
+    def paginate_queryset(self, queryset, request, view=None):
+        self.request = request
+        if api_settings.ORDERING_PARAM in request.query_params:
+            raise ValidationError(
+                {api_settings.ORDERING_PARAM: [self.ordering_not_allowed_message]}
+            )
+        self.page_size = self.get_page_size(request)
+        self.configure(queryset.model, getattr(view, "keyset_ordering", self.ordering))
+
+        queryset = queryset.order_by(*self.ordering)
+
+        position = self.decode_cursor(request)
+        if position is not None:
+            queryset = queryset.filter(self.get_position_filter(position))
+
+        results = list(queryset[: self.page_size + 1])
+        self.has_next = len(results) > self.page_size
+        self.page = results[: self.page_size]
+        return self.page
+
+    def configure(self, model, ordering):
+        self.ordering = tuple(ordering)
+        self.fields = [
+            model._meta.get_field(name.lstrip("-")) for name in self.ordering
+        ]
+
+    def get_page_size(self, request):
+        try:
+            page_size = int(request.query_params[self.page_size_query_param])
+        except (KeyError, ValueError):
+            return self.page_size
+
+        if page_size <= 0:
+            return self.page_size
+        return min(page_size, self.max_page_size)
+
+    def get_position_filter(self, position):
+        """
+        Monta ``(a, b, c) > (x, y, z)`` respeitando a direção de cada campo:
+        ``a > x OR (a = x AND b > y) OR (a = x AND b = y AND c > z)``.
+        """
+        clauses = []
+        for index, name in enumerate(self.ordering):
+            attname = name.lstrip("-")
+            lookup = "lt" if name.startswith("-") else "gt"
+            equal = {
+                previous.lstrip("-"): position[i]
+                for i, previous in enumerate(self.ordering[:index])
+            }
+            clauses.append(Q(**equal, **{f"{attname}__{lookup}": position[index]}))
+        return reduce(or_, clauses)
+
+    def encode_position(self, obj):
+        values = [field.value_to_string(obj) for field in self.fields]
+        return b64encode(json.dumps(values).encode("ascii")).decode("ascii")
+
+    def encode_cursor(self, obj, url=None):
+        """
+        URL da página seguinte a ``obj`` (por padrão, a URL da requisição).
+        """
+        url = url or self.request.build_absolute_uri()
+        return replace_query_param(
+            url, self.cursor_query_param, self.encode_position(obj)
+        )
+
+    def decode_cursor(self, request):
+        encoded = request.query_params.get(self.cursor_query_param)
+        if not encoded:
+            return None
+
+        try:
+            values = json.loads(b64decode(encoded.encode("ascii")).decode("ascii"))
+            if len(values) != len(self.fields):
+                raise ValueError
+            position = [
+                field.to_python(value) for field, value in zip(self.fields, values)
+            ]
+        except Exception:
+            raise NotFound(self.invalid_cursor_message)
+
+        if any(value is None for value in position):
+            raise NotFound(self.invalid_cursor_message)
+        return position
+
+    def get_next_link(self):
+        if not self.has_next:
+            return None
+        return self.encode_cursor(self.page[-1])
+
+    def get_paginated_response(self, data):
+        return Response({"next": self.get_next_link(), "results": data})
+
+    def get_paginated_response_schema(self, schema):
+        return {
+            "type": "object",
+            "required": ["results"],
+            "properties": {
+                "next": {"type": "string", "nullable": True, "format": "uri"},
+                "results": schema,
+            },
+        }
+
+    def get_schema_operation_parameters(self, view):
+        return [
+            {
+                "name": self.cursor_query_param,
+                "required": False,
+                "in": "query",
+                "description": "Cursor da próxima página (retornado em `next`)",
+                "schema": {"type": "string"},
+            },
+            {
+                "name": self.page_size_query_param,
+                "required": False,
+                "in": "query",
+                "description": f"Itens por página (máx {self.max_page_size})",
+                "schema": {"type": "integer"},
+            },
+        ]
+
+    @classmethod
+    def is_requested(cls, request):
+        params = request.query_params
+        return params.get("pagination") == "cursor" or cls.cursor_query_param in params
+
+
+class OptionalKeysetPaginationMixin:
+    """
+    Ativa ``KeysetPagination`` quando o cliente pede ``?pagination=cursor``
+    (ou envia um ``cursor``); caso contrário mantém a paginação padrão.
+    Actions em ``keyset_actions`` usam sempre o cursor.
+    """
+
+    keyset_ordering = ("-created_at", "-id")
+    keyset_actions = ()
+
+    def use_keyset_pagination(self):
+        if getattr(self, "action", None) in self.keyset_actions:
+            return True
+        request = getattr(self, "request", None)
+        return request is not None and KeysetPagination.is_requested(request)
+
+    @property
+    def paginator(self):
+        if not hasattr(self, "_paginator"):
+            if self.use_keyset_pagination():
+                self._paginator = KeysetPagination()
+            else:
+                return super().paginator
+        return self._paginator
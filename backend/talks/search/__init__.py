@@ -0,0 +1,4 @@
+from talks.search.backends import get_search_backend, render_snippet
+from talks.search.document import build_search_document
+
+__all__ = ["get_search_backend", "build_search_document", "render_snippet"]
@@ -0,0 +1,177 @@
+import re
+
+from django.db import connections
+from django.db.models import FloatField, Q, TextField, Value
+from django.db.models.expressions import RawSQL
+from django.utils.html import escape
+
+# O banco delimita os termos com caracteres de controle (removidos do
+# documento por ``build_search_document``); ``render_snippet`` escapa o
+# trecho e só então os troca por <mark>, para que texto do usuário nunca
+# chegue ao cliente como HTML.
+HIGHLIGHT_START = "\x02"
+HIGHLIGHT_STOP = "\x03"
+
+_TOKEN = re.compile(r"\w+", re.UNICODE)
+
+
+def render_snippet(snippet):
+    """Trecho destacado como HTML seguro: apenas as tags <mark> são markup."""
+    if snippet is None:
+        return None
+    return (
+        escape(snippet)
+        .replace(HIGHLIGHT_START, "<mark>")
+        .replace(HIGHLIGHT_STOP, "</mark>")
+    )
+
+
+class BaseSearchBackend:
+    """
+    Backend de busca textual de ideias.
+
+    ``search`` filtra o queryset e anota:
+    - search_rank: relevância (maior = mais relevante)
+    - search_snippet: trecho do documento com os termos entre
+      ``HIGHLIGHT_START``/``HIGHLIGHT_STOP`` (ver ``render_snippet``)
+
+    As estruturas de índice são criadas pela migration
+    ``0006_idea_search_document``.
+    """
+
+    def __init__(self, connection):
+        self.connection = connection
+
+    def index(self, idea):
+        """Sincroniza o índice após salvar a ideia."""
+
+    def remove(self, idea_id):
+        """Remove a ideia do índice após deletá-la."""
+
+    def search(self, queryset, query):
+        raise NotImplementedError
+
+
+class FallbackSearchBackend(BaseSearchBackend):
+    """Busca simples por ``icontains`` no documento em texto puro."""
+
+    def search(self, queryset, query):
+        terms = _TOKEN.findall(query)
+        if not terms:
+            return queryset.none()
+
+        condition = Q()
+        for term in terms:
+            condition &= Q(search_document__icontains=term)
+
+        return queryset.filter(condition).annotate(
+            search_rank=Value(0.0, output_field=FloatField()),
+            search_snippet=Value(None, output_field=TextField()),
+        )
+
+
+class PostgresSearchBackend(BaseSearchBackend):
+    """
+    ``tsvector`` com índice GIN sobre ``search_document``.
+
+    Usa a configuração ``portuguese_unaccent`` (stemming em português +
+    ``unaccent``), criada pela migration, para que "introducao" encontre
+    "Introdução".
+    """
+
+    config = "portuguese_unaccent"
+
+    def vector(self):
+        from django.contrib.postgres.search import SearchVector
+
+        return SearchVector("search_document", config=self.config)
+
+    def search(self, queryset, query):
+        from django.contrib.postgres.search import (
+            SearchHeadline,
+            SearchQuery,
+            SearchRank,
+        )
+
+        search_query = SearchQuery(query, config=self.config, search_type="websearch")
+        return (
+            queryset.annotate(search_vector=self.vector())
+            .filter(search_vector=search_query)
+            .annotate(
+                search_rank=SearchRank(self.vector(), search_query),
+                search_snippet=SearchHeadline(
+                    "search_document",
+                    search_query,
+                    config=self.config,
+                    start_sel=HIGHLIGHT_START,
+                    stop_sel=HIGHLIGHT_STOP,
+                    min_words=15,
+                    max_words=35,
+                ),
+            )
+        )
+
+
+class SQLiteSearchBackend(BaseSearchBackend):
+    """
+    Tabela virtual FTS5 (ambiente de desenvolvimento).
+
+    O tokenizer ``unicode61 remove_diacritics 2`` faz o mesmo papel do
+    ``unaccent`` no Postgres. A tabela é mantida por ``index``/``remove``.
+    """
+
+    table = "talks_idea_fts"
+
+    def index(self, idea):
+        with self.connection.cursor() as cursor:
+            cursor.execute(
+                f"INSERT OR REPLACE INTO {self.table} (rowid, document) VALUES (%s, %s)",
+                [idea.pk, idea.search_document],
+            )
+
+    def remove(self, idea_id):
+        with self.connection.cursor() as cursor:
+            cursor.execute(f"DELETE FROM {self.table} WHERE rowid = %s", [idea_id])
+
+    @staticmethod
+    def build_match(query):
+        # Cada termo vira uma frase com prefixo; evita erros de sintaxe do FTS5
+        # com aspas, operadores e pontuação vindos do usuário.
+        return " ".join(f'"{term}"*' for term in _TOKEN.findall(query))
+
+    def search(self, queryset, query):
+        match = self.build_match(query)
+        if not match:
+            return queryset.none()
+
+        idea_table = queryset.model._meta.db_table
+        fts_filter = f"{self.table} MATCH %s AND {self.table}.rowid = {idea_table}.id"
+        return queryset.filter(
+            pk__in=RawSQL(
+                f"SELECT rowid FROM {self.table} WHERE {self.table} MATCH %s", [match]
+            )
+        ).annotate(
+            search_rank=RawSQL(
+                f"SELECT -bm25({self.table}) FROM {self.table} WHERE {fts_filter}",
+                [match],
+                output_field=FloatField(),
+            ),
+            search_snippet=RawSQL(
+                f"SELECT snippet({self.table}, 0, %s, %s, '…', 24) "
+                f"FROM {self.table} WHERE {fts_filter}",
+                [HIGHLIGHT_START, HIGHLIGHT_STOP, match],
+                output_field=TextField(),
+            ),
+        )
+
+
+BACKENDS = {
+    "postgresql": PostgresSearchBackend,
+    "sqlite": SQLiteSearchBackend,
+}
+
+
+def get_search_backend(using="default"):
+    connection = connections[using]
+    backend_class = BACKENDS.get(connection.vendor, FallbackSearchBackend)
+    return backend_class(connection)
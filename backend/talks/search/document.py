@@ -0,0 +1,23 @@
+import re
+from html import unescape
+
+from django.utils.html import strip_tags
+
+_WHITESPACE = re.compile(r"\s+")
+# Caracteres de controle ficam fora do documento: os backends usam alguns
+# deles para delimitar os termos destacados no trecho.
+_CONTROL = re.compile(r"[\x00-\x08\x0b\x0c\x0e-\x1f\x7f]")
+
+
+def build_search_document(titulo: str, descricao: str, conteudo: str) -> str:
+    """
+    Monta o documento de busca de uma ideia em texto puro.
+
+    O HTML do editor é removido para que a busca não case com marcação
+    (ex: ``<strong>``) e para que os trechos destacados fiquem legíveis.
+    O resultado é texto, não HTML: entidades são decodificadas e o escape
+    acontece só na saída (``render_snippet``).
+    """
+    parts = [titulo or "", descricao or "", strip_tags(conteudo or "")]
+    text = _CONTROL.sub(" ", unescape(" ".join(parts)))
+    return _WHITESPACE.sub(" ", text).strip()
@@ -0,0 +1,17 @@
+from django.db.models.signals import post_delete, post_save
+from django.dispatch import receiver
+
+from talks.models import Idea
+from talks.search.backends import get_search_backend
+
+
+@receiver(post_save, sender=Idea)
+def index_idea(sender, instance, using, update_fields=None, **kwargs):
+    if update_fields is not None and "search_document" not in update_fields:
+        return
+    get_search_backend(using).index(instance)
+
+
+@receiver(post_delete, sender=Idea)
+def remove_idea_from_index(sender, instance, using, **kwargs):
+    get_search_backend(using).remove(instance.pk)
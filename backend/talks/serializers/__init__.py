@@ -1,8 +1,13 @@
-from talks.serializers.comment_serializer import CommentSerializer
+from talks.serializers.comment_serializer import (
+    CommentReplySerializer,
+    CommentSerializer,
+    CommentThreadSerializer,
+)
 from talks.serializers.idea_serializer import (
     IdeaCreateUpdateSerializer,
     IdeaDetailSerializer,
     IdeaListSerializer,
+    IdeaReferenceSerializer,
 )
 from talks.serializers.notification_serializer import NotificationSerializer
 from talks.serializers.reschedule_serializer import RescheduleSerializer
@@ -26,15 +31,24 @@ from talks.serializers.retro_metrics_serializer import (
     GlobalMetricsResponseSerializer,
 )
 from talks.serializers.tag_serializer import TagSerializer
-from talks.serializers.vote_serializer import VoteSerializer
+from talks.serializers.vote_serializer import (
+    VoterSerializer,
+    VoteSerializer,
+    VoteSummarySerializer,
+)
 
 __all__ = [
     "TagSerializer",
     "VoteSerializer",
+    "VoterSerializer",
+    "VoteSummarySerializer",
     "IdeaCreateUpdateSerializer",
     "IdeaDetailSerializer",
     "IdeaListSerializer",
+    "IdeaReferenceSerializer",
     "CommentSerializer",
+    "CommentReplySerializer",
+    "CommentThreadSerializer",
     "NotificationSerializer",
     "RescheduleSerializer",
     "RetroListSerializer",
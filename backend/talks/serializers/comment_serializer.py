@@ -1,4 +1,12 @@
-from rest_framework.serializers import ModelSerializer, SerializerMethodField
+from rest_framework.serializers import (
+    CharField,
+    DateTimeField,
+    IntegerField,
+    ModelSerializer,
+    Serializer,
+    SerializerMethodField,
+    ValidationError,
+)
 
 from talks.models import Comment
 from talks.serializers.user_serializer import UserSerializer
@@ -16,13 +24,91 @@ class CommentSerializer(ModelSerializer):
             "idea",
             "conteudo",
             "parent",
+            "depth",
             "respostas",
             "created_at",
             "updated_at",
         ]
-        read_only_fields = ["id", "user", "created_at", "updated_at"]
+        read_only_fields = ["id", "user", "depth", "created_at", "updated_at"]
+
+    def validate(self, attrs):
+        parent = attrs.get("parent")
+
+        if self.instance is not None:
+            parent_id = parent.pk if parent is not None else None
+            if "parent" in attrs and parent_id != self.instance.parent_id:
+                raise ValidationError(
+                    {"parent": "Não é possível mover um comentário para outra thread."}
+                )
+            return attrs
+
+        if parent is not None:
+            if parent.idea_id != attrs["idea"].pk:
+                raise ValidationError(
+                    {"parent": "A resposta deve pertencer à mesma ideia do comentário."}
+                )
+            if parent.depth >= Comment.MAX_DEPTH:
+                raise ValidationError(
+                    {
+                        "parent": f"Limite de {Comment.MAX_DEPTH} níveis de respostas atingido."
+                    }
+                )
+        return attrs
 
     def get_respostas(self, obj):
-        if obj.respostas.exists():
-            return CommentSerializer(obj.respostas.all(), many=True).data
-        return []
+        # Árvore montada por Comment.objects.as_tree() não consulta o banco
+        respostas = getattr(obj, "respostas_carregadas", None)
+        if respostas is None:
+            respostas = obj.respostas.select_related("user")
+        return CommentSerializer(respostas, many=True, context=self.context).data
+
+
+class CommentReplySerializer(ModelSerializer):
+    """
+    Comentário sem a árvore de respostas, com o total de respostas diretas
+    (usado na listagem paginada de threads/respostas).
+    """
+
+    user = UserSerializer(read_only=True)
+    reply_count = IntegerField(read_only=True)
+
+    class Meta:
+        model = Comment
+        fields = [
+            "id",
+            "user",
+            "idea",
+            "conteudo",
+            "parent",
+            "depth",
+            "reply_count",
+            "created_at",
+            "updated_at",
+        ]
+        read_only_fields = fields
+
+
+class CommentThreadSerializer(CommentReplySerializer):
+    """
+    Comentário raiz com as primeiras respostas e o link para carregar as
+    demais (``respostas_next``).
+    """
+
+    respostas = CommentReplySerializer(
+        source="respostas_carregadas", many=True, read_only=True
+    )
+    respostas_next = CharField(read_only=True, allow_null=True)
+
+    class Meta(CommentReplySerializer.Meta):
+        fields = CommentReplySerializer.Meta.fields + ["respostas", "respostas_next"]
+        read_only_fields = fields
+
+
+class CommentSummarySerializer(Serializer):
+    """
+    Resumo da discussão de uma ideia (payload de detalhe).
+    """
+
+    total = IntegerField()
+    threads = IntegerField()
+    ultimo_em = DateTimeField(allow_null=True)
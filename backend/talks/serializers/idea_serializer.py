@@ -1,6 +1,9 @@
-from core.models import User
+from django.db.models import Count, Manager, Max, Q
 from rest_framework.serializers import (
     BooleanField,
+    CharField,
+    IntegerField,
+    ListSerializer,
     ModelSerializer,
     PrimaryKeyRelatedField,
     SerializerMethodField,
@@ -8,21 +11,79 @@ from rest_framework.serializers import (
 )
 
 from talks.models import Idea, Tag, Vote
-from talks.serializers.comment_serializer import CommentSerializer
+from talks.models.vote import ROSTER_PREVIEW_SIZE
+from talks.search import render_snippet
+from talks.serializers.comment_serializer import (
+    CommentSerializer,
+    CommentSummarySerializer,
+)
+from talks.serializers.mixins import SparseFieldsetMixin
 from talks.serializers.tag_serializer import TagSerializer
-from talks.serializers.vote_serializer import VoteSerializer
+from talks.serializers.vote_serializer import VoteSerializer, VoteSummarySerializer
+from talks.services.population_stats import PopulationStatsService
 
 from .user_serializer import UserSerializer
 
 
-class IdeaListSerializer(ModelSerializer):
+def resolve_voted_idea_ids(context, ideas):
+    """
+    Retorna o conjunto de IDs de ideias votadas pelo usuário da requisição.
+
+    Apenas as ideias ainda não consultadas neste contexto geram query, e todas
+    elas são resolvidas de uma vez; o resultado fica guardado no próprio
+    ``context`` para o restante da resposta.
+    """
+    voted_ids = context.setdefault("_voted_idea_ids", set())
+    request = context.get("request")
+    if not (request and request.user.is_authenticated):
+        return voted_ids
+
+    resolved_ids = context.setdefault("_resolved_idea_ids", set())
+    pending_ids = {
+        idea.pk for idea in ideas if idea is not None and idea.pk not in resolved_ids
+    }
+    if pending_ids:
+        voted_ids.update(
+            Vote.objects.filter(user=request.user, idea_id__in=pending_ids).values_list(
+                "idea_id", flat=True
+            )
+        )
+        resolved_ids.update(pending_ids)
+
+    return voted_ids
+
+
+class VoteAwareListSerializer(ListSerializer):
+    """
+    ListSerializer que resolve ``has_voted`` da página inteira numa única query.
+
+    ``idea_attr`` indica onde está a ideia em cada item (None = o próprio item).
+    """
+
+    idea_attr = None
+
+    def to_representation(self, data):
+        items = list(data.all() if isinstance(data, Manager) else data)
+        if self.idea_attr or "has_voted" in self.child.fields:
+            ideas = [
+                getattr(item, self.idea_attr) if self.idea_attr else item
+                for item in items
+            ]
+            resolve_voted_idea_ids(self.context, ideas)
+        return super().to_representation(items)
+
+
+class IdeaListSerializer(SparseFieldsetMixin, ModelSerializer):
     autor = UserSerializer(read_only=True)
     apresentador = UserSerializer(read_only=True)
     tags = TagSerializer(many=True, read_only=True)
-    vote_count = SerializerMethodField(read_only=True)
+    vote_count = IntegerField(read_only=True)
     vote_percentage = SerializerMethodField(read_only=True)
     has_voted = SerializerMethodField()
     precisa_apresentador = BooleanField(read_only=True)
+    search_snippet = SerializerMethodField()
+
+    expandable_fields = ("search_snippet",)
 
     class Meta:
         model = Idea
@@ -30,6 +91,7 @@ class IdeaListSerializer(ModelSerializer):
             "id",
             "titulo",
             "descricao",
+            "conteudo",
             "imagem",
             "autor",
             "apresentador",
@@ -40,46 +102,69 @@ class IdeaListSerializer(ModelSerializer):
             "vote_count",
             "vote_percentage",
             "has_voted",
+            "comment_count",
+            "last_comment_at",
             "precisa_apresentador",
+            "search_snippet",
             "created_at",
             "updated_at",
         ]
         read_only_fields = ["id", "created_at", "updated_at"]
+        list_serializer_class = VoteAwareListSerializer
 
     def get_has_voted(self, obj):
-        request = self.context.get("request")
-        if request and request.user.is_authenticated:
-            return Vote.objects.filter(user=request.user, idea=obj).exists()
-        return False
+        return obj.pk in resolve_voted_idea_ids(self.context, [obj])
 
-    def get_vote_count(self, obj: Idea) -> int:
-        if hasattr(obj, "vote_count_annotated"):
-            return obj.vote_count_annotated
-        return obj.votos.filter(user__is_active=True).count()
+    def get_search_snippet(self, obj) -> str | None:
+        return render_snippet(getattr(obj, "search_snippet", None))
 
     def get_vote_percentage(self, obj: Idea) -> str:
         if hasattr(obj, "vote_percentage_decimal"):
             percentage = float(obj.vote_percentage_decimal)
             return f"{percentage:.2f}%"
 
-        total_users = User.objects.filter(is_active=True).count()
-        total_votos = self.get_vote_count(obj)
-        result = (total_votos / total_users) * 100 if total_users > 0 else 0
+        result = PopulationStatsService.vote_percentage(obj.vote_count)
         return f"{result:.2f}%"
 
 
-class IdeaDetailSerializer(ModelSerializer):
+class IdeaReferenceSerializer(ModelSerializer):
+    """
+    Referência compacta a uma ideia (ex: payload de notificações).
+
+    Usa apenas colunas da própria ideia (``only_fields``), sem relações nem
+    agregados, então uma página inteira sai de um único ``select_related``.
+    """
+
+    status = CharField(read_only=True)
+
+    # Colunas necessárias para serializar (status deriva de data_agendada)
+    only_fields = ("id", "titulo", "data_agendada", "imagem")
+
+    class Meta:
+        model = Idea
+        fields = ["id", "titulo", "status", "imagem"]
+        read_only_fields = fields
+
+
+class IdeaDetailSerializer(SparseFieldsetMixin, ModelSerializer):
     autor = UserSerializer(read_only=True)
     apresentador = UserSerializer(read_only=True)
     tags = TagSerializer(many=True, read_only=True)
     votos = VoteSerializer(many=True, read_only=True)
+    votos_resumo = SerializerMethodField()
     comentarios = SerializerMethodField()
-    vote_count = SerializerMethodField(read_only=True)
+    comentarios_resumo = SerializerMethodField()
+    vote_count = IntegerField(read_only=True)
     vote_percentage = SerializerMethodField(read_only=True)
     has_voted = SerializerMethodField()
     precisa_apresentador = BooleanField(read_only=True)
     is_presenter = SerializerMethodField()
 
+    # Árvore completa só com ?expand=comentarios; o padrão traz o resumo e as
+    # threads são paginadas em /api/comments/threads/. O mesmo vale para os
+    # votos (?expand=votos), paginados em /api/ideas/{id}/voters/
+    expandable_fields = ("votos", "comentarios")
+
     class Meta:
         model = Idea
         fields = [
@@ -95,7 +180,9 @@ class IdeaDetailSerializer(ModelSerializer):
             "prioridade",
             "data_agendada",
             "votos",
+            "votos_resumo",
             "comentarios",
+            "comentarios_resumo",
             "vote_count",
             "vote_percentage",
             "has_voted",
@@ -106,35 +193,43 @@ class IdeaDetailSerializer(ModelSerializer):
         ]
         read_only_fields = ["id", "created_at", "updated_at"]
 
+    def get_votos_resumo(self, obj):
+        votantes = getattr(obj, "votos_recentes", None)
+        if votantes is None:
+            votantes = obj.votos.roster()[:ROSTER_PREVIEW_SIZE]
+        resumo = {
+            "total": obj.vote_count,
+            "votantes": [vote.user for vote in votantes],
+        }
+        return VoteSummarySerializer(resumo, context=self.context).data
+
     def get_comentarios(self, obj):
-        comentarios_raiz = obj.comentarios.filter(parent__isnull=True)
-        return CommentSerializer(comentarios_raiz, many=True).data
+        comentarios_raiz = obj.comentarios.as_tree()
+        return CommentSerializer(comentarios_raiz, many=True, context=self.context).data
+
+    def get_comentarios_resumo(self, obj):
+        resumo = obj.comentarios.aggregate(
+            total=Count("id"),
+            threads=Count("id", filter=Q(parent__isnull=True)),
+            ultimo_em=Max("created_at"),
+        )
+        return CommentSummarySerializer(resumo).data
 
     def get_has_voted(self, obj):
-        request = self.context.get("request")
-        if request and request.user.is_authenticated:
-            return Vote.objects.filter(user=request.user, idea=obj).exists()
-        return False
+        return obj.pk in resolve_voted_idea_ids(self.context, [obj])
 
     def get_is_presenter(self, obj):
         request = self.context.get("request")
         if request and request.user.is_authenticated:
-            return obj.apresentador == request.user
+            return obj.apresentador_id == request.user.id
         return False
 
-    def get_vote_count(self, obj: Idea) -> int:
-        if hasattr(obj, "vote_count_annotated"):
-            return obj.vote_count_annotated
-        return obj.votos.filter(user__is_active=True).count()
-
     def get_vote_percentage(self, obj: Idea) -> str:
         if hasattr(obj, "vote_percentage_decimal"):
             percentage = float(obj.vote_percentage_decimal)
             return f"{percentage:.2f}%"
 
-        total_users = User.objects.filter(is_active=True).count()
-        total_votos = self.get_vote_count(obj)
-        result = (total_votos / total_users) * 100 if total_users > 0 else 0
+        result = PopulationStatsService.vote_percentage(obj.vote_count)
         return f"{result:.2f}%"
 
 
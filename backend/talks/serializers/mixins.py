@@ -0,0 +1,37 @@
+class SparseFieldsetMixin:
+    """
+    Permite escolher os campos do serializer (``?fields=`` / ``?expand=``).
+
+    - ``fields``: restringe a saída aos campos informados (``id`` sempre vem)
+    - ``expand``: inclui campos de ``expandable_fields``, que ficam fora da
+      saída padrão por serem caros
+
+    ``select_field_names`` é usado também pela view para decidir quais
+    relações e colunas o queryset precisa carregar.
+    """
+
+    expandable_fields = ()
+
+    def __init__(self, *args, fields=None, expand=None, **kwargs):
+        self._selected_fields = self.select_field_names(fields, expand)
+        super().__init__(*args, **kwargs)
+
+    @classmethod
+    def select_field_names(cls, fields=None, expand=None):
+        available = list(cls.Meta.fields)
+
+        if fields:
+            requested = set(fields) | {"id"}
+            selected = [name for name in available if name in requested]
+        else:
+            selected = [name for name in available if name not in cls.expandable_fields]
+
+        for name in expand or ():
+            if name in cls.expandable_fields and name not in selected:
+                selected.append(name)
+
+        return selected
+
+    def get_field_names(self, declared_fields, info):
+        field_names = super().get_field_names(declared_fields, info)
+        return [name for name in field_names if name in self._selected_fields]
@@ -1,11 +1,12 @@
-from rest_framework.serializers import ModelSerializer
+from rest_framework.serializers import ModelSerializer, SerializerMethodField
 
 from talks.models import Notification
-from talks.serializers.idea_serializer import IdeaListSerializer
+from talks.serializers.idea_serializer import IdeaReferenceSerializer
 
 
 class NotificationSerializer(ModelSerializer):
-    idea = IdeaListSerializer(read_only=True)
+    idea = IdeaReferenceSerializer(read_only=True)
+    lido = SerializerMethodField()
 
     class Meta:
         model = Notification
@@ -13,8 +14,25 @@ class NotificationSerializer(ModelSerializer):
             "id",
             "tipo",
             "mensagem",
+            "contagem",
+            "atores",
             "idea",
             "lido",
             "created_at",
         ]
-        read_only_fields = ["id", "tipo", "mensagem", "idea", "created_at"]
+        read_only_fields = [
+            "id",
+            "tipo",
+            "mensagem",
+            "contagem",
+            "atores",
+            "idea",
+            "created_at",
+        ]
+
+    def get_lido(self, obj) -> bool:
+        # Também conta como lida o que foi coberto por "marcar todas como lidas"
+        request = self.context.get("request")
+        if request and request.user.is_authenticated:
+            return obj.is_read(request.user.notifications_last_read_at)
+        return obj.lido
@@ -2,11 +2,60 @@ from rest_framework import serializers
 from talks.models import Retro, RetroTemplate
 from talks.serializers.retro_item_serializer import RetroItemSerializer
 from talks.serializers.retro_template_serializer import RetroTemplateSerializer
+from talks.serializers.idea_serializer import (
+    IdeaListSerializer,
+    resolve_voted_idea_ids,
+)
 from core.serializers import UserProfileSerializer
 
 
+class RetroAuthorSerializer(UserProfileSerializer):
+    """
+    Mesmo formato do ``UserProfileSerializer``, lido das anotações e
+    prefetches de ``Retro.objects.with_author_profile()`` (sem query por
+    linha da listagem).
+    """
+
+    ideias_criadas_count = serializers.IntegerField(
+        source="ideias_criadas_total", read_only=True
+    )
+    apresentacoes_count = serializers.IntegerField(
+        source="apresentacoes_total", read_only=True
+    )
+    votos_count = serializers.IntegerField(source="votos_total", read_only=True)
+
+    def get_ideias_criadas(self, obj):
+        return IdeaListSerializer(
+            obj.ideias_criadas_recentes, many=True, context=self.context
+        ).data
+
+    def get_ideias_apresentando(self, obj):
+        return IdeaListSerializer(
+            obj.ideias_apresentando_recentes, many=True, context=self.context
+        ).data
+
+
+class RetroListListSerializer(serializers.ListSerializer):
+    """Resolve ``has_voted`` das ideias de todos os autores numa única query."""
+
+    def to_representation(self, data):
+        retros = list(data)
+        resolve_voted_idea_ids(
+            self.context,
+            [
+                idea
+                for retro in retros
+                for idea in (
+                    *getattr(retro.autor, "ideias_criadas_recentes", ()),
+                    *getattr(retro.autor, "ideias_apresentando_recentes", ()),
+                )
+            ],
+        )
+        return super().to_representation(retros)
+
+
 class RetroListSerializer(serializers.ModelSerializer):
-    autor = UserProfileSerializer(read_only=True)
+    autor = RetroAuthorSerializer(read_only=True)
     template_nome = serializers.CharField(source="template.nome", read_only=True)
     total_items = serializers.IntegerField(read_only=True)
     total_participantes = serializers.IntegerField(read_only=True)
@@ -29,6 +78,7 @@ class RetroListSerializer(serializers.ModelSerializer):
             "created_at",
             "updated_at",
         ]
+        list_serializer_class = RetroListListSerializer
 
 
 class RetroDetailSerializer(serializers.ModelSerializer):
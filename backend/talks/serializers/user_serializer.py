@@ -11,6 +11,17 @@ class UserSerializer(serializers.ModelSerializer):
         read_only_fields = ["id"]
 
 
+class UserAvatarSerializer(serializers.ModelSerializer):
+    """
+    Representação mínima do usuário para listas de avatares.
+    """
+
+    class Meta:
+        model = User
+        fields = ["id", "username", "avatar"]
+        read_only_fields = fields
+
+
 class UserStatsSerializer(serializers.ModelSerializer):
     ideias_criadas_count = serializers.IntegerField(
         source="ideias_criadas.count", read_only=True
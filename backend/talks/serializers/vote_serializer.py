@@ -1,7 +1,7 @@
-from rest_framework.serializers import ModelSerializer
+from rest_framework.serializers import IntegerField, ModelSerializer, Serializer
 
 from talks.models import Vote
-from talks.serializers.user_serializer import UserSerializer
+from talks.serializers.user_serializer import UserAvatarSerializer, UserSerializer
 
 
 class VoteSerializer(ModelSerializer):
@@ -11,3 +11,26 @@ class VoteSerializer(ModelSerializer):
         model = Vote
         fields = ["id", "user", "idea", "created_at"]
         read_only_fields = ["id", "user", "created_at"]
+
+
+class VoterSerializer(ModelSerializer):
+    """
+    Item da lista paginada de votantes (``/api/ideas/{id}/voters/``).
+    """
+
+    user = UserSerializer(read_only=True)
+
+    class Meta:
+        model = Vote
+        fields = ["id", "user", "created_at"]
+        read_only_fields = fields
+
+
+class VoteSummarySerializer(Serializer):
+    """
+    Resumo dos votos de uma ideia (payload de detalhe): total e os votantes
+    mais recentes.
+    """
+
+    total = IntegerField()
+    votantes = UserAvatarSerializer(many=True)
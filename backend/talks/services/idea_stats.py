@@ -0,0 +1,80 @@
+import math
+
+from django.core.cache import cache
+from django.db import transaction
+from django.db.models import Count, Min, Q, Sum
+from django.db.models.signals import post_delete, post_save
+from django.dispatch import receiver
+from django.utils import timezone
+
+from talks.models import Idea, Vote
+
+
+class IdeaStatsService:
+    """
+    Service com o snapshot de estatísticas gerais das ideias (dashboard).
+
+    Todos os totais saem de uma única query com agregações condicionais e o
+    resultado fica em cache até a próxima mudança em ideias/votos ou até a
+    próxima ``data_agendada``, quando uma ideia passa de agendada a concluída.
+    """
+
+    CACHE_KEY = "idea_stats:snapshot"
+    CACHE_TIMEOUT = 3600  # 1 hora
+
+    @staticmethod
+    def snapshot() -> dict:
+        """
+        Retorna as estatísticas gerais (cacheadas).
+
+        Returns:
+            dict: total_ideias, pendentes, agendadas, concluidas,
+            precisa_apresentador e total_votos
+        """
+        stats = cache.get(IdeaStatsService.CACHE_KEY)
+        if stats is None:
+            stats, timeout = IdeaStatsService._compute()
+            cache.set(IdeaStatsService.CACHE_KEY, stats, timeout=timeout)
+        return stats
+
+    @staticmethod
+    def _compute():
+        now = timezone.now()
+        result = Idea.objects.order_by().aggregate(
+            total_ideias=Count("id"),
+            pendentes=Count("id", filter=Q(data_agendada__isnull=True)),
+            agendadas=Count("id", filter=Q(data_agendada__gt=now)),
+            concluidas=Count("id", filter=Q(data_agendada__lte=now)),
+            precisa_apresentador=Count("id", filter=Q(apresentador__isnull=True)),
+            total_votos=Sum("vote_count"),
+            proxima_mudanca=Min("data_agendada", filter=Q(data_agendada__gt=now)),
+        )
+
+        proxima_mudanca = result.pop("proxima_mudanca")
+        result["total_votos"] = result["total_votos"] or 0
+
+        timeout = IdeaStatsService.CACHE_TIMEOUT
+        if proxima_mudanca is not None:
+            seconds = math.ceil((proxima_mudanca - now).total_seconds())
+            timeout = max(1, min(timeout, seconds))
+
+        return result, timeout
+
+    @staticmethod
+    def invalidate() -> None:
+        """
+        Descarta o snapshot agora e, dentro de uma transação, de novo após o
+        commit: um snapshot recalculado por uma leitura concorrente antes do
+        commit (com os totais antigos) também é descartado.
+        """
+        cache.delete(IdeaStatsService.CACHE_KEY)
+        if transaction.get_connection().in_atomic_block:
+            transaction.on_commit(lambda: cache.delete(IdeaStatsService.CACHE_KEY))
+
+
+@receiver(post_save, sender=Idea)
+@receiver(post_delete, sender=Idea)
+@receiver(post_save, sender=Vote)
+@receiver(post_delete, sender=Vote)
+def invalidate_idea_stats(sender, **kwargs):
+    IdeaStatsService.invalidate()
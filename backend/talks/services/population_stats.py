@@ -0,0 +1,61 @@
+from django.contrib.auth import get_user_model
+from django.core.cache import cache
+from django.db import transaction
+
+
+class PopulationStatsService:
+    """
+    Service com estatísticas da população de usuários.
+    Mantém o total de usuários ativos em cache para cálculo de porcentagens.
+    """
+
+    CACHE_KEY = "population_stats:active_users"
+    CACHE_TIMEOUT = 3600  # 1 hora
+
+    @staticmethod
+    def active_user_count() -> int:
+        """
+        Retorna o total de usuários ativos (cacheado).
+
+        Returns:
+            int: Quantidade de usuários com is_active=True
+        """
+        total = cache.get(PopulationStatsService.CACHE_KEY)
+        if total is None:
+            User = get_user_model()
+            total = User.objects.filter(is_active=True).count()
+            cache.set(
+                PopulationStatsService.CACHE_KEY,
+                total,
+                timeout=PopulationStatsService.CACHE_TIMEOUT,
+            )
+        return total
+
+    @staticmethod
+    def vote_percentage(vote_count: int) -> float:
+        """
+        Calcula a porcentagem de usuários ativos representada pelos votos.
+
+        Args:
+            vote_count: Total de votos de usuários ativos
+
+        Returns:
+            float: Valor de 0.0 a 100.0
+        """
+        total_users = PopulationStatsService.active_user_count()
+        if total_users == 0:
+            return 0.0
+        return vote_count * 100.0 / total_users
+
+    @staticmethod
+    def invalidate() -> None:
+        """
+        Descarta o total agora e, dentro de uma transação, de novo após o
+        commit (uma leitura concorrente antes do commit cacheia o valor
+        antigo).
+        """
+        cache.delete(PopulationStatsService.CACHE_KEY)
+        if transaction.get_connection().in_atomic_block:
+            transaction.on_commit(
+                lambda: cache.delete(PopulationStatsService.CACHE_KEY)
+            )
@@ -0,0 +1,97 @@
+"""
+Integration tests for the shared response cache of anonymous idea reads.
+"""
+
+from datetime import timedelta
+
+from django.contrib.auth import get_user_model
+from django.core.cache import cache
+from django.db import connection
+from django.test import TestCase
+from django.test.utils import CaptureQueriesContext
+from django.utils import timezone
+from rest_framework.test import APIClient
+
+from core.models.configuration import SystemConfiguration
+from talks.models import Idea
+from talks.notifications.signals import idea_rescheduled
+
+User = get_user_model()
+
+
+class AnonymousResponseCacheTest(TestCase):
+    """Test that anonymous GETs are served from the shared cache."""
+
+    def setUp(self):
+        cache.clear()
+        self.client = APIClient()
+        SystemConfiguration.objects.create(chapter_enabled=True, retro_enabled=True)
+
+        self.author = User.objects.create_user(username="author", password="test123")
+        self.idea = Idea.objects.create(
+            titulo="Public idea",
+            descricao="Idea shown to visitors",
+            conteudo="<p>Body</p>",
+            autor=self.author,
+            data_agendada=timezone.now() + timedelta(days=2),
+        )
+
+    def tearDown(self):
+        cache.clear()
+
+    def _count_queries(self, url, params=None):
+        with CaptureQueriesContext(connection) as ctx:
+            response = self.client.get(url, params)
+        self.assertEqual(response.status_code, 200)
+        return len(ctx.captured_queries), response
+
+    def test_repeated_anonymous_reads_hit_cache(self):
+        for url in (
+            "/api/ideas/",
+            "/api/ideas/upcoming/",
+            "/api/ideas/timeline/",
+            "/api/ideas/stats/",
+        ):
+            first_queries, first = self._count_queries(url)
+            cached_queries, cached = self._count_queries(url)
+
+            self.assertGreater(first_queries, 0)
+            self.assertEqual(cached_queries, 0)
+            self.assertEqual(first.data, cached.data)
+
+    def test_query_params_are_normalized(self):
+        self._count_queries("/api/ideas/?ordering=vote_count&page=1&search=")
+
+        queries, _ = self._count_queries("/api/ideas/?page=1&ordering=vote_count")
+
+        self.assertEqual(queries, 0)
+
+    def test_authenticated_reads_bypass_cache(self):
+        self._count_queries("/api/ideas/")
+        self.client.force_authenticate(user=self.author)
+
+        queries, response = self._count_queries("/api/ideas/")
+
+        self.assertGreater(queries, 0)
+        self.assertIn("has_voted", response.data["results"][0])
+
+    def test_saves_invalidate_cached_responses(self):
+        self._count_queries("/api/ideas/")
+
+        with self.captureOnCommitCallbacks(execute=True):
+            self.idea.titulo = "Renamed idea"
+            self.idea.save()
+
+        _, response = self._count_queries("/api/ideas/")
+        self.assertEqual(response.data["results"][0]["titulo"], "Renamed idea")
+
+    def test_idea_signals_invalidate_cached_responses(self):
+        self._count_queries("/api/ideas/upcoming/")
+
+        with self.captureOnCommitCallbacks(execute=True):
+            idea_rescheduled.send(
+                sender=self.__class__, idea=self.idea, user=self.author
+            )
+
+        queries, _ = self._count_queries("/api/ideas/upcoming/")
+        self.assertGreater(queries, 0)
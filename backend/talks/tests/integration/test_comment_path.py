@@ -0,0 +1,116 @@
+"""
+Integration tests for the materialized path of comments.
+"""
+
+from django.contrib.auth import get_user_model
+from django.core.cache import cache
+from django.test import TestCase
+from rest_framework import status
+from rest_framework.test import APIClient
+
+from core.models.configuration import SystemConfiguration
+from talks.models import Comment, Idea
+
+User = get_user_model()
+
+
+class CommentPathTest(TestCase):
+    """Test path/depth maintenance, subtree queries and the depth cap."""
+
+    def setUp(self):
+        cache.clear()
+        self.client = APIClient()
+        SystemConfiguration.objects.create(chapter_enabled=True, retro_enabled=True)
+
+        self.user = User.objects.create_user(username="user", password="test123")
+        self.idea = Idea.objects.create(
+            titulo="Discussed idea",
+            descricao="Idea with nested comments",
+            conteudo="<p>Body</p>",
+            autor=self.user,
+        )
+        self.client.force_authenticate(user=self.user)
+
+    def tearDown(self):
+        cache.clear()
+
+    def _comment(self, parent=None, idea=None):
+        return Comment.objects.create(
+            idea=idea or self.idea, user=self.user, conteudo="Comment", parent=parent
+        )
+
+    def test_path_and_depth_on_create(self):
+        root = self._comment()
+        reply = self._comment(parent=root)
+        nested = self._comment(parent=reply)
+
+        self.assertEqual(root.depth, 0)
+        self.assertEqual(nested.depth, 2)
+        self.assertEqual(root.path, f"{root.pk:010d}/")
+        self.assertEqual(nested.path, f"{root.path}{reply.pk:010d}/{nested.pk:010d}/")
+
+        nested.refresh_from_db()
+        self.assertEqual(nested.path, f"{reply.path}{nested.pk:010d}/")
+
+    def test_subtree_is_ordered_and_counted(self):
+        root = self._comment()
+        first = self._comment(parent=root)
+        first_child = self._comment(parent=first)
+        second = self._comment(parent=root)
+        other_root = self._comment()
+        self._comment(parent=other_root)
+
+        subtree = list(Comment.objects.subtree(root))
+        self.assertEqual(subtree, [root, first, first_child, second])
+        self.assertEqual(Comment.objects.subtree(root, include_self=False).count(), 3)
+
+    def test_delete_removes_subtree(self):
+        root = self._comment()
+        reply = self._comment(parent=root)
+        self._comment(parent=reply)
+        other_root = self._comment()
+
+        root.delete()
+
+        self.assertEqual(list(Comment.objects.all()), [other_root])
+
+    def test_depth_cap(self):
+        parent = self._comment()
+        for _ in range(Comment.MAX_DEPTH):
+            parent = self._comment(parent=parent)
+
+        response = self.client.post(
+            "/api/comments/",
+            {"idea": self.idea.id, "conteudo": "Too deep", "parent": parent.id},
+            format="json",
+        )
+
+        self.assertEqual(response.status_code, status.HTTP_400_BAD_REQUEST)
+        self.assertIn("parent", response.data)
+
+    def test_reply_must_belong_to_same_idea(self):
+        other_idea = Idea.objects.create(
+            titulo="Other idea",
+            descricao="Another idea",
+            conteudo="<p>Body</p>",
+            autor=self.user,
+        )
+        parent = self._comment(idea=other_idea)
+
+        response = self.client.post(
+            "/api/comments/",
+            {"idea": self.idea.id, "conteudo": "Reply", "parent": parent.id},
+            format="json",
+        )
+
+        self.assertEqual(response.status_code, status.HTTP_400_BAD_REQUEST)
+
+    def test_comment_cannot_be_moved(self):
+        root = self._comment()
+        reply = self._comment(parent=root)
+
+        response = self.client.patch(
+            f"/api/comments/{reply.id}/", {"parent": None}, format="json"
+        )
+
+        self.assertEqual(response.status_code, status.HTTP_400_BAD_REQUEST)
@@ -0,0 +1,122 @@
+"""
+Integration tests for paginated comment threads with lazy reply loading.
+"""
+
+from django.contrib.auth import get_user_model
+from django.core.cache import cache
+from django.db import connection
+from django.test import TestCase
+from django.test.utils import CaptureQueriesContext
+from rest_framework.test import APIClient
+
+from core.models.configuration import SystemConfiguration
+from talks.models import Comment, Idea
+
+User = get_user_model()
+
+
+class CommentThreadsTest(TestCase):
+    """Test /api/comments/threads/ and /api/comments/{id}/replies/."""
+
+    def setUp(self):
+        cache.clear()
+        self.client = APIClient()
+        SystemConfiguration.objects.create(chapter_enabled=True, retro_enabled=True)
+
+        self.user = User.objects.create_user(username="user", password="test123")
+        self.idea = Idea.objects.create(
+            titulo="Discussed idea",
+            descricao="Idea with threads",
+            conteudo="<p>Body</p>",
+            autor=self.user,
+        )
+        self.client.force_authenticate(user=self.user)
+
+    def tearDown(self):
+        cache.clear()
+
+    def _comment(self, parent=None, conteudo="Comment"):
+        return Comment.objects.create(
+            idea=self.idea, user=self.user, conteudo=conteudo, parent=parent
+        )
+
+    def _threads(self, **params):
+        response = self.client.get(
+            "/api/comments/threads/", {"idea": self.idea.id, **params}
+        )
+        self.assertEqual(response.status_code, 200)
+        return response
+
+    def test_threads_include_first_replies_and_counts(self):
+        root = self._comment()
+        replies = [self._comment(parent=root, conteudo=f"Reply {i}") for i in range(5)]
+        self._comment(parent=replies[0])
+        quiet_root = self._comment()
+
+        response = self._threads()
+        threads = response.data["results"]
+
+        self.assertEqual([t["id"] for t in threads], [root.id, quiet_root.id])
+        self.assertEqual(threads[0]["reply_count"], 5)
+        self.assertEqual(
+            [r["id"] for r in threads[0]["respostas"]], [r.id for r in replies[:3]]
+        )
+        self.assertEqual(threads[0]["respostas"][0]["reply_count"], 1)
+        self.assertIsNotNone(threads[0]["respostas_next"])
+        self.assertEqual(threads[1]["reply_count"], 0)
+        self.assertIsNone(threads[1]["respostas_next"])
+
+    def test_load_more_replies_follows_cursor(self):
+        root = self._comment()
+        replies = [self._comment(parent=root, conteudo=f"Reply {i}") for i in range(5)]
+
+        thread = self._threads(respostas_por_thread=2).data["results"][0]
+        response = self.client.get(f'{thread["respostas_next"]}&page_size=2')
+
+        self.assertEqual(
+            [r["id"] for r in response.data["results"]], [r.id for r in replies[2:4]]
+        )
+        response = self.client.get(response.data["next"])
+        self.assertEqual([r["id"] for r in response.data["results"]], [replies[4].id])
+        self.assertIsNone(response.data["next"])
+
+    def test_threads_are_cursor_paginated(self):
+        roots = [self._comment() for _ in range(3)]
+
+        response = self._threads(page_size=2)
+        self.assertEqual(len(response.data["results"]), 2)
+
+        response = self.client.get(response.data["next"])
+        self.assertEqual([t["id"] for t in response.data["results"]], [roots[2].id])
+
+    def test_query_count_does_not_grow_with_threads(self):
+        root = self._comment()
+        self._comment(parent=root)
+        self._threads()  # aquece o cache de configuração
+        with CaptureQueriesContext(connection) as small:
+            self._threads()
+
+        for _ in range(5):
+            root = self._comment()
+            for _ in range(4):
+                self._comment(parent=root)
+        with CaptureQueriesContext(connection) as large:
+            self._threads()
+
+        self.assertEqual(len(small.captured_queries), len(large.captured_queries))
+
+    def test_idea_required(self):
+        response = self.client.get("/api/comments/threads/")
+        self.assertEqual(response.status_code, 400)
+
+    def test_idea_detail_carries_only_summary(self):
+        root = self._comment()
+        self._comment(parent=root)
+        self._comment()
+
+        response = self.client.get(f"/api/ideas/{self.idea.id}/")
+
+        self.assertNotIn("comentarios", response.data)
+        self.assertEqual(response.data["comentarios_resumo"]["total"], 3)
+        self.assertEqual(response.data["comentarios_resumo"]["threads"], 2)
+        self.assertIsNotNone(response.data["comentarios_resumo"]["ultimo_em"])
@@ -0,0 +1,159 @@
+"""
+Integration tests for ETag / Last-Modified conditional GETs.
+"""
+
+from django.contrib.auth import get_user_model
+from django.core.cache import cache
+from django.db import connection
+from django.test import TestCase
+from django.test.utils import CaptureQueriesContext
+from rest_framework.test import APIClient
+
+from core.models.configuration import SystemConfiguration
+from talks.models import Comment, Idea, Retro, RetroItem, RetroTemplate
+
+User = get_user_model()
+
+
+class ConditionalGetTestMixin:
+    def _get(self, url, etag=None, **headers):
+        if etag:
+            headers["HTTP_IF_NONE_MATCH"] = etag
+        return self.client.get(url, **headers)
+
+    def _assert_not_modified(self, url, etag):
+        with CaptureQueriesContext(connection) as ctx:
+            response = self._get(url, etag)
+        self.assertEqual(response.status_code, 304)
+        self.assertEqual(response["ETag"], etag)
+        self.assertEqual(len(ctx.captured_queries), 0)
+
+
+class IdeaConditionalGetTest(ConditionalGetTestMixin, TestCase):
+    """Test 304 responses for the idea list and detail."""
+
+    def setUp(self):
+        cache.clear()
+        self.client = APIClient()
+        SystemConfiguration.objects.create(chapter_enabled=True, retro_enabled=True)
+
+        self.author = User.objects.create_user(username="author", password="test123")
+        self.voter = User.objects.create_user(username="voter", password="test123")
+        self.idea = Idea.objects.create(
+            titulo="Conditional idea",
+            descricao="Idea used to test ETags",
+            conteudo="<p>Body</p>",
+            autor=self.author,
+        )
+        self.client.force_authenticate(user=self.voter)
+        self.list_url = "/api/ideas/"
+        self.detail_url = f"/api/ideas/{self.idea.id}/"
+
+    def tearDown(self):
+        cache.clear()
+
+    def test_list_and_detail_return_validators(self):
+        for url in (self.list_url, self.detail_url):
+            response = self._get(url)
+            self.assertEqual(response.status_code, 200)
+            self.assertTrue(response["ETag"].startswith('"'))
+            self.assertIn("Last-Modified", response)
+
+    def test_matching_etag_returns_304_without_queries(self):
+        for url in (self.list_url, self.detail_url):
+            etag = self._get(url)["ETag"]
+            self._assert_not_modified(url, etag)
+
+    def test_if_modified_since_returns_304(self):
+        last_modified = self._get(self.list_url)["Last-Modified"]
+
+        response = self._get(self.list_url, HTTP_IF_MODIFIED_SINCE=last_modified)
+
+        self.assertEqual(response.status_code, 304)
+
+    def test_vote_changes_list_and_detail_etags(self):
+        list_etag = self._get(self.list_url)["ETag"]
+        detail_etag = self._get(self.detail_url)["ETag"]
+
+        with self.captureOnCommitCallbacks(execute=True):
+            self.client.post(f"{self.detail_url}vote/")
+
+        response = self._get(self.list_url, list_etag)
+        self.assertEqual(response.status_code, 200)
+        self.assertTrue(response.data["results"][0]["has_voted"])
+        self.assertEqual(self._get(self.detail_url, detail_etag).status_code, 200)
+
+    def test_comment_changes_list_and_detail_etags(self):
+        list_etag = self._get(self.list_url)["ETag"]
+        detail_etag = self._get(self.detail_url)["ETag"]
+
+        with self.captureOnCommitCallbacks(execute=True):
+            Comment.objects.create(idea=self.idea, user=self.voter, conteudo="Hi")
+
+        # A listagem exibe comment_count/last_comment_at
+        self.assertEqual(self._get(self.list_url, list_etag).status_code, 200)
+        self.assertEqual(self._get(self.detail_url, detail_etag).status_code, 200)
+
+    def test_etag_depends_on_user_and_query(self):
+        etag = self._get(self.list_url)["ETag"]
+
+        self.assertNotEqual(self._get(f"{self.list_url}?page=1")["ETag"], etag)
+
+        self.client.force_authenticate(user=self.author)
+        self.assertEqual(self._get(self.list_url, etag).status_code, 200)
+
+    def test_commit_drops_versions_read_during_transaction(self):
+        with self.captureOnCommitCallbacks(execute=True):
+            self.idea.save()
+            etag = self._get(self.list_url)["ETag"]
+
+        self.assertEqual(self._get(self.list_url, etag).status_code, 200)
+
+
+class RetroConditionalGetTest(ConditionalGetTestMixin, TestCase):
+    """Test 304 responses for the retro detail."""
+
+    def setUp(self):
+        cache.clear()
+        self.client = APIClient()
+        SystemConfiguration.objects.create(chapter_enabled=True, retro_enabled=True)
+
+        self.user = User.objects.create_user(username="user", password="test123")
+        template = RetroTemplate.objects.create(
+            nome="Template",
+            categorias=[{"slug": "went_well", "nome": "Foi bem"}],
+        )
+        self.retro = Retro.objects.create(
+            titulo="Retro", template=template, autor=self.user
+        )
+        self.retro.participantes.add(self.user)
+        self.item = RetroItem.objects.create(
+            retro=self.retro, categoria="went_well", conteudo="Item", autor=self.user
+        )
+        self.client.force_authenticate(user=self.user)
+        self.url = f"/api/retros/{self.retro.id}/"
+
+    def tearDown(self):
+        cache.clear()
+
+    def test_matching_etag_returns_304_without_queries(self):
+        etag = self._get(self.url)["ETag"]
+        self._assert_not_modified(self.url, etag)
+
+    def test_item_vote_changes_etag(self):
+        etag = self._get(self.url)["ETag"]
+
+        with self.captureOnCommitCallbacks(execute=True):
+            self.item.toggle_vote(self.user)
+
+        self.assertEqual(self._get(self.url, etag).status_code, 200)
+
+    def test_new_item_changes_etag(self):
+        etag = self._get(self.url)["ETag"]
+
+        with self.captureOnCommitCallbacks(execute=True):
+            RetroItem.objects.create(
+                retro=self.retro, categoria="went_well", conteudo="New", autor=self.user
+            )
+
+        self.assertEqual(self._get(self.url, etag).status_code, 200)
@@ -0,0 +1,92 @@
+"""
+Integration tests for the denormalized Idea.comment_count / last_comment_at.
+"""
+
+from django.contrib.auth import get_user_model
+from django.core.cache import cache
+from django.test import TestCase
+from rest_framework import status
+from rest_framework.test import APIClient
+
+from core.models.configuration import SystemConfiguration
+from talks.models import Comment, Idea
+
+User = get_user_model()
+
+
+class IdeaCommentCountTest(TestCase):
+    """Test that comment signals keep the idea comment counters in sync."""
+
+    def setUp(self):
+        cache.clear()
+        self.client = APIClient()
+        SystemConfiguration.objects.create(chapter_enabled=True, retro_enabled=True)
+
+        self.user = User.objects.create_user(username="user", password="test123")
+        self.idea = self._create_idea("Discussed idea")
+        self.client.force_authenticate(user=self.user)
+
+    def tearDown(self):
+        cache.clear()
+
+    def _create_idea(self, titulo):
+        return Idea.objects.create(
+            titulo=titulo,
+            descricao="Idea used to count comments",
+            conteudo="<p>Body</p>",
+            autor=self.user,
+        )
+
+    def _post_comment(self, idea, parent=None):
+        response = self.client.post(
+            "/api/comments/",
+            {"idea": idea.id, "conteudo": "Comment", "parent": parent},
+            format="json",
+        )
+        self.assertEqual(response.status_code, status.HTTP_201_CREATED)
+        return response.data
+
+    def test_create_and_delete_update_counters(self):
+        root = self._post_comment(self.idea)
+        self._post_comment(self.idea, parent=root["id"])
+        last = self._post_comment(self.idea)
+
+        self.idea.refresh_from_db()
+        self.assertEqual(self.idea.comment_count, 3)
+        self.assertEqual(
+            self.idea.last_comment_at, Comment.objects.get(pk=last["id"]).created_at
+        )
+
+        # Deletar a raiz remove a thread inteira
+        self.client.delete(f"/api/comments/{root['id']}/")
+        self.idea.refresh_from_db()
+        self.assertEqual(self.idea.comment_count, 1)
+
+        self.client.delete(f"/api/comments/{last['id']}/")
+        self.idea.refresh_from_db()
+        self.assertEqual(self.idea.comment_count, 0)
+        self.assertIsNone(self.idea.last_comment_at)
+
+    def test_deleting_commenter_recounts(self):
+        other = User.objects.create_user(username="other", password="test123")
+        self._post_comment(self.idea)
+        self.client.force_authenticate(user=other)
+        self._post_comment(self.idea)
+
+        other.delete()
+
+        self.idea.refresh_from_db()
+        self.assertEqual(self.idea.comment_count, 1)
+
+    def test_list_exposes_counters_and_sorts_by_most_discussed(self):
+        quiet = self._create_idea("Quiet idea")
+        self._post_comment(self.idea)
+        self._post_comment(self.idea)
+
+        response = self.client.get("/api/ideas/", {"ordering": "-comment_count"})
+        results = response.data["results"]
+
+        self.assertEqual([item["id"] for item in results], [self.idea.id, quiet.id])
+        self.assertEqual(results[0]["comment_count"], 2)
+        self.assertIsNotNone(results[0]["last_comment_at"])
+        self.assertIsNone(results[1]["last_comment_at"])
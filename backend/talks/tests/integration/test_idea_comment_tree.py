@@ -0,0 +1,93 @@
+"""
+Integration tests for the single-query comment tree in idea detail.
+"""
+
+from django.contrib.auth import get_user_model
+from django.core.cache import cache
+from django.db import connection
+from django.test import TestCase
+from django.test.utils import CaptureQueriesContext
+from rest_framework.test import APIClient
+
+from core.models.configuration import SystemConfiguration
+from talks.models import Comment, Idea
+
+User = get_user_model()
+
+
+class IdeaCommentTreeTest(TestCase):
+    """Test that idea detail loads the whole comment tree in one query."""
+
+    def setUp(self):
+        cache.clear()
+        self.client = APIClient()
+        SystemConfiguration.objects.create(chapter_enabled=True, retro_enabled=True)
+
+        self.author = User.objects.create_user(username="author", password="test123")
+        self.idea = Idea.objects.create(
+            titulo="Discussed idea",
+            descricao="Idea with a long discussion",
+            conteudo="<p>Body</p>",
+            autor=self.author,
+        )
+        self.client.force_authenticate(user=self.author)
+        self.url = f"/api/ideas/{self.idea.id}/?expand=comentarios"
+
+    def tearDown(self):
+        cache.clear()
+
+    def _comment(self, parent=None, user=None):
+        return Comment.objects.create(
+            idea=self.idea,
+            user=user or self.author,
+            conteudo="Comment",
+            parent=parent,
+        )
+
+    def _count_detail_queries(self):
+        cache.clear()
+        with CaptureQueriesContext(connection) as ctx:
+            response = self.client.get(self.url)
+        self.assertEqual(response.status_code, 200)
+        return len(ctx.captured_queries), response
+
+    def test_tree_structure(self):
+        root = self._comment()
+        reply = self._comment(parent=root)
+        nested = self._comment(parent=reply)
+        other_root = self._comment()
+
+        _, response = self._count_detail_queries()
+        comentarios = response.data["comentarios"]
+
+        self.assertEqual([c["id"] for c in comentarios], [root.id, other_root.id])
+        self.assertEqual(comentarios[0]["respostas"][0]["id"], reply.id)
+        self.assertEqual(
+            comentarios[0]["respostas"][0]["respostas"][0]["id"], nested.id
+        )
+        self.assertEqual(comentarios[1]["respostas"], [])
+        self.assertEqual(comentarios[0]["user"]["username"], "author")
+
+    def test_query_count_does_not_grow_with_replies(self):
+        self._comment()
+        baseline, _ = self._count_detail_queries()
+
+        parent = self._comment()
+        for i in range(10):
+            user = User.objects.create_user(username=f"user{i}", password="test123")
+            parent = self._comment(parent=parent, user=user)
+            self._comment(parent=parent, user=user)
+
+        queries, _ = self._count_detail_queries()
+
+        self.assertEqual(queries, baseline)
+
+    def test_as_tree_uses_one_query(self):
+        root = self._comment()
+        self._comment(parent=root)
+
+        with self.assertNumQueries(1):
+            roots = self.idea.comentarios.as_tree()
+            replies = roots[0].respostas_carregadas
+
+        self.assertEqual(len(replies), 1)
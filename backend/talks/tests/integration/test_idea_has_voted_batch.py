@@ -0,0 +1,68 @@
+"""
+Integration tests for batch-resolved has_voted in idea list payloads.
+"""
+
+from django.contrib.auth import get_user_model
+from django.core.cache import cache
+from django.db import connection
+from django.test import TestCase
+from django.test.utils import CaptureQueriesContext
+from rest_framework.test import APIClient
+
+from core.models.configuration import SystemConfiguration
+from talks.models import Idea
+
+User = get_user_model()
+
+
+class IdeaHasVotedBatchTest(TestCase):
+    """Test that has_voted costs one query per page, not one per idea."""
+
+    def setUp(self):
+        cache.clear()
+        self.client = APIClient()
+        SystemConfiguration.objects.create(chapter_enabled=True, retro_enabled=True)
+
+        self.author = User.objects.create_user(username="author", password="test123")
+        self.voter = User.objects.create_user(username="voter", password="test123")
+        self.client.force_authenticate(user=self.voter)
+
+    def tearDown(self):
+        cache.clear()
+
+    def _create_ideas(self, total):
+        return [
+            Idea.objects.create(
+                titulo=f"Idea number {i}",
+                descricao="Idea used to count queries",
+                conteudo="<p>Body</p>",
+                autor=self.author,
+            )
+            for i in range(total)
+        ]
+
+    def _count_list_queries(self):
+        with CaptureQueriesContext(connection) as ctx:
+            response = self.client.get("/api/ideas/")
+        self.assertEqual(response.status_code, 200)
+        return len(ctx.captured_queries), response
+
+    def test_has_voted_reflects_user_votes(self):
+        voted, not_voted = self._create_ideas(2)
+        voted.toggle_vote(self.voter)
+
+        _, response = self._count_list_queries()
+        has_voted = {item["id"]: item["has_voted"] for item in response.data["results"]}
+
+        self.assertTrue(has_voted[voted.id])
+        self.assertFalse(has_voted[not_voted.id])
+
+    def test_query_count_does_not_grow_with_page_size(self):
+        self._create_ideas(2)
+        self._count_list_queries()  # aquece o cache de configuração
+        small_page_queries, _ = self._count_list_queries()
+
+        self._create_ideas(8)
+        large_page_queries, _ = self._count_list_queries()
+
+        self.assertEqual(small_page_queries, large_page_queries)
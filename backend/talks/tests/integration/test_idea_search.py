@@ -0,0 +1,104 @@
+"""
+Integration tests for idea full-text search.
+"""
+
+from django.contrib.auth import get_user_model
+from django.core.cache import cache
+from django.test import TestCase
+from rest_framework.test import APIClient
+
+from core.models.configuration import SystemConfiguration
+from talks.models import Idea
+
+User = get_user_model()
+
+
+class IdeaSearchTest(TestCase):
+    """Test search over the plain-text document of each idea."""
+
+    def setUp(self):
+        cache.clear()
+        self.client = APIClient()
+        SystemConfiguration.objects.create(chapter_enabled=True, retro_enabled=True)
+
+        self.author = User.objects.create_user(username="author", password="test123")
+        self.async_idea = Idea.objects.create(
+            titulo="Introdução à programação assíncrona",
+            descricao="Asyncio na prática",
+            conteudo="<p>Event loop, <strong>corrotinas</strong> e tasks</p>",
+            autor=self.author,
+        )
+        self.orm_idea = Idea.objects.create(
+            titulo="Django ORM avançado",
+            descricao="Subqueries, window functions e corrotinas",
+            conteudo="<p>Consultas eficientes</p>",
+            autor=self.author,
+        )
+
+    def tearDown(self):
+        cache.clear()
+
+    def _search(self, term):
+        response = self.client.get("/api/ideas/", {"search": term})
+        self.assertEqual(response.status_code, 200)
+        return response.data["results"]
+
+    def test_search_document_strips_markup(self):
+        self.assertNotIn("<strong>", self.async_idea.search_document)
+        self.assertIn("corrotinas", self.async_idea.search_document)
+
+    def test_search_ignores_html_markup(self):
+        self.assertEqual(self._search("strong"), [])
+
+    def test_search_folds_accents(self):
+        results = self._search("introducao")
+        self.assertEqual([item["id"] for item in results], [self.async_idea.id])
+
+    def test_search_returns_highlighted_snippet(self):
+        results = self._search("asyncio")
+        self.assertIn("<mark>Asyncio</mark>", results[0]["search_snippet"])
+
+    def test_snippet_escapes_document_text(self):
+        Idea.objects.create(
+            titulo="Segurança no frontend",
+            descricao="XSS na prática",
+            conteudo="<p>&lt;script&gt;alert(1)&lt;/script&gt; sanitizacao</p>",
+            autor=self.author,
+        )
+        snippet = self._search("sanitizacao")[0]["search_snippet"]
+        self.assertNotIn("<script>", snippet)
+        self.assertIn("&lt;script&gt;", snippet)
+        self.assertIn("<mark>sanitizacao</mark>", snippet)
+
+    def test_search_ranks_more_relevant_first(self):
+        results = self._search("corrotinas assíncrona")
+        self.assertEqual([item["id"] for item in results], [self.async_idea.id])
+
+        # A mais antiga é a mais relevante: relevância vence a data
+        self.async_idea.descricao = "Corrotinas, corrotinas e mais corrotinas"
+        self.async_idea.save()
+        results = self._search("corrotinas")
+        self.assertEqual(
+            [item["id"] for item in results], [self.async_idea.id, self.orm_idea.id]
+        )
+
+    def test_search_rejects_cursor_pagination(self):
+        response = self.client.get(
+            "/api/ideas/", {"search": "corrotinas", "pagination": "cursor"}
+        )
+        self.assertEqual(response.status_code, 400)
+        self.assertIn("search", response.data)
+
+    def test_updates_and_deletes_keep_index_in_sync(self):
+        self.orm_idea.titulo = "Django ORM e GraphQL"
+        self.orm_idea.save()
+        self.assertEqual(
+            [item["id"] for item in self._search("graphql")], [self.orm_idea.id]
+        )
+
+        self.orm_idea.delete()
+        self.assertEqual(self._search("graphql"), [])
+
+    def test_list_without_search_has_no_snippet(self):
+        response = self.client.get("/api/ideas/")
+        self.assertNotIn("search_snippet", response.data["results"][0])
@@ -0,0 +1,80 @@
+"""
+Integration tests for ?fields= / ?expand= on idea endpoints.
+"""
+
+from django.contrib.auth import get_user_model
+from django.core.cache import cache
+from django.db import connection
+from django.test import TestCase
+from django.test.utils import CaptureQueriesContext
+from rest_framework.test import APIClient
+
+from core.models.configuration import SystemConfiguration
+from talks.models import Idea, Tag
+
+User = get_user_model()
+
+
+class IdeaSparseFieldsetTest(TestCase):
+    """Test that requested fields drive both the payload and the queries."""
+
+    def setUp(self):
+        cache.clear()
+        self.client = APIClient()
+        SystemConfiguration.objects.create(chapter_enabled=True, retro_enabled=True)
+
+        self.author = User.objects.create_user(username="author", password="test123")
+        self.idea = Idea.objects.create(
+            titulo="Sparse idea",
+            descricao="Idea used to test sparse fieldsets",
+            conteudo="<p>Very long body</p>",
+            autor=self.author,
+        )
+        self.idea.tags.add(Tag.objects.create(nome="Python"))
+        self.idea.toggle_vote(self.author)
+
+    def tearDown(self):
+        cache.clear()
+
+    def test_fields_restricts_payload_and_queries(self):
+        with CaptureQueriesContext(connection) as ctx:
+            response = self.client.get(
+                "/api/ideas/", {"fields": "titulo,tags,vote_count"}
+            )
+
+        item = response.data["results"][0]
+        self.assertEqual(set(item), {"id", "titulo", "tags", "vote_count"})
+        self.assertEqual(item["vote_count"], 1)
+
+        sql = " ".join(query["sql"] for query in ctx.captured_queries)
+        self.assertNotIn('"talks_vote"', sql)
+        self.assertNotIn('"conteudo"', sql)
+        self.assertNotIn('"core_user"."username"', sql)
+
+    def test_list_keeps_default_payload(self):
+        response = self.client.get("/api/ideas/")
+        item = response.data["results"][0]
+        self.assertEqual(item["conteudo"], "<p>Very long body</p>")
+        self.assertNotIn("search_snippet", item)
+
+        # Clientes que não precisam do conteúdo o deixam de fora com ?fields=
+        response = self.client.get("/api/ideas/", {"fields": "id,titulo"})
+        self.assertNotIn("conteudo", response.data["results"][0])
+
+    def test_detail_keeps_full_payload_by_default(self):
+        response = self.client.get(f"/api/ideas/{self.idea.id}/")
+
+        self.assertEqual(response.data["conteudo"], "<p>Very long body</p>")
+        self.assertEqual(response.data["votos_resumo"]["total"], 1)
+        self.assertNotIn("votos", response.data)
+
+        response = self.client.get(f"/api/ideas/{self.idea.id}/", {"expand": "votos"})
+        self.assertEqual(len(response.data["votos"]), 1)
+
+    def test_profile_lists_still_render(self):
+        self.client.force_authenticate(user=self.author)
+
+        response = self.client.get("/api/auth/profile/")
+
+        self.assertEqual(response.status_code, 200)
+        self.assertEqual(response.data["ideias_criadas"][0]["id"], self.idea.id)
@@ -0,0 +1,123 @@
+"""
+Integration tests for the cached idea statistics snapshot.
+"""
+
+from datetime import timedelta
+
+from django.contrib.auth import get_user_model
+from django.core.cache import cache
+from django.db import connection
+from django.test import TestCase
+from django.test.utils import CaptureQueriesContext
+from django.utils import timezone
+from rest_framework.test import APIClient
+
+from core.models.configuration import SystemConfiguration
+from talks.models import Idea
+from talks.services.idea_stats import IdeaStatsService
+
+User = get_user_model()
+
+
+class IdeaStatsSnapshotTest(TestCase):
+    """Test the single-query, cached /api/ideas/stats/ snapshot."""
+
+    def setUp(self):
+        cache.clear()
+        self.client = APIClient()
+        SystemConfiguration.objects.create(chapter_enabled=True, retro_enabled=True)
+
+        self.author = User.objects.create_user(username="author", password="test123")
+        self.voter = User.objects.create_user(username="voter", password="test123")
+        now = timezone.now()
+        self.pending = self._create_idea("Pending idea")
+        self.scheduled = self._create_idea(
+            "Scheduled idea",
+            data_agendada=now + timedelta(days=3),
+            apresentador=self.author,
+        )
+        self.done = self._create_idea(
+            "Done idea", data_agendada=now - timedelta(days=3), apresentador=self.author
+        )
+        self.pending.toggle_vote(self.voter)
+        self.scheduled.toggle_vote(self.voter)
+
+    def tearDown(self):
+        cache.clear()
+
+    def _create_idea(self, titulo, **kwargs):
+        return Idea.objects.create(
+            titulo=titulo,
+            descricao="Idea used in stats",
+            conteudo="<p>Body</p>",
+            autor=self.author,
+            **kwargs,
+        )
+
+    def _get_stats(self):
+        response = self.client.get("/api/ideas/stats/")
+        self.assertEqual(response.status_code, 200)
+        return response.data
+
+    def test_stats_totals(self):
+        self.assertEqual(
+            self._get_stats(),
+            {
+                "total_ideias": 3,
+                "pendentes": 1,
+                "agendadas": 1,
+                "concluidas": 1,
+                "precisa_apresentador": 1,
+                "total_votos": 2,
+            },
+        )
+
+    def test_snapshot_uses_one_query_and_is_cached(self):
+        with CaptureQueriesContext(connection) as ctx:
+            IdeaStatsService.snapshot()
+        self.assertEqual(len(ctx.captured_queries), 1)
+
+        with CaptureQueriesContext(connection) as ctx:
+            IdeaStatsService.snapshot()
+        self.assertEqual(len(ctx.captured_queries), 0)
+
+    def test_idea_and_vote_changes_invalidate_snapshot(self):
+        self.assertEqual(self._get_stats()["total_ideias"], 3)
+
+        self._create_idea("New idea")
+        self.assertEqual(self._get_stats()["total_ideias"], 4)
+
+        self.done.toggle_vote(self.voter)
+        self.assertEqual(self._get_stats()["total_votos"], 3)
+
+        self.pending.delete()
+        stats = self._get_stats()
+        self.assertEqual(stats["total_ideias"], 3)
+        self.assertEqual(stats["total_votos"], 2)
+
+    def test_snapshot_cached_before_commit_is_discarded(self):
+        self.assertEqual(IdeaStatsService.snapshot()["total_votos"], 2)
+
+        with self.captureOnCommitCallbacks(execute=True):
+            self.done.toggle_vote(self.voter)
+            # Leitura concorrente antes do commit recalcula com os totais antigos
+            cache.set(IdeaStatsService.CACHE_KEY, {"total_votos": 2})
+
+        self.assertEqual(IdeaStatsService.snapshot()["total_votos"], 3)
+
+    def test_timeout_ends_at_next_scheduled_date(self):
+        Idea.objects.filter(pk=self.scheduled.pk).update(
+            data_agendada=timezone.now() + timedelta(minutes=10)
+        )
+
+        _, timeout = IdeaStatsService._compute()
+
+        self.assertLessEqual(timeout, 600)
+        self.assertGreater(timeout, 590)
+
+    def test_timeout_defaults_without_future_dates(self):
+        Idea.objects.filter(pk=self.scheduled.pk).delete()
+
+        _, timeout = IdeaStatsService._compute()
+
+        self.assertEqual(timeout, IdeaStatsService.CACHE_TIMEOUT)
@@ -0,0 +1,124 @@
+"""
+Integration tests for the persisted Idea.vote_count counter.
+"""
+
+from io import StringIO
+
+from django.contrib.auth import get_user_model
+from django.core.cache import cache
+from django.core.management import call_command
+from django.test import TestCase
+from rest_framework import status
+from rest_framework.test import APIClient
+
+from core.models.configuration import SystemConfiguration
+from talks.models import Idea, Vote
+
+User = get_user_model()
+
+
+class IdeaVoteCounterTest(TestCase):
+    """Test that vote_count follows votes, user activation and repair."""
+
+    def setUp(self):
+        cache.clear()
+        self.client = APIClient()
+        SystemConfiguration.objects.create(chapter_enabled=True, retro_enabled=True)
+
+        self.author = User.objects.create_user(username="author", password="test123")
+        self.voter = User.objects.create_user(username="voter", password="test123")
+        self.idea = Idea.objects.create(
+            titulo="Counter idea",
+            descricao="Idea used to test counters",
+            conteudo="<p>Body</p>",
+            autor=self.author,
+        )
+
+    def tearDown(self):
+        cache.clear()
+
+    def test_vote_toggle_updates_counter_and_returns_it(self):
+        self.client.force_authenticate(user=self.voter)
+
+        response = self.client.post(f"/api/ideas/{self.idea.id}/vote/")
+        self.assertEqual(response.status_code, status.HTTP_201_CREATED)
+        self.assertEqual(response.data["vote_count"], 1)
+
+        response = self.client.post(f"/api/ideas/{self.idea.id}/vote/")
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+        self.assertEqual(response.data["vote_count"], 0)
+
+        self.idea.refresh_from_db()
+        self.assertEqual(self.idea.vote_count, 0)
+
+    def test_deactivating_voter_recounts_votes(self):
+        self.idea.toggle_vote(self.voter)
+        self.assertEqual(self.idea.vote_count, 1)
+
+        self.voter.is_active = False
+        self.voter.save()
+        self.idea.refresh_from_db()
+        self.assertEqual(self.idea.vote_count, 0)
+
+        self.voter.is_active = True
+        self.voter.save()
+        self.idea.refresh_from_db()
+        self.assertEqual(self.idea.vote_count, 1)
+
+    def test_deleting_voter_recounts_votes(self):
+        self.idea.toggle_vote(self.voter)
+
+        self.voter.delete()
+
+        self.idea.refresh_from_db()
+        self.assertEqual(self.idea.vote_count, 0)
+
+    def test_admin_vote_changes_recount(self):
+        superuser = User.objects.create_superuser(username="root", password="test123")
+        self.client.force_login(superuser)
+
+        response = self.client.post(
+            "/admin/talks/vote/add/", {"user": self.voter.pk, "idea": self.idea.pk}
+        )
+        self.assertEqual(response.status_code, 302)
+        self.idea.refresh_from_db()
+        self.assertEqual(self.idea.vote_count, 1)
+
+        vote = Vote.objects.get(user=self.voter, idea=self.idea)
+        response = self.client.post(
+            f"/admin/talks/vote/{vote.pk}/delete/", {"post": "yes"}
+        )
+        self.assertEqual(response.status_code, 302)
+        self.idea.refresh_from_db()
+        self.assertEqual(self.idea.vote_count, 0)
+
+    def test_votos_minimos_and_ordering_use_counter(self):
+        other = Idea.objects.create(
+            titulo="Other idea",
+            descricao="Another idea without votes",
+            conteudo="<p>Body</p>",
+            autor=self.author,
+        )
+        self.idea.toggle_vote(self.voter)
+
+        response = self.client.get("/api/ideas/", {"votos_minimos": 1})
+        ids = [item["id"] for item in response.data["results"]]
+        self.assertEqual(ids, [self.idea.id])
+
+        response = self.client.get("/api/ideas/", {"ordering": "vote_count"})
+        ids = [item["id"] for item in response.data["results"]]
+        self.assertEqual(ids, [other.id, self.idea.id])
+
+    def test_repair_command_fixes_drifted_counters(self):
+        Vote.objects.create(user=self.voter, idea=self.idea)
+        self.idea.refresh_from_db()
+        self.assertEqual(self.idea.vote_count, 0)
+
+        out = StringIO()
+        call_command("recount_idea_votes", "--dry-run", stdout=out)
+        self.idea.refresh_from_db()
+        self.assertEqual(self.idea.vote_count, 0)
+
+        call_command("recount_idea_votes", stdout=out)
+        self.idea.refresh_from_db()
+        self.assertEqual(self.idea.vote_count, 1)
@@ -0,0 +1,106 @@
+"""
+Integration tests for the paginated voters endpoint and the vote summary.
+"""
+
+from django.contrib.auth import get_user_model
+from django.core.cache import cache
+from django.db import connection
+from django.test import TestCase
+from django.test.utils import CaptureQueriesContext
+from rest_framework.test import APIClient
+
+from core.models.configuration import SystemConfiguration
+from talks.models import Idea
+from talks.models.vote import ROSTER_PREVIEW_SIZE
+
+User = get_user_model()
+
+
+class IdeaVotersTest(TestCase):
+    """Test that votes are paginated instead of embedded in the detail."""
+
+    def setUp(self):
+        cache.clear()
+        self.client = APIClient()
+        SystemConfiguration.objects.create(chapter_enabled=True, retro_enabled=True)
+
+        self.author = User.objects.create_user(username="author", password="test123")
+        self.idea = Idea.objects.create(
+            titulo="Popular idea",
+            descricao="Idea with many voters",
+            conteudo="<p>Body</p>",
+            autor=self.author,
+        )
+        self.voters = [
+            User.objects.create_user(username=f"voter{i}", password="test123")
+            for i in range(8)
+        ]
+        for voter in self.voters:
+            self.idea.toggle_vote(voter)
+
+        self.detail_url = f"/api/ideas/{self.idea.id}/"
+        self.voters_url = f"/api/ideas/{self.idea.id}/voters/"
+
+    def tearDown(self):
+        cache.clear()
+
+    def test_detail_embeds_summary_instead_of_votes(self):
+        response = self.client.get(self.detail_url)
+
+        self.assertNotIn("votos", response.data)
+        resumo = response.data["votos_resumo"]
+        self.assertEqual(resumo["total"], 8)
+        self.assertEqual(len(resumo["votantes"]), ROSTER_PREVIEW_SIZE)
+        self.assertEqual(set(resumo["votantes"][0]), {"id", "username", "avatar"})
+        self.assertEqual(resumo["votantes"][0]["id"], self.voters[-1].id)
+
+    def test_detail_query_count_does_not_grow_with_votes(self):
+        self.client.get(self.detail_url)  # aquece o cache de configuração
+        with CaptureQueriesContext(connection) as ctx:
+            self.client.get(self.detail_url)
+        few_votes_queries = len(ctx.captured_queries)
+
+        for i in range(10):
+            voter = User.objects.create_user(username=f"extra{i}", password="x")
+            self.idea.toggle_vote(voter)
+
+        cache.clear()
+        self.client.get(self.detail_url)
+        with CaptureQueriesContext(connection) as ctx:
+            response = self.client.get(self.detail_url)
+
+        self.assertEqual(len(ctx.captured_queries), few_votes_queries)
+        self.assertEqual(response.data["votos_resumo"]["total"], 18)
+
+    def test_voters_are_paginated_with_cursor(self):
+        response = self.client.get(f"{self.voters_url}?page_size=5")
+
+        self.assertEqual(response.status_code, 200)
+        self.assertEqual(
+            [item["user"]["id"] for item in response.data["results"]],
+            [voter.id for voter in reversed(self.voters[3:])],
+        )
+
+        response = self.client.get(response.data["next"])
+        self.assertEqual(
+            [item["user"]["id"] for item in response.data["results"]],
+            [voter.id for voter in reversed(self.voters[:3])],
+        )
+        self.assertIsNone(response.data["next"])
+
+    def test_inactive_voters_are_hidden(self):
+        inactive = self.voters[0]
+        inactive.is_active = False
+        inactive.save()
+
+        response = self.client.get(self.voters_url)
+        ids = [item["user"]["id"] for item in response.data["results"]]
+        self.assertNotIn(inactive.id, ids)
+        self.assertEqual(len(ids), 7)
+
+        response = self.client.get(self.detail_url)
+        self.assertEqual(response.data["votos_resumo"]["total"], 7)
+
+    def test_unknown_idea_returns_404(self):
+        response = self.client.get("/api/ideas/999999/voters/")
+        self.assertEqual(response.status_code, 404)
@@ -0,0 +1,124 @@
+"""
+Integration tests for opt-in keyset (cursor) pagination.
+"""
+
+from datetime import timedelta
+
+from django.contrib.auth import get_user_model
+from django.core.cache import cache
+from django.db import connection
+from django.test import TestCase
+from django.test.utils import CaptureQueriesContext
+from django.utils import timezone
+from rest_framework.test import APIClient
+
+from core.models.configuration import SystemConfiguration
+from talks.models import Idea, Notification
+
+User = get_user_model()
+
+
+class KeysetPaginationTest(TestCase):
+    """Test cursor pagination on ideas, timeline and notifications."""
+
+    def setUp(self):
+        cache.clear()
+        self.client = APIClient()
+        SystemConfiguration.objects.create(chapter_enabled=True, retro_enabled=True)
+
+        self.user = User.objects.create_user(username="reader", password="test123")
+        self.ideas = [
+            Idea.objects.create(
+                titulo=f"Idea number {i}",
+                descricao="Idea used to test pagination",
+                conteudo="<p>Body</p>",
+                autor=self.user,
+            )
+            for i in range(5)
+        ]
+        # Mesmo created_at para todas: o desempate tem que vir do id
+        Idea.objects.update(created_at=timezone.now())
+
+    def tearDown(self):
+        cache.clear()
+
+    def _walk(self, url, params):
+        ids = []
+        response = self.client.get(url, params)
+        while True:
+            self.assertEqual(response.status_code, 200)
+            self.assertNotIn("count", response.data)
+            ids.extend(item["id"] for item in response.data["results"])
+            if not response.data["next"]:
+                return ids
+            response = self.client.get(response.data["next"])
+
+    def test_list_walks_every_idea_once_with_ties(self):
+        ids = self._walk("/api/ideas/", {"pagination": "cursor", "page_size": 2})
+
+        expected = sorted((idea.id for idea in self.ideas), reverse=True)
+        self.assertEqual(ids, expected)
+
+    def test_list_does_not_run_count_query(self):
+        with CaptureQueriesContext(connection) as ctx:
+            self.client.get("/api/ideas/", {"pagination": "cursor"})
+
+        idea_counts = [
+            query["sql"]
+            for query in ctx.captured_queries
+            if "COUNT(" in query["sql"].upper() and "talks_idea" in query["sql"]
+        ]
+        self.assertEqual(idea_counts, [])
+
+    def test_page_size_is_capped(self):
+        response = self.client.get(
+            "/api/ideas/", {"pagination": "cursor", "page_size": 1000}
+        )
+        self.assertEqual(response.status_code, 200)
+        self.assertEqual(len(response.data["results"]), 5)
+
+    def test_invalid_cursor_returns_404(self):
+        response = self.client.get("/api/ideas/", {"cursor": "not-a-cursor"})
+        self.assertEqual(response.status_code, 404)
+
+    def test_ordering_with_cursor_returns_400(self):
+        response = self.client.get(
+            "/api/ideas/", {"pagination": "cursor", "ordering": "titulo"}
+        )
+        self.assertEqual(response.status_code, 400)
+        self.assertIn("ordering", response.data)
+
+    def test_ordering_without_cursor_still_works(self):
+        response = self.client.get("/api/ideas/", {"ordering": "titulo"})
+        self.assertEqual(response.status_code, 200)
+        self.assertIn("count", response.data)
+
+    def test_timeline_orders_by_scheduled_date(self):
+        now = timezone.now()
+        for offset, idea in enumerate(reversed(self.ideas)):
+            idea.data_agendada = now + timedelta(days=offset)
+            idea.save()
+
+        ids = self._walk(
+            "/api/ideas/timeline/", {"pagination": "cursor", "page_size": 2}
+        )
+
+        self.assertEqual(ids, [idea.id for idea in reversed(self.ideas)])
+
+    def test_notifications_use_cursor(self):
+        self.client.force_authenticate(user=self.user)
+        for idea in self.ideas:
+            Notification.objects.create(
+                user=self.user, tipo="voto", mensagem="voto", idea=idea
+            )
+
+        ids = self._walk(
+            "/api/notifications/", {"pagination": "cursor", "page_size": 2}
+        )
+
+        self.assertEqual(len(ids), 5)
+        self.assertEqual(len(set(ids)), 5)
+
+    def test_default_pagination_is_unchanged(self):
+        response = self.client.get("/api/ideas/")
+        self.assertEqual(response.data["count"], 5)
@@ -0,0 +1,141 @@
+"""
+Integration tests for batched multi-recipient notification delivery.
+"""
+
+from django.contrib.auth import get_user_model
+from django.core.cache import cache
+from django.db import connection
+from django.test import TestCase
+from django.test.utils import CaptureQueriesContext
+from django.utils import timezone
+
+from core.models.configuration import SystemConfiguration
+from talks.models import Idea, Notification, NotificationOutbox
+from talks.notifications.handlers import NotificationDispatcher
+from talks.notifications.outbox import NotificationOutboxService
+from talks.notifications.services.base import (
+    AbstractNotificationService,
+    NotificationContext,
+)
+from talks.notifications.signals import idea_rescheduled
+
+User = get_user_model()
+
+
+class RecordingService(AbstractNotificationService):
+    """Service that records each call and accepts a subset of recipients."""
+
+    def __init__(self, accepted_ids):
+        self.accepted_ids = accepted_ids
+        self.calls = []
+
+    def send(self, context):
+        self.calls.append([context])
+        return True
+
+    def send_many(self, contexts):
+        self.calls.append(list(contexts))
+        return [True] * len(contexts)
+
+    def can_send(self, context):
+        return context.recipient.pk in self.accepted_ids
+
+
+class SingleSendService(RecordingService):
+    """Service that relies on the default one-by-one send_many."""
+
+    send_many = AbstractNotificationService.send_many
+
+
+def insert_count(ctx, table):
+    return sum(
+        1
+        for query in ctx.captured_queries
+        if query["sql"].startswith(f'INSERT INTO "{table}"')
+    )
+
+
+class NotificationBatchDeliveryTest(TestCase):
+    """Test that fan-out events cost one insert regardless of audience size."""
+
+    def setUp(self):
+        cache.clear()
+        SystemConfiguration.objects.create(chapter_enabled=True, retro_enabled=True)
+
+        self.admin = User.objects.create_user(username="admin", password="test123")
+        self.users = [
+            User.objects.create_user(username=f"user{i}", password="test123")
+            for i in range(4)
+        ]
+        self.idea = Idea.objects.create(
+            titulo="Fan-out idea",
+            descricao="Idea used to test batched delivery",
+            conteudo="<p>Body</p>",
+            autor=self.users[0],
+            apresentador=self.users[1],
+        )
+
+    def tearDown(self):
+        cache.clear()
+
+    def _contexts(self):
+        return [
+            NotificationContext(
+                recipient=user,
+                notification_type="agendamento",
+                message="reagendado",
+                idea=self.idea,
+            )
+            for user in self.users
+        ]
+
+    def test_rescheduling_queues_all_recipients_in_one_insert(self):
+        with CaptureQueriesContext(connection) as ctx:
+            with self.captureOnCommitCallbacks(execute=True):
+                idea_rescheduled.send(
+                    sender=None,
+                    idea=self.idea,
+                    user=self.admin,
+                    old_date=None,
+                    new_date=timezone.now(),
+                )
+
+        self.assertEqual(insert_count(ctx, "talks_notificationoutbox"), 1)
+        self.assertEqual(
+            set(NotificationOutbox.objects.values_list("recipient_id", flat=True)),
+            {self.users[0].pk, self.users[1].pk},
+        )
+
+    def test_worker_delivers_batch_with_one_insert(self):
+        with self.captureOnCommitCallbacks(execute=True):
+            NotificationOutboxService.enqueue_many(self._contexts())
+
+        with CaptureQueriesContext(connection) as ctx:
+            delivered, failed = NotificationOutboxService.process_batch()
+
+        self.assertEqual((delivered, failed), (4, 0))
+        self.assertEqual(insert_count(ctx, "talks_notification"), 1)
+        self.assertEqual(Notification.objects.count(), 4)
+
+    def test_dispatcher_groups_contexts_per_service(self):
+        first = RecordingService({user.pk for user in self.users})
+        second = RecordingService({self.users[2].pk})
+        dispatcher = NotificationDispatcher()
+        dispatcher.services = [first, second]
+
+        results = dispatcher.dispatch_many(self._contexts())
+
+        self.assertEqual(len(first.calls), 1)
+        self.assertEqual(len(first.calls[0]), 4)
+        self.assertEqual(len(second.calls), 1)
+        self.assertEqual(second.calls[0][0].recipient, self.users[2])
+        self.assertEqual(
+            results[2], [("RecordingService", True), ("RecordingService", True)]
+        )
+        self.assertEqual(results[0], [("RecordingService", True)])
+
+    def test_default_send_many_falls_back_to_send(self):
+        service = SingleSendService({user.pk for user in self.users})
+
+        self.assertEqual(service.send_many(self._contexts()), [True] * 4)
+        self.assertEqual(len(service.calls), 4)
@@ -0,0 +1,186 @@
+"""
+Integration tests for coalescing same-type notifications on the same idea.
+"""
+
+from datetime import timedelta
+
+from django.contrib.auth import get_user_model
+from django.core.cache import cache
+from django.test import TestCase, override_settings
+from django.utils import timezone
+from rest_framework.test import APIClient
+
+from core.models.configuration import SystemConfiguration
+from talks.models import Idea, Notification
+from talks.notifications.outbox import NotificationOutboxService
+from talks.notifications.services.base import NotificationContext
+from talks.notifications.services.database import DatabaseNotificationService
+
+User = get_user_model()
+
+
+@override_settings(NOTIFICATION_COALESCE_WINDOWS={"voto": 3600})
+class NotificationCoalescingTest(TestCase):
+    """Test that repeated events fold into one aggregated notification."""
+
+    def setUp(self):
+        cache.clear()
+        self.client = APIClient()
+        SystemConfiguration.objects.create(chapter_enabled=True, retro_enabled=True)
+
+        self.author = User.objects.create_user(username="author", password="test123")
+        self.voters = [
+            User.objects.create_user(username=f"voter{i}", password="test123")
+            for i in range(5)
+        ]
+        self.idea = Idea.objects.create(
+            titulo="Popular idea",
+            descricao="Idea with many votes",
+            conteudo="<p>Body</p>",
+            autor=self.author,
+        )
+
+    def tearDown(self):
+        cache.clear()
+
+    def _vote(self, voter, idea=None):
+        idea = idea or self.idea
+        self.client.force_authenticate(user=voter)
+        with self.captureOnCommitCallbacks(execute=True):
+            self.client.post(f"/api/ideas/{idea.id}/vote/")
+
+    def test_votes_in_same_batch_fold_into_one_row(self):
+        for voter in self.voters:
+            self._vote(voter)
+
+        NotificationOutboxService.process_batch()
+
+        notification = Notification.objects.get()
+        self.assertEqual(notification.contagem, 5)
+        self.assertEqual(
+            [ator["username"] for ator in notification.atores],
+            ["voter4", "voter3", "voter2"],
+        )
+        self.assertEqual(
+            notification.mensagem,
+            "voter4 e mais 4 pessoas votaram na sua ideia 'Popular idea'",
+        )
+
+    def test_later_votes_fold_into_existing_row_and_mark_unread(self):
+        self._vote(self.voters[0])
+        NotificationOutboxService.process_batch()
+        notification = Notification.objects.get()
+        self.assertEqual(notification.contagem, 1)
+        self.assertEqual(
+            notification.mensagem, "voter0 votou na sua ideia 'Popular idea'"
+        )
+        Notification.objects.filter(pk=notification.pk).update(lido=True)
+
+        self._vote(self.voters[1])
+        NotificationOutboxService.process_batch()
+
+        notification.refresh_from_db()
+        self.assertEqual(Notification.objects.count(), 1)
+        self.assertEqual(notification.contagem, 2)
+        self.assertFalse(notification.lido)
+        self.assertEqual(
+            notification.mensagem,
+            "voter1 e mais 1 pessoa votaram na sua ideia 'Popular idea'",
+        )
+
+    def test_events_outside_window_start_a_new_row(self):
+        self._vote(self.voters[0])
+        NotificationOutboxService.process_batch()
+        two_hours_ago = timezone.now() - timedelta(hours=2)
+        Notification.objects.update(
+            created_at=two_hours_ago, primeiro_evento_em=two_hours_ago
+        )
+
+        self._vote(self.voters[1])
+        NotificationOutboxService.process_batch()
+
+        self.assertEqual(Notification.objects.count(), 2)
+
+    def test_different_ideas_are_not_folded(self):
+        other = Idea.objects.create(
+            titulo="Other idea",
+            descricao="Another idea by the author",
+            conteudo="<p>Body</p>",
+            autor=self.author,
+        )
+        self._vote(self.voters[0])
+        self._vote(self.voters[1], idea=other)
+
+        NotificationOutboxService.process_batch()
+
+        self.assertEqual(Notification.objects.count(), 2)
+
+    @override_settings(NOTIFICATION_COALESCE_WINDOWS={})
+    def test_coalescing_can_be_disabled(self):
+        for voter in self.voters[:3]:
+            self._vote(voter)
+
+        NotificationOutboxService.process_batch()
+
+        self.assertEqual(Notification.objects.count(), 3)
+        self.assertEqual(
+            set(Notification.objects.values_list("contagem", flat=True)), {1}
+        )
+
+    def test_api_exposes_count_and_actors(self):
+        for voter in self.voters[:2]:
+            self._vote(voter)
+        NotificationOutboxService.process_batch()
+
+        self.client.force_authenticate(user=self.author)
+        response = self.client.get("/api/notifications/")
+
+        item = response.data["results"][0]
+        self.assertEqual(item["contagem"], 2)
+        self.assertEqual(item["atores"][0]["username"], "voter1")
+
+    def test_repeated_actor_counts_once_in_message(self):
+        service = DatabaseNotificationService()
+        service.send_many(
+            [
+                NotificationContext(
+                    recipient=self.author,
+                    notification_type="voto",
+                    message=f"{voter.username} votou",
+                    idea=self.idea,
+                    actor=voter,
+                )
+                for voter in (self.voters[0], self.voters[1], self.voters[0])
+            ]
+        )
+
+        notification = Notification.objects.get()
+        self.assertEqual(notification.contagem, 3)
+        self.assertEqual(
+            sorted(notification.atores_ids), [self.voters[0].id, self.voters[1].id]
+        )
+        self.assertEqual(
+            notification.mensagem,
+            "voter0 e mais 1 pessoa votaram na sua ideia 'Popular idea'",
+        )
+
+    def test_window_is_capped_at_first_event(self):
+        self._vote(self.voters[0])
+        NotificationOutboxService.process_batch()
+        now = timezone.now()
+        Notification.objects.update(
+            primeiro_evento_em=now - timedelta(minutes=50),
+            created_at=now - timedelta(minutes=5),
+        )
+
+        self._vote(self.voters[1])
+        NotificationOutboxService.process_batch()
+        self.assertEqual(Notification.objects.count(), 1)
+
+        # Agrupar renovou created_at, mas a janela continua contando do
+        # primeiro evento
+        Notification.objects.update(primeiro_evento_em=now - timedelta(minutes=70))
+        self._vote(self.voters[2])
+        NotificationOutboxService.process_batch()
+
+        self.assertEqual(Notification.objects.count(), 2)
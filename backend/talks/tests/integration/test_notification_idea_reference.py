@@ -0,0 +1,79 @@
+"""
+Integration tests for the compact idea reference in notification payloads.
+"""
+
+from django.contrib.auth import get_user_model
+from django.core.cache import cache
+from django.db import connection
+from django.test import TestCase
+from django.test.utils import CaptureQueriesContext
+from rest_framework.test import APIClient
+
+from core.models.configuration import SystemConfiguration
+from talks.models import Idea, Notification, Tag
+
+User = get_user_model()
+
+
+class NotificationIdeaReferenceTest(TestCase):
+    """Test that the notification drawer resolves ideas in one batch."""
+
+    def setUp(self):
+        cache.clear()
+        self.client = APIClient()
+        SystemConfiguration.objects.create(chapter_enabled=True, retro_enabled=True)
+
+        self.user = User.objects.create_user(username="author", password="test123")
+        self.presenter = User.objects.create_user(username="presenter", password="x")
+        self.tag = Tag.objects.create(nome="Django", slug="django", cor="#092E20")
+        self.client.force_authenticate(user=self.user)
+
+    def tearDown(self):
+        cache.clear()
+
+    def _create_notifications(self, total):
+        for i in range(total):
+            idea = Idea.objects.create(
+                titulo=f"Idea number {i}",
+                descricao="Idea referenced by a notification",
+                conteudo="<p>Very long body</p>",
+                autor=self.user,
+                apresentador=self.presenter,
+            )
+            idea.tags.add(self.tag)
+            Notification.objects.create(
+                user=self.user, tipo="voto", mensagem="voto", idea=idea
+            )
+
+    def _get(self):
+        with CaptureQueriesContext(connection) as ctx:
+            response = self.client.get("/api/notifications/")
+        self.assertEqual(response.status_code, 200)
+        return response, ctx.captured_queries
+
+    def test_idea_is_a_compact_reference(self):
+        self._create_notifications(1)
+        Notification.objects.create(user=self.user, tipo="mencao", mensagem="oi")
+
+        response, _ = self._get()
+
+        with_idea, without_idea = sorted(
+            response.data["results"], key=lambda item: item["idea"] is None
+        )
+        self.assertEqual(set(with_idea["idea"]), {"id", "titulo", "status", "imagem"})
+        self.assertEqual(with_idea["idea"]["status"], "pendente")
+        self.assertIsNone(without_idea["idea"])
+
+    def test_query_count_does_not_grow_with_page_size(self):
+        self._create_notifications(2)
+        self._get()  # aquece o cache de configuração
+        _, small_page_queries = self._get()
+
+        self._create_notifications(8)
+        _, large_page_queries = self._get()
+
+        self.assertEqual(len(small_page_queries), len(large_page_queries))
+        sql = " ".join(query["sql"] for query in large_page_queries)
+        self.assertNotIn('"talks_idea_tags"', sql)
+        self.assertNotIn('"talks_vote"', sql)
+        self.assertNotIn('"conteudo"', sql)
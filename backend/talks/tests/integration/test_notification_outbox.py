@@ -0,0 +1,185 @@
+"""
+Integration tests for the transactional notification outbox and its worker.
+"""
+
+from io import StringIO
+
+from django.contrib.auth import get_user_model
+from django.core.cache import cache
+from django.core.management import call_command
+from django.db import transaction
+from django.test import TestCase
+from django.utils import timezone
+from rest_framework import status
+from rest_framework.test import APIClient
+
+from core.models.configuration import SystemConfiguration
+from talks.models import Idea, Notification, NotificationOutbox
+from talks.notifications.outbox import NotificationOutboxService
+from talks.notifications.handlers import NotificationDispatcher
+from talks.notifications.services.base import (
+    AbstractNotificationService,
+    NotificationContext,
+)
+from talks.notifications.services.database import DatabaseNotificationService
+
+User = get_user_model()
+
+
+class FailingDispatcher:
+    """Dispatcher whose only service always fails."""
+
+    def dispatch_many(self, contexts, skip=None):
+        return [[("BrokenService", False)] for _ in contexts]
+
+
+class FlakyService(AbstractNotificationService):
+    """Service that fails on its first call and succeeds afterwards."""
+
+    def __init__(self):
+        self.calls = 0
+
+    def send(self, context):
+        self.calls += 1
+        return self.calls > 1
+
+    def can_send(self, context):
+        return True
+
+
+class NotificationOutboxTest(TestCase):
+    """Test that notifications are queued on commit and delivered by the worker."""
+
+    def setUp(self):
+        cache.clear()
+        self.client = APIClient()
+        SystemConfiguration.objects.create(chapter_enabled=True, retro_enabled=True)
+
+        self.author = User.objects.create_user(username="author", password="test123")
+        self.voter = User.objects.create_user(username="voter", password="test123")
+        self.idea = Idea.objects.create(
+            titulo="Outbox idea",
+            descricao="Idea used to test the outbox",
+            conteudo="<p>Body</p>",
+            autor=self.author,
+        )
+
+    def tearDown(self):
+        cache.clear()
+
+    def _enqueue(self):
+        context = NotificationContext(
+            recipient=self.author,
+            notification_type="voto",
+            message="voto",
+            idea=self.idea,
+        )
+        with self.captureOnCommitCallbacks(execute=True):
+            NotificationOutboxService.enqueue(context)
+        return NotificationOutbox.objects.get()
+
+    def test_vote_queues_notification_without_delivering_it(self):
+        self.client.force_authenticate(user=self.voter)
+
+        with self.captureOnCommitCallbacks(execute=True):
+            response = self.client.post(f"/api/ideas/{self.idea.id}/vote/")
+
+        self.assertEqual(response.status_code, status.HTTP_201_CREATED)
+        self.assertFalse(Notification.objects.exists())
+        entry = NotificationOutbox.objects.get()
+        self.assertEqual(entry.recipient, self.author)
+        self.assertEqual(entry.tipo, "voto")
+        self.assertEqual(entry.status, "pendente")
+
+    def test_worker_delivers_queued_notifications(self):
+        self.client.force_authenticate(user=self.voter)
+        with self.captureOnCommitCallbacks(execute=True):
+            self.client.post(f"/api/ideas/{self.idea.id}/vote/")
+            self.client.post(
+                "/api/comments/",
+                {"idea": self.idea.id, "conteudo": "Nice idea"},
+                format="json",
+            )
+
+        call_command("process_notification_outbox", "--once", stdout=StringIO())
+
+        self.assertEqual(
+            set(Notification.objects.values_list("tipo", flat=True)),
+            {"voto", "comentario"},
+        )
+        self.assertFalse(NotificationOutbox.objects.exclude(status="enviado").exists())
+
+    def test_rolled_back_transaction_queues_nothing(self):
+        context = NotificationContext(
+            recipient=self.author, notification_type="voto", message="voto"
+        )
+
+        with self.captureOnCommitCallbacks(execute=True):
+            try:
+                with transaction.atomic():
+                    NotificationOutboxService.enqueue(context)
+                    raise RuntimeError
+            except RuntimeError:
+                pass
+
+        self.assertFalse(NotificationOutbox.objects.exists())
+
+    def test_failed_delivery_is_retried_with_backoff(self):
+        entry = self._enqueue()
+
+        before = timezone.now()
+        delivered, failed = NotificationOutboxService.process_batch(
+            dispatcher=FailingDispatcher()
+        )
+
+        self.assertEqual((delivered, failed), (0, 1))
+        entry.refresh_from_db()
+        self.assertEqual(entry.status, "pendente")
+        self.assertEqual(entry.tentativas, 1)
+        self.assertIn("BrokenService", entry.ultimo_erro)
+        self.assertGreaterEqual(
+            entry.disponivel_em, before + NotificationOutboxService.backoff(1)
+        )
+
+        # Ainda no backoff: não é reservada de novo
+        self.assertEqual(NotificationOutboxService.claim(10), [])
+        self.assertLess(
+            NotificationOutboxService.backoff(1), NotificationOutboxService.backoff(2)
+        )
+
+    def test_delivery_gives_up_after_max_attempts(self):
+        entry = self._enqueue()
+        NotificationOutbox.objects.filter(pk=entry.pk).update(
+            tentativas=NotificationOutboxService.MAX_ATTEMPTS - 1
+        )
+
+        NotificationOutboxService.process_batch(dispatcher=FailingDispatcher())
+
+        entry.refresh_from_db()
+        self.assertEqual(entry.status, "falhou")
+        self.assertEqual(entry.tentativas, NotificationOutboxService.MAX_ATTEMPTS)
+
+    def test_retry_skips_services_that_already_delivered(self):
+        entry = self._enqueue()
+        flaky = FlakyService()
+        dispatcher = NotificationDispatcher()
+        dispatcher.services = [DatabaseNotificationService(), flaky]
+
+        with self.captureOnCommitCallbacks(execute=True):
+            NotificationOutboxService.process_batch(dispatcher=dispatcher)
+        entry.refresh_from_db()
+        self.assertEqual(entry.status, "pendente")
+        self.assertEqual(entry.servicos_entregues, ["DatabaseNotificationService"])
+
+        NotificationOutbox.objects.filter(pk=entry.pk).update(
+            disponivel_em=timezone.now()
+        )
+        with self.captureOnCommitCallbacks(execute=True):
+            NotificationOutboxService.process_batch(dispatcher=dispatcher)
+
+        entry.refresh_from_db()
+        self.assertEqual(entry.status, "enviado")
+        self.assertEqual(flaky.calls, 2)
+        # A notificação no banco não é gravada de novo na retentativa
+        notification = Notification.objects.get(user=self.author)
+        self.assertEqual(notification.contagem, 1)
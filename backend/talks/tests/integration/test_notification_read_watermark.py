@@ -0,0 +1,126 @@
+"""
+Integration tests for the per-user read watermark ("mark all as read").
+"""
+
+from django.contrib.auth import get_user_model
+from django.core.cache import cache
+from django.db import connection
+from django.test import TestCase, override_settings
+from django.test.utils import CaptureQueriesContext
+from rest_framework.test import APIClient
+
+from core.models.configuration import SystemConfiguration
+from talks.models import Idea, Notification
+from talks.notifications.outbox import NotificationOutboxService
+
+User = get_user_model()
+
+
+@override_settings(NOTIFICATION_COALESCE_WINDOWS={})
+class NotificationReadWatermarkTest(TestCase):
+    """Test that mark-all-read moves a watermark instead of updating rows."""
+
+    def setUp(self):
+        cache.clear()
+        self.client = APIClient()
+        SystemConfiguration.objects.create(chapter_enabled=True, retro_enabled=True)
+
+        self.author = User.objects.create_user(username="author", password="test123")
+        self.voters = [
+            User.objects.create_user(username=f"voter{i}", password="test123")
+            for i in range(3)
+        ]
+        self.idea = Idea.objects.create(
+            titulo="Watermark idea",
+            descricao="Idea used to read notifications",
+            conteudo="<p>Body</p>",
+            autor=self.author,
+        )
+
+    def tearDown(self):
+        cache.clear()
+
+    def _deliver_votes(self, voters):
+        for voter in voters:
+            self.client.force_authenticate(user=voter)
+            with self.captureOnCommitCallbacks(execute=True):
+                self.client.post(f"/api/ideas/{self.idea.id}/vote/")
+        with self.captureOnCommitCallbacks(execute=True):
+            NotificationOutboxService.process_batch()
+        self.client.force_authenticate(user=self.author)
+
+    def _count(self):
+        return self.client.get("/api/notifications/unread_count/").data["count"]
+
+    def _mark_all_read(self):
+        with CaptureQueriesContext(connection) as ctx:
+            response = self.client.post("/api/notifications/mark_all_read/")
+        self.assertEqual(response.status_code, 200)
+        return ctx
+
+    def test_mark_all_read_does_not_update_notifications(self):
+        self._deliver_votes(self.voters)
+
+        ctx = self._mark_all_read()
+
+        sql = [query["sql"] for query in ctx.captured_queries]
+        self.assertFalse(
+            any(query.startswith('UPDATE "talks_notification"') for query in sql)
+        )
+        self.author.refresh_from_db()
+        self.assertIsNotNone(self.author.notifications_last_read_at)
+        self.assertEqual(Notification.objects.filter(lido=False).count(), 3)
+
+    def test_notifications_before_watermark_read_as_read(self):
+        self._deliver_votes(self.voters)
+        self._mark_all_read()
+
+        results = self.client.get("/api/notifications/").data["results"]
+        self.assertEqual(len(results), 3)
+        self.assertTrue(all(item["lido"] for item in results))
+
+        self.assertEqual(self.client.get("/api/notifications/unread/").data, [])
+        unread = self.client.get("/api/notifications/", {"lido": "false"})
+        self.assertEqual(unread.data["results"], [])
+        read = self.client.get("/api/notifications/", {"lido": "true"})
+        self.assertEqual(len(read.data["results"]), 3)
+
+        cache.clear()
+        self.assertEqual(self._count(), 0)
+
+    def test_new_notifications_after_watermark_are_unread(self):
+        self._deliver_votes(self.voters[:2])
+        self._mark_all_read()
+
+        self._deliver_votes(self.voters[2:])
+
+        unread = self.client.get("/api/notifications/", {"lido": "false"})
+        self.assertEqual(len(unread.data["results"]), 1)
+        self.assertFalse(unread.data["results"][0]["lido"])
+        self.assertEqual(self._count(), 1)
+        cache.clear()
+        self.assertEqual(self._count(), 1)
+
+    def test_mark_read_below_watermark_keeps_counter(self):
+        self._deliver_votes(self.voters[:2])
+        self._mark_all_read()
+        self._deliver_votes(self.voters[2:])
+        old = Notification.objects.filter(user=self.author).order_by("id").first()
+
+        self.client.patch(f"/api/notifications/{old.id}/mark_read/")
+
+        self.assertEqual(self._count(), 1)
+
+    @override_settings(NOTIFICATION_COALESCE_WINDOWS={"voto": 3600})
+    def test_coalescing_into_watermarked_notification_makes_it_unread(self):
+        self._deliver_votes(self.voters[:2])
+        self._mark_all_read()
+        self.assertEqual(self._count(), 0)
+
+        self._deliver_votes(self.voters[2:])
+
+        self.assertEqual(self._count(), 1)
+        results = self.client.get("/api/notifications/").data["results"]
+        self.assertEqual(len(results), 1)
+        self.assertFalse(results[0]["lido"])
+        self.assertEqual(results[0]["contagem"], 3)
@@ -0,0 +1,180 @@
+"""
+Integration tests for the notification retention policy, purge command and
+inbox indexes.
+"""
+
+import gzip
+import json
+import os
+import tempfile
+from datetime import timedelta
+from io import StringIO
+from unittest import skipUnless
+
+from django.contrib.auth import get_user_model
+from django.core.cache import cache
+from django.core.management import call_command
+from django.db import connection
+from django.test import TestCase, override_settings
+from django.test.utils import CaptureQueriesContext
+from django.utils import timezone
+
+from talks.models import Notification, NotificationOutbox
+from talks.notifications.unread_counter import UnreadCounterService
+
+User = get_user_model()
+
+
+@override_settings(NOTIFICATION_RETENTION_DAYS={"voto": 30, "comentario": 60})
+class PurgeNotificationsCommandTest(TestCase):
+    """Test that expired notifications are purged per tipo, in batches."""
+
+    def setUp(self):
+        cache.clear()
+        self.user = User.objects.create_user(username="user", password="test123")
+
+    def tearDown(self):
+        cache.clear()
+
+    def _notification(self, tipo, days_ago, lido=True):
+        notification = Notification.objects.create(
+            user=self.user, tipo=tipo, mensagem=f"{tipo} {days_ago}", lido=lido
+        )
+        Notification.objects.filter(pk=notification.pk).update(
+            created_at=timezone.now() - timedelta(days=days_ago)
+        )
+        return notification
+
+    def _purge(self, *args):
+        out = StringIO()
+        call_command("purge_notifications", *args, stdout=out)
+        return out.getvalue()
+
+    def test_purges_only_notifications_past_their_tipo_retention(self):
+        expired_vote = self._notification("voto", 31)
+        recent_vote = self._notification("voto", 29)
+        comment = self._notification("comentario", 45)
+        expired_comment = self._notification("comentario", 61)
+        mention = self._notification("mencao", 1000)
+
+        self._purge()
+
+        remaining = set(Notification.objects.values_list("id", flat=True))
+        self.assertEqual(remaining, {recent_vote.id, comment.id, mention.id})
+        self.assertNotIn(expired_vote.id, remaining)
+        self.assertNotIn(expired_comment.id, remaining)
+
+    def test_deletes_in_bounded_batches(self):
+        for _ in range(5):
+            self._notification("voto", 40)
+
+        with CaptureQueriesContext(connection) as ctx:
+            output = self._purge("--batch-size", "2")
+
+        deletes = [
+            query["sql"]
+            for query in ctx.captured_queries
+            if query["sql"].startswith('DELETE FROM "talks_notification"')
+        ]
+        self.assertEqual(len(deletes), 3)
+        self.assertFalse(Notification.objects.exists())
+        self.assertIn("voto: 5 expurgadas", output)
+
+    def test_dry_run_deletes_nothing(self):
+        self._notification("voto", 40)
+
+        output = self._purge("--dry-run")
+
+        self.assertEqual(Notification.objects.count(), 1)
+        self.assertIn("voto: 1 expiradas", output)
+
+    def test_archives_rows_before_deleting(self):
+        expired = self._notification("voto", 40)
+        self._notification("voto", 1)
+
+        with tempfile.TemporaryDirectory() as directory:
+            path = os.path.join(directory, "notifications.jsonl.gz")
+            self._purge("--archive", path)
+
+            with gzip.open(path, "rb") as archive:
+                rows = [json.loads(line) for line in archive]
+
+        self.assertEqual([row["id"] for row in rows], [expired.id])
+        self.assertEqual(rows[0]["user_id"], self.user.id)
+        self.assertEqual(rows[0]["tipo"], "voto")
+        self.assertEqual(Notification.objects.count(), 1)
+
+    def test_purging_unread_decrements_counter(self):
+        self._notification("voto", 40, lido=False)
+        self._notification("voto", 1, lido=False)
+        self.assertEqual(UnreadCounterService.get(self.user.id), 2)
+
+        self._purge()
+
+        self.assertEqual(UnreadCounterService.get(self.user.id), 1)
+
+    def test_purge_adjusts_counters_in_bulk(self):
+        other = User.objects.create_user(username="other", password="test123")
+        for _ in range(3):
+            self._notification("voto", 40, lido=False)
+        Notification.objects.filter(user=self.user).update(user=other)
+        UnreadCounterService.refresh(other.id)
+        for _ in range(3):
+            self._notification("voto", 40, lido=False)
+        UnreadCounterService.refresh(self.user.id)
+
+        with CaptureQueriesContext(connection) as queries:
+            self._purge()
+
+        # Sem SELECT das instâncias nem UPDATE por notificação apagada
+        updates = [q for q in queries if q["sql"].startswith("UPDATE")]
+        self.assertEqual(len(updates), 1)
+        self.assertEqual(UnreadCounterService.get(self.user.id), 0)
+        self.assertEqual(UnreadCounterService.get(other.id), 0)
+        self.assertFalse(Notification.objects.exists())
+
+    @override_settings(NOTIFICATION_OUTBOX_RETENTION_DAYS={"enviado": 7, "falhou": 30})
+    def test_purges_processed_outbox_entries(self):
+        def entry(status, days_ago):
+            item = NotificationOutbox.objects.create(
+                recipient=self.user, tipo="voto", mensagem="m", status=status
+            )
+            NotificationOutbox.objects.filter(pk=item.pk).update(
+                created_at=timezone.now() - timedelta(days=days_ago)
+            )
+            return item
+
+        entry("enviado", 8)
+        recent_sent = entry("enviado", 6)
+        entry("falhou", 31)
+        recent_failed = entry("falhou", 20)
+        pending = entry("pendente", 100)
+
+        output = self._purge()
+
+        remaining = set(NotificationOutbox.objects.values_list("id", flat=True))
+        self.assertEqual(remaining, {recent_sent.id, recent_failed.id, pending.id})
+        self.assertIn("outbox enviado: 1 expurgados", output)
+
+
+@skipUnless(connection.vendor == "sqlite", "Plano de execução do SQLite")
+class NotificationInboxIndexTest(TestCase):
+    """Test that the inbox queries are served by an index, without sorting."""
+
+    def test_inbox_uses_user_recent_index(self):
+        plan = (
+            Notification.objects.filter(user_id=1)
+            .order_by("-created_at", "-id")[:20]
+            .explain()
+        )
+        self.assertIn("talks_notif_user_recent_idx", plan)
+        self.assertNotIn("TEMP B-TREE", plan)
+
+    def test_unread_uses_partial_index(self):
+        plan = (
+            Notification.objects.filter(user_id=1, lido=False)
+            .order_by("-created_at", "-id")[:20]
+            .explain()
+        )
+        self.assertIn("talks_notif_user_unread_idx", plan)
+        self.assertNotIn("TEMP B-TREE", plan)
@@ -0,0 +1,220 @@
+"""
+Integration tests for the SSE notification stream.
+"""
+
+import asyncio
+import json
+
+from asgiref.sync import sync_to_async
+from django.contrib.auth import get_user_model
+from django.core.cache import cache
+from django.test import TestCase, override_settings
+from rest_framework.test import APIClient
+from rest_framework_simplejwt.tokens import AccessToken
+
+from core.models.configuration import SystemConfiguration
+from talks.models import Idea
+from talks.notifications.outbox import NotificationOutboxService
+from talks.notifications.stream import (
+    LocalStreamBackend,
+    StreamTicketService,
+    broker,
+    get_stream_backend,
+)
+
+User = get_user_model()
+
+URL = "/api/notifications/stream/"
+TICKET_URL = "/api/notifications/stream_ticket/"
+
+
+def parse_event(chunk):
+    fields = dict(line.split(": ", 1) for line in chunk.decode().strip().splitlines())
+    return fields["event"], json.loads(fields["data"])
+
+
+@override_settings(NOTIFICATION_COALESCE_WINDOWS={})
+class NotificationStreamTest(TestCase):
+    """Test that delivered notifications are pushed to connected users."""
+
+    def setUp(self):
+        cache.clear()
+        SystemConfiguration.objects.create(chapter_enabled=True, retro_enabled=True)
+
+        self.author = User.objects.create_user(username="author", password="test123")
+        self.voter = User.objects.create_user(username="voter", password="test123")
+        self.idea = Idea.objects.create(
+            titulo="Streamed idea",
+            descricao="Idea whose votes are streamed",
+            conteudo="<p>Body</p>",
+            autor=self.author,
+        )
+        self.token = str(AccessToken.for_user(self.author))
+
+    def tearDown(self):
+        cache.clear()
+
+    def _deliver_vote(self):
+        client = APIClient()
+        client.force_authenticate(user=self.voter)
+        with self.captureOnCommitCallbacks(execute=True):
+            client.post(f"/api/ideas/{self.idea.id}/vote/")
+        with self.captureOnCommitCallbacks(execute=True):
+            NotificationOutboxService.process_batch()
+
+    def _ticket(self):
+        client = APIClient()
+        client.force_authenticate(user=self.author)
+        return client.post(TICKET_URL).data["ticket"]
+
+    async def _connect(self):
+        ticket = await sync_to_async(self._ticket)()
+        return await self.async_client.get(URL, {"ticket": ticket})
+
+    def _mark_all_read(self):
+        client = APIClient()
+        client.force_authenticate(user=self.author)
+        client.post("/api/notifications/mark_all_read/")
+
+    async def _next(self, content):
+        return await asyncio.wait_for(anext(content), timeout=5)
+
+    def test_default_backend_is_local(self):
+        self.assertIsInstance(get_stream_backend(), LocalStreamBackend)
+
+    async def test_requires_credentials(self):
+        response = await self.async_client.get(URL)
+        self.assertEqual(response.status_code, 401)
+
+        response = await self.async_client.get(URL, {"ticket": "invalid"})
+        self.assertEqual(response.status_code, 401)
+
+    async def test_rejects_jwt_in_query_string(self):
+        response = await self.async_client.get(URL, {"token": self.token})
+        self.assertEqual(response.status_code, 401)
+
+    def test_ticket_requires_authentication(self):
+        response = APIClient().post(TICKET_URL)
+        self.assertEqual(response.status_code, 401)
+
+    def test_ticket_expires(self):
+        response = self.client.post(
+            TICKET_URL, headers={"authorization": f"Bearer {self.token}"}
+        )
+        self.assertEqual(response.status_code, 201)
+        self.assertEqual(response.data["expires_in"], 30)
+        ticket = response.data["ticket"]
+        self.assertEqual(StreamTicketService.redeem(ticket), self.author.pk)
+
+        with override_settings(NOTIFICATION_STREAM_TICKET_TTL=-1):
+            expired = self._ticket()
+        self.assertIsNone(StreamTicketService.redeem(expired))
+
+    async def test_ticket_is_single_use(self):
+        ticket = await sync_to_async(self._ticket)()
+        response = await self.async_client.get(URL, {"ticket": ticket})
+        self.assertEqual(response.status_code, 200)
+        await response.streaming_content.aclose()
+
+        # Reconexão com o mesmo ticket
+        response = await self.async_client.get(URL, {"ticket": ticket})
+        self.assertEqual(response.status_code, 401)
+
+    async def test_ticket_of_inactive_user_is_rejected(self):
+        ticket = await sync_to_async(self._ticket)()
+        await User.objects.filter(pk=self.author.pk).aupdate(is_active=False)
+
+        response = await self.async_client.get(URL, {"ticket": ticket})
+        self.assertEqual(response.status_code, 401)
+
+    async def test_accepts_authorization_header(self):
+        response = await self.async_client.get(
+            URL, headers={"authorization": f"Bearer {self.token}"}
+        )
+        self.assertEqual(response.status_code, 200)
+        await response.streaming_content.aclose()
+
+    async def test_pushes_delivered_notifications(self):
+        response = await self._connect()
+        self.assertEqual(response.status_code, 200)
+        self.assertEqual(response["Content-Type"], "text/event-stream")
+        self.assertEqual(response["Cache-Control"], "no-cache")
+
+        content = response.streaming_content
+        try:
+            self.assertEqual(await self._next(content), b"retry: 5000\n\n")
+            event, data = parse_event(await self._next(content))
+            self.assertEqual(event, "unread_count")
+            self.assertEqual(data, {"unread_count": 0})
+
+            await sync_to_async(self._deliver_vote)()
+
+            event, data = parse_event(await self._next(content))
+            self.assertEqual(event, "notification")
+            self.assertEqual(data["unread_count"], 1)
+            self.assertEqual(data["notification"]["tipo"], "voto")
+            self.assertEqual(data["notification"]["idea"]["id"], self.idea.id)
+            self.assertFalse(data["notification"]["lido"])
+        finally:
+            await content.aclose()
+
+    async def test_unread_count_is_current_when_forwarded(self):
+        response = await self._connect()
+        content = response.streaming_content
+        try:
+            await self._next(content)
+            await self._next(content)
+
+            await sync_to_async(self._deliver_vote)()
+            # Lida antes de o stream encaminhar o evento
+            await sync_to_async(self._mark_all_read)()
+
+            event, data = parse_event(await self._next(content))
+            self.assertEqual(event, "notification")
+            self.assertEqual(data["unread_count"], 0)
+        finally:
+            await content.aclose()
+
+    async def test_disconnect_unsubscribes(self):
+        response = await self._connect()
+        content = response.streaming_content
+        await self._next(content)
+        await self._next(content)
+        self.assertEqual(broker.subscriber_count(self.author.pk), 1)
+
+        # O handler ASGI cancela a leitura quando o cliente desconecta
+        pending = asyncio.ensure_future(anext(content))
+        await asyncio.sleep(0.01)
+        pending.cancel()
+        with self.assertRaises(asyncio.CancelledError):
+            await pending
+
+        self.assertEqual(broker.subscriber_count(self.author.pk), 0)
+
+    @override_settings(NOTIFICATION_STREAM_KEEPALIVE=0.01)
+    async def test_sends_keepalive_when_idle(self):
+        response = await self._connect()
+        content = response.streaming_content
+        try:
+            await self._next(content)
+            await self._next(content)
+            self.assertEqual(await self._next(content), b": keepalive\n\n")
+        finally:
+            await content.aclose()
+
+
+class NotificationBrokerTest(TestCase):
+    """Test the in-process pub/sub used by the stream."""
+
+    async def test_publish_reaches_only_the_recipient(self):
+        queue = broker.subscribe(1)
+        other = broker.subscribe(2)
+        try:
+            await sync_to_async(broker.publish, thread_sensitive=False)(1, {"id": 10})
+            self.assertEqual(await asyncio.wait_for(queue.get(), timeout=5), {"id": 10})
+            self.assertTrue(other.empty())
+        finally:
+            broker.unsubscribe(1, queue)
+            broker.unsubscribe(2, other)
+
+        self.assertEqual(broker.subscriber_count(1), 0)
@@ -0,0 +1,127 @@
+"""
+Integration tests for the unread-notification counter kept on the user row.
+"""
+
+from django.contrib.auth import get_user_model
+from django.core.cache import cache
+from django.db import connection
+from django.test import TestCase, override_settings
+from django.test.utils import CaptureQueriesContext
+from rest_framework.test import APIClient
+
+from core.models.configuration import SystemConfiguration
+from talks.models import Idea, Notification
+from talks.notifications.outbox import NotificationOutboxService
+from talks.notifications.unread_counter import UnreadCounterService
+
+User = get_user_model()
+
+URL = "/api/notifications/unread_count/"
+
+
+@override_settings(NOTIFICATION_COALESCE_WINDOWS={})
+class NotificationUnreadCountTest(TestCase):
+    """Test that the badge counter follows delivery and read actions."""
+
+    def setUp(self):
+        cache.clear()
+        self.client = APIClient()
+        SystemConfiguration.objects.create(chapter_enabled=True, retro_enabled=True)
+
+        self.author = User.objects.create_user(username="author", password="test123")
+        self.voters = [
+            User.objects.create_user(username=f"voter{i}", password="test123")
+            for i in range(3)
+        ]
+        self.idea = Idea.objects.create(
+            titulo="Counter idea",
+            descricao="Idea used to count notifications",
+            conteudo="<p>Body</p>",
+            autor=self.author,
+        )
+
+    def tearDown(self):
+        cache.clear()
+
+    def _deliver_votes(self, voters):
+        for voter in voters:
+            self.client.force_authenticate(user=voter)
+            with self.captureOnCommitCallbacks(execute=True):
+                self.client.post(f"/api/ideas/{self.idea.id}/vote/")
+        with self.captureOnCommitCallbacks(execute=True):
+            NotificationOutboxService.process_batch()
+        self.client.force_authenticate(user=self.author)
+
+    def _count(self):
+        response = self.client.get(URL)
+        self.assertEqual(response.status_code, 200)
+        return response.data["count"]
+
+    def test_counter_is_read_from_user_row(self):
+        Notification.objects.create(user=self.author, tipo="voto", mensagem="voto")
+        self.client.force_authenticate(user=self.author)
+        # Nada depende do cache local do processo
+        cache.clear()
+
+        with CaptureQueriesContext(connection) as ctx:
+            self.assertEqual(self._count(), 1)
+
+        sql = " ".join(query["sql"] for query in ctx.captured_queries)
+        self.assertNotIn('"talks_notification"', sql)
+
+    def test_delivery_increments_counter(self):
+        self.client.force_authenticate(user=self.author)
+        self.assertEqual(self._count(), 0)
+
+        self._deliver_votes(self.voters)
+
+        self.assertEqual(self._count(), 3)
+
+    def test_mark_read_decrements_only_once(self):
+        self._deliver_votes(self.voters)
+        self.assertEqual(self._count(), 3)
+        notification = Notification.objects.filter(user=self.author).first()
+
+        self.client.patch(f"/api/notifications/{notification.id}/mark_read/")
+        self.client.patch(f"/api/notifications/{notification.id}/mark_read/")
+
+        self.assertEqual(self._count(), 2)
+
+    def test_mark_all_read_resets_counter(self):
+        self._deliver_votes(self.voters)
+        self.assertEqual(self._count(), 3)
+
+        self.client.post("/api/notifications/mark_all_read/")
+
+        self.assertEqual(self._count(), 0)
+
+    def test_deleting_unread_notification_decrements_counter(self):
+        self._deliver_votes(self.voters[:2])
+        self.assertEqual(self._count(), 2)
+
+        Notification.objects.filter(user=self.author).first().delete()
+
+        self.assertEqual(self._count(), 1)
+
+    @override_settings(NOTIFICATION_COALESCE_WINDOWS={"voto": 3600})
+    def test_coalesced_events_count_once_until_read(self):
+        self._deliver_votes(self.voters[:2])
+        self.assertEqual(self._count(), 1)
+
+        self._deliver_votes(self.voters[2:])
+        self.assertEqual(self._count(), 1)
+
+        self.client.post("/api/notifications/mark_all_read/")
+        self.client.force_authenticate(user=self.voters[0])
+        with self.captureOnCommitCallbacks(execute=True):
+            self.client.post(f"/api/ideas/{self.idea.id}/vote/")  # remove o voto
+            self.client.post(f"/api/ideas/{self.idea.id}/vote/")
+        with self.captureOnCommitCallbacks(execute=True):
+            NotificationOutboxService.process_batch()
+
+        self.client.force_authenticate(user=self.author)
+        self.assertEqual(self._count(), 1)
+        self.assertEqual(
+            UnreadCounterService.get(self.author.pk),
+            Notification.objects.filter(user=self.author, lido=False).count(),
+        )
@@ -0,0 +1,124 @@
+"""
+Integration tests for the persisted RetroItem.vote_count counter.
+"""
+
+from django.contrib.auth import get_user_model
+from django.core.cache import cache
+from django.test import TestCase
+from rest_framework.test import APIClient
+
+from core.models.configuration import SystemConfiguration
+from talks.models import Retro, RetroItem, RetroTemplate
+from talks.services.action_items_tracker import ActionItemsTracker
+
+User = get_user_model()
+
+
+class RetroItemVoteCounterTest(TestCase):
+    """Test that vote_count follows votes and drives the board ordering."""
+
+    def setUp(self):
+        cache.clear()
+        self.client = APIClient()
+        SystemConfiguration.objects.create(chapter_enabled=True, retro_enabled=True)
+
+        self.author = User.objects.create_user(username="author", password="test123")
+        self.voters = [
+            User.objects.create_user(username=f"voter{i}", password="test123")
+            for i in range(3)
+        ]
+        self.template = RetroTemplate.objects.create(
+            nome="Template",
+            categorias=[
+                {"slug": "went_well", "nome": "Foi bem"},
+                {"slug": "action_items", "nome": "Ações"},
+            ],
+        )
+        self.retro = self._retro("Retro")
+
+    def tearDown(self):
+        cache.clear()
+
+    def _retro(self, titulo):
+        retro = Retro.objects.create(
+            titulo=titulo, template=self.template, autor=self.author
+        )
+        retro.participantes.add(self.author, *self.voters)
+        return retro
+
+    def _item(self, conteudo, categoria="went_well", retro=None, voters=()):
+        item = RetroItem.objects.create(
+            retro=retro or self.retro,
+            categoria=categoria,
+            conteudo=conteudo,
+            autor=self.author,
+        )
+        for voter in voters:
+            item.toggle_vote(voter)
+        return item
+
+    def test_vote_endpoint_updates_stored_counter(self):
+        item = self._item("Item")
+        self.client.force_authenticate(user=self.voters[0])
+        url = f"/api/retros/{self.retro.id}/items/{item.id}/vote/"
+
+        response = self.client.post(url)
+        self.assertEqual(response.data, {"voted": True, "vote_count": 1})
+
+        response = self.client.post(url)
+        self.assertEqual(response.data, {"voted": False, "vote_count": 0})
+
+        item.refresh_from_db()
+        self.assertEqual(item.vote_count, 0)
+
+    def test_toggle_vote_applies_delta_without_recounting(self):
+        item = self._item("Item", voters=self.voters[:1])
+        RetroItem.objects.filter(pk=item.pk).update(vote_count=10)
+
+        # Delta sobre o valor persistido, sem recontar a tabela de votos
+        self.assertTrue(item.toggle_vote(self.voters[1]))
+        self.assertEqual(item.vote_count, 11)
+
+        self.assertFalse(item.toggle_vote(self.voters[1]))
+        self.assertEqual(item.vote_count, 10)
+
+    def test_default_ordering_uses_counter_without_joining_votes(self):
+        low = self._item("Pouco votado", voters=self.voters[:1])
+        high = self._item("Mais votado", voters=self.voters)
+        none = self._item("Sem votos")
+
+        queryset = RetroItem.objects.filter(retro=self.retro)
+
+        self.assertNotIn("talks_retroitem_votes", str(queryset.query))
+        self.assertEqual(list(queryset), [high, low, none])
+
+    def test_deleting_voter_recounts_items(self):
+        item = self._item("Item", voters=self.voters)
+        self.assertEqual(item.vote_count, 3)
+
+        self.voters[0].delete()
+
+        item.refresh_from_db()
+        self.assertEqual(item.vote_count, 2)
+
+    def test_refresh_vote_count_repairs_drift(self):
+        item = self._item("Item", voters=self.voters[:2])
+        RetroItem.objects.filter(pk=item.pk).update(vote_count=10)
+
+        RetroItem.objects.refresh_vote_count()
+
+        item.refresh_from_db()
+        self.assertEqual(item.vote_count, 2)
+
+    def test_action_items_tracker_sees_each_voted_item_once(self):
+        self._item("Documentar o deploy", "action_items", voters=self.voters)
+        self._item("Revisar alertas", "action_items", voters=self.voters[:2])
+        current = self._retro("Retro atual")
+        self._item("Documentar o deploy", "action_items", retro=current)
+
+        result = ActionItemsTracker.analyze([self.retro.id, current.id])
+
+        self.assertEqual(result["total_action_items_anterior"], 2)
+        self.assertEqual(result["recorrentes"], 1)
+        self.assertEqual(result["resolvidos"], 1)
+        self.assertEqual(result["novos"], 0)
@@ -0,0 +1,186 @@
+"""
+Integration tests for the annotated, prefetch-free retro list.
+"""
+
+from django.contrib.auth import get_user_model
+from django.core.cache import cache
+from django.db import connection
+from django.test import TestCase
+from django.test.utils import CaptureQueriesContext
+from rest_framework.test import APIClient
+
+from core.models.configuration import SystemConfiguration
+from core.serializers import UserProfileSerializer
+from talks.models import Idea, Retro, RetroItem, RetroTemplate
+
+User = get_user_model()
+
+URL = "/api/retros/"
+
+
+class RetroListQueriesTest(TestCase):
+    """Test that list totals come from annotations and the detail from prefetches."""
+
+    def setUp(self):
+        cache.clear()
+        self.client = APIClient()
+        SystemConfiguration.objects.create(chapter_enabled=True, retro_enabled=True)
+
+        self.author = User.objects.create_user(username="author", password="test123")
+        self.users = [
+            User.objects.create_user(username=f"user{i}", password="test123")
+            for i in range(3)
+        ]
+        self.template = RetroTemplate.objects.create(
+            nome="Template",
+            categorias=[{"slug": "went_well", "nome": "Foi bem"}],
+        )
+        self.client.force_authenticate(user=self.author)
+
+    def tearDown(self):
+        cache.clear()
+
+    def _retro(self, titulo, items=0, voters=()):
+        retro = Retro.objects.create(
+            titulo=titulo, template=self.template, autor=self.author
+        )
+        retro.participantes.add(self.author, *voters)
+        for i in range(items):
+            item = RetroItem.objects.create(
+                retro=retro,
+                categoria="went_well",
+                conteudo=f"Item {i}",
+                autor=self.author,
+            )
+            for voter in voters:
+                item.toggle_vote(voter)
+        return retro
+
+    def _list(self, **params):
+        cache.clear()
+        with CaptureQueriesContext(connection) as ctx:
+            response = self.client.get(URL, params)
+        self.assertEqual(response.status_code, 200)
+        return response, ctx.captured_queries
+
+    def test_list_totals_come_from_annotations(self):
+        retro = self._retro("Retro", items=3, voters=self.users[:2])
+        self._retro("Vazia")
+
+        response, queries = self._list()
+
+        totals = {
+            item["id"]: (
+                item["total_items"],
+                item["total_participantes"],
+                item["total_votos"],
+            )
+            for item in response.data["results"]
+        }
+        self.assertEqual(totals[retro.id], (3, 3, 6))
+        self.assertIn((0, 1, 0), totals.values())
+        self.assertFalse(
+            any("talks_retroitem_votes" in query["sql"] for query in queries)
+        )
+
+    def test_list_query_count_does_not_grow_with_boards(self):
+        retros = [self._retro(f"Retro {i}", items=1) for i in range(3)]
+        _, baseline = self._list()
+
+        for retro in retros:
+            retro.participantes.add(*self.users)
+            for i in range(5):
+                item = RetroItem.objects.create(
+                    retro=retro,
+                    categoria="went_well",
+                    conteudo=f"Extra {i}",
+                    autor=self.author,
+                )
+                for user in self.users:
+                    item.toggle_vote(user)
+        self._retro("Outra", items=5, voters=self.users)
+        _, queries = self._list()
+
+        self.assertEqual(len(queries), len(baseline))
+
+    def test_list_author_keeps_profile_payload(self):
+        retro = self._retro("Retro")
+        ideas = [
+            Idea.objects.create(
+                titulo=f"Idea {i}",
+                descricao="Idea of the retro author",
+                conteudo="<p>Body</p>",
+                autor=self.author,
+            )
+            for i in range(6)
+        ]
+        ideas[0].toggle_vote(self.author)
+
+        response, _ = self._list()
+
+        author = response.data["results"][0]["autor"]
+        expected = UserProfileSerializer(
+            User.objects.get(pk=self.author.pk),
+            context={"request": response.wsgi_request},
+        ).data
+        self.assertEqual(response.data["results"][0]["id"], retro.id)
+        self.assertEqual(set(author), set(expected))
+        self.assertEqual(author["ideias_criadas_count"], 6)
+        self.assertEqual(author["votos_count"], 1)
+        self.assertEqual(
+            [idea["id"] for idea in author["ideias_criadas"]],
+            [idea["id"] for idea in expected["ideias_criadas"]],
+        )
+        self.assertEqual(len(author["ideias_criadas"]), 5)
+        has_voted = {idea["id"]: idea["has_voted"] for idea in author["ideias_criadas"]}
+        self.assertFalse(has_voted[ideas[5].id])
+
+    def test_list_query_count_does_not_grow_with_authors(self):
+        def author_retro(user):
+            Retro.objects.create(titulo="Retro", template=self.template, autor=user)
+            for i in range(3):
+                idea = Idea.objects.create(
+                    titulo=f"Idea {i}",
+                    descricao="Idea",
+                    conteudo="<p>Body</p>",
+                    autor=user,
+                    apresentador=self.author,
+                )
+                idea.toggle_vote(user)
+
+        author_retro(self.author)
+        _, baseline = self._list()
+
+        for user in self.users:
+            author_retro(user)
+        _, queries = self._list()
+
+        self.assertEqual(len(queries), len(baseline))
+
+    def test_participante_filter_returns_each_retro_once(self):
+        retro = self._retro("Retro", items=2, voters=self.users)
+
+        response, _ = self._list(participante=self.users[0].id)
+
+        self.assertEqual([item["id"] for item in response.data["results"]], [retro.id])
+        self.assertEqual(response.data["results"][0]["total_participantes"], 4)
+
+    def test_detail_keeps_prefetched_board(self):
+        retro = self._retro("Retro", items=7, voters=self.users[:1])
+        self.client.force_authenticate(user=self.users[0])
+
+        cache.clear()
+        with CaptureQueriesContext(connection) as ctx:
+            response = self.client.get(f"{URL}{retro.id}/")
+
+        self.assertEqual(len(response.data["items"]), 7)
+        self.assertTrue(all(item["has_voted"] for item in response.data["items"]))
+        self.assertEqual(response.data["total_items"], 7)
+        self.assertEqual(response.data["total_votos"], 7)
+        # Votos de todos os itens num único prefetch (has_voted usa o cache)
+        votes_queries = [
+            query
+            for query in ctx.captured_queries
+            if "talks_retroitem_votes" in query["sql"]
+        ]
+        self.assertEqual(len(votes_queries), 1)
@@ -0,0 +1,74 @@
+from django.core.cache import cache
+from django.test import TestCase
+
+from core.models import User
+from talks.handlers import activation_changed
+from talks.services.population_stats import PopulationStatsService
+
+
+class PopulationStatsServiceTestCase(TestCase):
+    """Testes para PopulationStatsService."""
+
+    def setUp(self):
+        cache.clear()
+        self.user = User.objects.create_user(username="ativo", password="test123")
+
+    def tearDown(self):
+        cache.clear()
+
+    def test_active_user_count_is_cached(self):
+        """Segunda leitura não deve consultar o banco"""
+        self.assertEqual(PopulationStatsService.active_user_count(), 1)
+        with self.assertNumQueries(0):
+            self.assertEqual(PopulationStatsService.active_user_count(), 1)
+
+    def test_user_creation_invalidates_cache(self):
+        """Criar usuário deve invalidar o total"""
+        PopulationStatsService.active_user_count()
+        User.objects.create_user(username="novo", password="test123")
+        self.assertEqual(PopulationStatsService.active_user_count(), 2)
+
+    def test_deactivation_and_activation_invalidate_cache(self):
+        """Desativar/reativar usuário deve invalidar o total"""
+        PopulationStatsService.active_user_count()
+
+        self.user.is_active = False
+        self.user.save()
+        self.assertEqual(PopulationStatsService.active_user_count(), 0)
+
+        self.user.is_active = True
+        self.user.save()
+        self.assertEqual(PopulationStatsService.active_user_count(), 1)
+
+    def test_total_cached_before_commit_is_discarded(self):
+        """Total recacheado antes do commit deve ser descartado no commit"""
+        PopulationStatsService.active_user_count()
+
+        with self.captureOnCommitCallbacks(execute=True):
+            User.objects.create_user(username="novo", password="test123")
+            # Leitura concorrente antes do commit ainda vê o total antigo
+            cache.set(PopulationStatsService.CACHE_KEY, 1)
+
+        self.assertEqual(PopulationStatsService.active_user_count(), 2)
+
+    def test_activation_changed_only_when_is_active_changes(self):
+        """activation_changed deve refletir apenas mudanças reais de is_active"""
+        self.user.first_name = "Novo"
+        self.user.save()
+        self.assertFalse(activation_changed(self.user))
+
+        self.user.is_active = False
+        self.user.save()
+        self.assertTrue(activation_changed(self.user))
+
+    def test_last_login_update_keeps_cache(self):
+        """Salvar apenas last_login não deve invalidar o total"""
+        PopulationStatsService.active_user_count()
+        self.user.save(update_fields=["last_login"])
+        with self.assertNumQueries(0):
+            PopulationStatsService.active_user_count()
+
+    def test_vote_percentage(self):
+        """Porcentagem calculada sobre usuários ativos"""
+        User.objects.create_user(username="outro", password="test123")
+        self.assertEqual(PopulationStatsService.vote_percentage(1), 50.0)
@@ -0,0 +1,26 @@
+from django.test import SimpleTestCase, override_settings
+
+from talks.checks import check_shared_cache
+
+LOCMEM = {"default": {"BACKEND": "django.core.cache.backends.locmem.LocMemCache"}}
+REDIS = {
+    "default": {
+        "BACKEND": "django.core.cache.backends.redis.RedisCache",
+        "LOCATION": "redis://redis:6379/0",
+    }
+}
+
+
+class SharedCacheCheckTestCase(SimpleTestCase):
+    """Testes para o check de deploy do cache compartilhado."""
+
+    @override_settings(CACHES=LOCMEM)
+    def test_process_local_cache_warns(self):
+        """LocMemCache deve gerar o aviso talks.W001"""
+        messages = check_shared_cache(None)
+        self.assertEqual([message.id for message in messages], ["talks.W001"])
+
+    @override_settings(CACHES=REDIS)
+    def test_shared_cache_passes(self):
+        """Redis não deve gerar avisos"""
+        self.assertEqual(check_shared_cache(None), [])
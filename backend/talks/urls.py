@@ -15,6 +15,12 @@ router.register(
 )
 
 urlpatterns = [
+    # Antes do router, para não casar com notifications/<pk>/
+    path(
+        "notifications/stream/",
+        api_views.notification_stream,
+        name="notification-stream",
+    ),
     path("", include(router.urls)),
     path("upload/image/", api_views.upload_image, name="upload-image"),
 ]
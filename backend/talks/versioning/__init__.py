@@ -0,0 +1,13 @@
+from talks.versioning.mixins import ConditionalGetMixin
+from talks.versioning.response_cache import (
+    AnonymousResponseCacheMixin,
+    cache_anonymous_response,
+)
+from talks.versioning.stamps import ResourceVersion
+
+__all__ = [
+    "AnonymousResponseCacheMixin",
+    "ConditionalGetMixin",
+    "ResourceVersion",
+    "cache_anonymous_response",
+]
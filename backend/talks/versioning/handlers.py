@@ -0,0 +1,196 @@
+"""
+Receivers que invalidam os carimbos de ``ResourceVersion``.
+
+Escopos usados pelas views:
+- ``ideas``: listagem de ideias (ideias, votos, comentários, tags das ideias)
+- ``idea:<id>``: detalhe da ideia (+ comentários)
+- ``ideas:epoch``: todas as ideias; expira na próxima ``data_agendada``,
+  quando o status calculado de alguma ideia muda sem escrita no banco
+- ``retro:<id>``: detalhe da retro (itens, votos nos itens, participantes)
+- ``users``, ``tags``, ``retro_templates``: dados aninhados nos payloads
+"""
+
+from django.conf import settings
+from django.db.models import Min
+from django.db.models.signals import m2m_changed, post_delete, post_save
+from django.dispatch import receiver
+from django.utils import timezone
+
+from talks.models import Comment, Idea, Retro, RetroItem, RetroTemplate, Tag, Vote
+from talks.notifications.signals import (
+    idea_rescheduled,
+    idea_voted,
+    volunteer_registered,
+    volunteer_removed,
+)
+from talks.versioning.stamps import ResourceVersion
+
+IDEAS = "ideas"
+IDEAS_EPOCH = "ideas:epoch"
+
+
+def idea_scope(idea_id):
+    return f"idea:{idea_id}"
+
+
+def retro_scope(retro_id):
+    return f"retro:{retro_id}"
+
+
+def seconds_until_next_schedule():
+    now = timezone.now()
+    proxima = Idea.objects.filter(data_agendada__gt=now).aggregate(
+        proxima=Min("data_agendada")
+    )["proxima"]
+    if proxima is None:
+        return ResourceVersion.TIMEOUT
+    seconds = int((proxima - now).total_seconds()) + 1
+    return min(ResourceVersion.TIMEOUT, seconds)
+
+
+ResourceVersion.timeouts[IDEAS_EPOCH] = seconds_until_next_schedule
+
+
+def m2m_target_ids(instance, action, reverse, pk_set, reverse_ids):
+    """
+    IDs do lado "dono" de uma relação M2M afetados por ``m2m_changed``.
+
+    ``reverse_ids`` recebe a instância do lado reverso e retorna os IDs
+    atuais (usado em ``pre_clear``, quando ``pk_set`` não é informado).
+    """
+    if not reverse:
+        return [instance.pk]
+    if action == "pre_clear":
+        return list(reverse_ids(instance))
+    return list(pk_set or ())
+
+
+@receiver(post_save, sender=Idea)
+def bump_idea_version(sender, instance, created, update_fields=None, **kwargs):
+    scopes = [IDEAS, idea_scope(instance.pk)]
+
+    # O epoch depende só das datas agendadas (recalcula o próximo vencimento)
+    if created:
+        schedule_changed = instance.data_agendada is not None
+    else:
+        schedule_changed = update_fields is None or "data_agendada" in update_fields
+    if schedule_changed:
+        scopes.append(IDEAS_EPOCH)
+
+    ResourceVersion.bump(*scopes)
+
+
+@receiver(post_delete, sender=Idea)
+def bump_idea_version_on_delete(sender, instance, **kwargs):
+    ResourceVersion.bump(IDEAS, IDEAS_EPOCH, idea_scope(instance.pk))
+
+
+@receiver(m2m_changed, sender=Idea.tags.through)
+def bump_idea_tags_version(sender, instance, action, reverse, pk_set, **kwargs):
+    if action not in ("post_add", "post_remove", "pre_clear"):
+        return
+    ids = m2m_target_ids(
+        instance,
+        action,
+        reverse,
+        pk_set,
+        lambda tag: tag.ideias.values_list("id", flat=True),
+    )
+    ResourceVersion.bump(IDEAS, *(idea_scope(idea_id) for idea_id in ids))
+
+
+@receiver(post_save, sender=Vote)
+@receiver(post_delete, sender=Vote)
+def bump_vote_version(sender, instance, **kwargs):
+    ResourceVersion.bump(IDEAS, idea_scope(instance.idea_id))
+
+
+@receiver(idea_voted)
+@receiver(idea_rescheduled)
+@receiver(volunteer_registered)
+@receiver(volunteer_removed)
+def bump_idea_version_on_action(sender, idea, **kwargs):
+    ResourceVersion.bump(IDEAS, idea_scope(idea.pk))
+
+
+@receiver(post_save, sender=Comment)
+@receiver(post_delete, sender=Comment)
+def bump_comment_version(sender, instance, **kwargs):
+    # A listagem exibe comment_count/last_comment_at
+    ResourceVersion.bump(IDEAS, idea_scope(instance.idea_id))
+
+
+@receiver(post_save, sender=Tag)
+@receiver(post_delete, sender=Tag)
+def bump_tag_version(sender, **kwargs):
+    ResourceVersion.bump("tags")
+
+
+@receiver(post_save, sender=Retro)
+@receiver(post_delete, sender=Retro)
+def bump_retro_version(sender, instance, **kwargs):
+    ResourceVersion.bump(retro_scope(instance.pk))
+
+
+@receiver(m2m_changed, sender=Retro.participantes.through)
+def bump_retro_participants_version(
+    sender, instance, action, reverse, pk_set, **kwargs
+):
+    if action not in ("post_add", "post_remove", "pre_clear"):
+        return
+    ids = m2m_target_ids(
+        instance,
+        action,
+        reverse,
+        pk_set,
+        lambda user: user.retros_participadas.values_list("id", flat=True),
+    )
+    ResourceVersion.bump(*(retro_scope(retro_id) for retro_id in ids))
+
+
+@receiver(post_save, sender=RetroItem)
+@receiver(post_delete, sender=RetroItem)
+def bump_retro_item_version(sender, instance, **kwargs):
+    ResourceVersion.bump(retro_scope(instance.retro_id))
+
+
+@receiver(m2m_changed, sender=RetroItem.votes.through)
+def bump_retro_item_votes_version(sender, instance, action, reverse, pk_set, **kwargs):
+    if action not in ("post_add", "post_remove", "pre_clear"):
+        return
+    if not reverse:
+        ResourceVersion.bump(retro_scope(instance.retro_id))
+        return
+
+    item_ids = m2m_target_ids(
+        instance,
+        action,
+        reverse,
+        pk_set,
+        lambda user: user.retro_items_votados.values_list("id", flat=True),
+    )
+    retro_ids = (
+        RetroItem.objects.filter(pk__in=item_ids)
+        .values_list("retro_id", flat=True)
+        .distinct()
+    )
+    ResourceVersion.bump(*(retro_scope(retro_id) for retro_id in retro_ids))
+
+
+@receiver(post_save, sender=RetroTemplate)
+@receiver(post_delete, sender=RetroTemplate)
+def bump_retro_template_version(sender, **kwargs):
+    ResourceVersion.bump("retro_templates")
+
+
+@receiver(post_save, sender=settings.AUTH_USER_MODEL)
+def bump_user_version(sender, update_fields=None, **kwargs):
+    # Login atualiza apenas last_login, que não aparece nos payloads
+    if update_fields is not None and set(update_fields) <= {"last_login"}:
+        return
+    ResourceVersion.bump("users")
+
+
+@receiver(post_delete, sender=settings.AUTH_USER_MODEL)
+def bump_user_version_on_delete(sender, **kwargs):
+    ResourceVersion.bump("users")
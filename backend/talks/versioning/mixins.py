@@ -0,0 +1,69 @@
+import hashlib
+
+from django.utils.cache import (
+    get_conditional_response,
+    patch_cache_control,
+    patch_vary_headers,
+)
+from django.utils.http import http_date
+
+from talks.versioning.stamps import ResourceVersion
+
+
+class ConditionalGetMixin:
+    """
+    GET condicional (``ETag`` / ``Last-Modified`` / ``304``) para list e
+    retrieve.
+
+    A view define em ``get_version_scopes`` de quais escopos de
+    ``ResourceVersion`` a resposta depende. Quando o cliente envia
+    ``If-None-Match`` (ou ``If-Modified-Since``) ainda válido, a resposta
+    ``304`` sai apenas com a leitura dos carimbos, sem queryset nem
+    serialização.
+    """
+
+    def get_version_scopes(self):
+        return None
+
+    def list(self, request, *args, **kwargs):
+        return self.conditional_response(super().list, request, *args, **kwargs)
+
+    def retrieve(self, request, *args, **kwargs):
+        return self.conditional_response(super().retrieve, request, *args, **kwargs)
+
+    def conditional_response(self, handler, request, *args, **kwargs):
+        scopes = self.get_version_scopes()
+        if not scopes:
+            return handler(request, *args, **kwargs)
+
+        stamps = ResourceVersion.get(scopes)
+        etag = self.get_etag(request, stamps)
+        last_modified = max(stamps.values()) // 10**9
+
+        response = get_conditional_response(
+            request, etag=etag, last_modified=last_modified
+        )
+        if response is None:
+            response = handler(request, *args, **kwargs)
+            if response.status_code != 200:
+                return response
+
+        response.headers["ETag"] = etag
+        response.headers["Last-Modified"] = http_date(last_modified)
+        patch_cache_control(response, private=True, no_cache=True)
+        patch_vary_headers(response, ["Authorization", "Cookie"])
+        return response
+
+    def get_etag(self, request, stamps):
+        """
+        ETag forte: versões dos escopos + URL + usuário + formato, já que o
+        payload depende do usuário (``has_voted``, ``is_presenter``...).
+        """
+        parts = [f"{scope}={stamps[scope]}" for scope in sorted(stamps)]
+        parts += [
+            request.get_full_path(),
+            str(request.user.pk or ""),
+            request.accepted_media_type or "",
+        ]
+        digest = hashlib.sha1("|".join(parts).encode("utf-8")).hexdigest()
+        return f'"{digest}"'
@@ -0,0 +1,81 @@
+import hashlib
+from functools import partial, wraps
+
+from django.core.cache import cache
+from rest_framework.response import Response
+
+from talks.versioning.stamps import ResourceVersion
+
+
+class AnonymousResponseCacheMixin:
+    """
+    Cache compartilhado das respostas de GETs anônimos.
+
+    Visitantes sem login recebem o mesmo payload, então a resposta de uma
+    action é guardada por URL normalizada (parâmetros ordenados, vazios
+    descartados). A chave inclui os carimbos de ``ResourceVersion`` dos
+    escopos da action: quando algum escopo muda, a entrada antiga deixa de
+    ser usada e expira sozinha.
+
+    ``list`` é coberta pelo mixin; outras actions usam
+    ``@cache_anonymous_response``.
+
+    As entradas ficam no cache ``default``, que em produção é o Redis de
+    ``REDIS_URL``; ``check --deploy`` avisa (talks.W001) quando ele é local
+    ao processo.
+    """
+
+    KEY_PREFIX = "response:"
+    anonymous_cache_timeout = 60 * 10  # 10 minutos
+
+    def get_response_cache_scopes(self):
+        return None
+
+    def list(self, request, *args, **kwargs):
+        return self.anonymous_cached_response(super().list, request, *args, **kwargs)
+
+    def anonymous_cached_response(self, handler, request, *args, **kwargs):
+        scopes = self.get_response_cache_scopes()
+        if not scopes or request.method != "GET" or request.user.is_authenticated:
+            return handler(request, *args, **kwargs)
+
+        key = self.get_response_cache_key(request, ResourceVersion.get(scopes))
+        data = cache.get(key)
+        if data is not None:
+            return Response(data)
+
+        response = handler(request, *args, **kwargs)
+        if response.status_code == 200:
+            cache.set(key, response.data, timeout=self.anonymous_cache_timeout)
+        return response
+
+    def get_response_cache_key(self, request, stamps):
+        query = sorted(
+            (name, value)
+            for name, values in request.query_params.lists()
+            for value in values
+            if value != ""
+        )
+        parts = [f"{scope}={stamps[scope]}" for scope in sorted(stamps)]
+        parts += [
+            request.get_host(),
+            request.path,
+            repr(query),
+            request.accepted_media_type or "",
+        ]
+        digest = hashlib.sha1("|".join(parts).encode("utf-8")).hexdigest()
+        return f"{self.KEY_PREFIX}{self.action}:{digest}"
+
+
+def cache_anonymous_response(func):
+    """
+    Aplica o cache de ``AnonymousResponseCacheMixin`` a uma action.
+    """
+
+    @wraps(func)
+    def wrapper(self, request, *args, **kwargs):
+        return self.anonymous_cached_response(
+            partial(func, self), request, *args, **kwargs
+        )
+
+    return wrapper
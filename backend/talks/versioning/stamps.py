@@ -0,0 +1,66 @@
+import time
+
+from django.core.cache import cache
+from django.db import transaction
+
+
+class ResourceVersion:
+    """
+    Carimbos de versão por recurso, guardados no cache.
+
+    Um escopo é um nome livre: ``"ideas"`` (coleção), ``"idea:42"`` (objeto),
+    ``"users"``... ``bump`` descarta o carimbo e a próxima leitura cria um
+    novo (``time.time_ns()``), que também serve de ``Last-Modified``. Assim
+    as views montam ETags e chaves de cache sem consultar o banco.
+
+    Requer um cache compartilhado entre os processos: em produção o
+    ``default`` é o Redis de ``REDIS_URL`` (ver settings e docker-compose).
+    """
+
+    KEY_PREFIX = "version:"
+    TIMEOUT = 60 * 60 * 24  # 1 dia
+
+    # escopo -> callable que retorna o tempo de vida do carimbo (em segundos)
+    timeouts = {}
+
+    @classmethod
+    def key(cls, scope):
+        return f"{cls.KEY_PREFIX}{scope}"
+
+    @classmethod
+    def get(cls, scopes) -> dict:
+        """
+        Retorna ``{escopo: carimbo}`` com uma única leitura no cache.
+        """
+        keys = {cls.key(scope): scope for scope in scopes}
+        stamps = {keys[key]: value for key, value in cache.get_many(keys).items()}
+
+        for scope in scopes:
+            if scope not in stamps:
+                stamps[scope] = cls._start(scope)
+        return stamps
+
+    @classmethod
+    def _start(cls, scope):
+        stamp = time.time_ns()
+        get_timeout = cls.timeouts.get(scope)
+        timeout = get_timeout() if get_timeout else cls.TIMEOUT
+
+        if cache.add(cls.key(scope), stamp, timeout=timeout):
+            return stamp
+        return cache.get(cls.key(scope), stamp)
+
+    @classmethod
+    def bump(cls, *scopes) -> None:
+        """
+        Invalida os escopos agora e, dentro de uma transação, de novo após o
+        commit: um carimbo criado por uma leitura concorrente antes do commit
+        (com os dados antigos) também é descartado.
+        """
+        keys = [cls.key(scope) for scope in scopes]
+        if not keys:
+            return
+
+        cache.delete_many(keys)
+        if transaction.get_connection().in_atomic_block:
+            transaction.on_commit(lambda: cache.delete_many(keys))
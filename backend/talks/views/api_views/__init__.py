@@ -1,3 +1,4 @@
+from talks.views.api_views.notification_stream_view import notification_stream
 from talks.views.api_views.uploads_api_view import upload_image
 
-__all__ = ["upload_image"]
+__all__ = ["notification_stream", "upload_image"]
@@ -0,0 +1,96 @@
+import asyncio
+
+import orjson
+from asgiref.sync import sync_to_async
+from django.conf import settings
+from django.contrib.auth import get_user_model
+from django.http import JsonResponse, StreamingHttpResponse
+from rest_framework_simplejwt.authentication import JWTAuthentication
+from rest_framework_simplejwt.exceptions import InvalidToken, TokenError
+
+from talks.notifications.stream import (
+    StreamTicketService,
+    broker,
+    get_stream_backend,
+)
+from talks.notifications.unread_counter import UnreadCounterService
+
+
+def format_event(name: str, data: dict) -> str:
+    return f"event: {name}\ndata: {orjson.dumps(data).decode()}\n\n"
+
+
+async def authenticate(request):
+    """
+    Autentica pelo header ``Authorization`` ou por um ticket de uso único em
+    ``?ticket=`` (o ``EventSource`` do navegador não permite enviar headers).
+    JWT na query string não é aceito.
+    """
+    authentication = JWTAuthentication()
+    header = authentication.get_header(request)
+    if header is None:
+        ticket = request.GET.get("ticket")
+        if not ticket:
+            return None
+        user_id = await sync_to_async(StreamTicketService.redeem)(ticket)
+        if user_id is None:
+            return None
+        return await get_user_model().objects.filter(pk=user_id).afirst()
+
+    raw_token = authentication.get_raw_token(header)
+    if not raw_token:
+        return None
+    try:
+        validated_token = authentication.get_validated_token(raw_token)
+        return await sync_to_async(authentication.get_user)(validated_token)
+    except (InvalidToken, TokenError):
+        return None
+
+
+async def stream_notifications(user_id: int):
+    get_stream_backend().start(broker)
+    queue = broker.subscribe(user_id)
+    try:
+        yield "retry: 5000\n\n"
+        count = await sync_to_async(UnreadCounterService.get)(user_id)
+        yield format_event("unread_count", {"unread_count": count})
+        while True:
+            try:
+                event = await asyncio.wait_for(
+                    queue.get(), timeout=settings.NOTIFICATION_STREAM_KEEPALIVE
+                )
+            except asyncio.TimeoutError:
+                # Mantém a conexão viva através de proxies
+                yield ": keepalive\n\n"
+                continue
+            # Contador lido agora, no processo que encaminha: reflete
+            # mark_read/mark_all_read feitos depois da entrega
+            unread_count = await sync_to_async(UnreadCounterService.get)(user_id)
+            yield format_event("notification", {**event, "unread_count": unread_count})
+    finally:
+        broker.unsubscribe(user_id, queue)
+
+
+async def notification_stream(request):
+    """
+    Stream SSE das notificações do usuário autenticado.
+
+    Envia o contador de não lidas ao conectar e, depois, cada notificação
+    entregue pelo worker (evento ``notification``, com o contador
+    atualizado). Substitui o polling do badge; requer servidor ASGI.
+    """
+    if request.method != "GET":
+        return JsonResponse({"detail": "Método não permitido."}, status=405)
+
+    user = await authenticate(request)
+    if user is None or not user.is_active:
+        return JsonResponse(
+            {"detail": "Credenciais de autenticação inválidas ou ausentes."}, status=401
+        )
+
+    response = StreamingHttpResponse(
+        stream_notifications(user.pk), content_type="text/event-stream"
+    )
+    response["Cache-Control"] = "no-cache"
+    response["X-Accel-Buffering"] = "no"
+    return response
@@ -1,21 +1,39 @@
-from drf_spectacular.utils import extend_schema
+from collections import defaultdict
+
+from django.urls import reverse
+from drf_spectacular.utils import OpenApiParameter, extend_schema
 from rest_framework import status, viewsets
+from rest_framework.decorators import action
 from rest_framework.permissions import IsAuthenticatedOrReadOnly
 from rest_framework.response import Response
 
 from core.decorators import require_feature
 from talks.models import Comment
-from talks.notifications.signals import comment_created
+from talks.notifications.signals import comment_created, comment_deleted
+from talks.pagination import KeysetPagination, OptionalKeysetPaginationMixin
 from talks.serializers import (
+    CommentReplySerializer,
     CommentSerializer,
+    CommentThreadSerializer,
 )
 
 
 @extend_schema(tags=["comments"])
-class CommentViewSet(viewsets.ModelViewSet):
+class CommentViewSet(OptionalKeysetPaginationMixin, viewsets.ModelViewSet):
     serializer_class = CommentSerializer
     permission_classes = [IsAuthenticatedOrReadOnly]
     filterset_fields = ["idea", "user", "parent"]
+    keyset_ordering = ("created_at", "id")
+    keyset_actions = ("threads", "replies")
+    replies_per_thread = 3
+    max_replies_per_thread = 20
+
+    def get_serializer_class(self):
+        if self.action == "threads":
+            return CommentThreadSerializer
+        if self.action == "replies":
+            return CommentReplySerializer
+        return CommentSerializer
 
     def get_queryset(self):
         queryset = Comment.objects.select_related("user", "idea", "parent")
@@ -54,3 +72,95 @@ class CommentViewSet(viewsets.ModelViewSet):
                 status=status.HTTP_403_FORBIDDEN,
             )
         instance.delete()
+
+        comment_deleted.send(
+            sender=self.__class__, comment=instance, user=self.request.user
+        )
+
+    def get_replies_per_thread(self):
+        try:
+            limit = int(self.request.query_params["respostas_por_thread"])
+        except (KeyError, ValueError):
+            return self.replies_per_thread
+        return max(0, min(limit, self.max_replies_per_thread))
+
+    def attach_first_replies(self, roots):
+        """
+        Carrega as primeiras respostas de todas as threads da página em uma
+        query e monta o link ``respostas_next`` de cada thread.
+        """
+        limit = self.get_replies_per_thread()
+        replies_by_root = defaultdict(list)
+        if roots and limit:
+            replies = (
+                Comment.objects.filter(parent_id__in=[root.pk for root in roots])
+                .select_related("user")
+                .with_reply_count()
+                .first_replies(limit)
+            )
+            for reply in replies:
+                replies_by_root[reply.parent_id].append(reply)
+
+        cursor = KeysetPagination()
+        cursor.configure(Comment, self.keyset_ordering)
+
+        for root in roots:
+            root.respostas_carregadas = replies_by_root[root.pk]
+            root.respostas_next = None
+            if root.reply_count > len(root.respostas_carregadas):
+                url = self.request.build_absolute_uri(
+                    reverse("comment-replies", args=[root.pk])
+                )
+                if root.respostas_carregadas:
+                    url = cursor.encode_cursor(root.respostas_carregadas[-1], url)
+                root.respostas_next = url
+
+    @extend_schema(
+        summary="Threads de comentários",
+        description=(
+            "Lista os comentários raiz de uma ideia com paginação por cursor. "
+            "Cada thread traz `reply_count`, as primeiras respostas e "
+            "`respostas_next` para carregar as demais"
+        ),
+        parameters=[
+            OpenApiParameter("idea", int, required=True, description="ID da ideia"),
+            OpenApiParameter(
+                "respostas_por_thread",
+                int,
+                description=f"Respostas incluídas por thread (padrão {replies_per_thread}, máx {max_replies_per_thread})",
+            ),
+        ],
+    )
+    @action(detail=False, methods=["get"])
+    def threads(self, request):
+        try:
+            idea_id = int(request.query_params["idea"])
+        except (KeyError, ValueError):
+            return Response(
+                {"detail": "Informe o ID da ideia no parâmetro 'idea'."},
+                status=status.HTTP_400_BAD_REQUEST,
+            )
+
+        roots = (
+            Comment.objects.filter(idea_id=idea_id, parent__isnull=True)
+            .select_related("user")
+            .with_reply_count()
+        )
+
+        page = self.paginate_queryset(roots)
+        self.attach_first_replies(page)
+        serializer = self.get_serializer(page, many=True)
+        return self.get_paginated_response(serializer.data)
+
+    @extend_schema(
+        summary="Respostas de um comentário",
+        description="Lista as respostas diretas de um comentário com paginação por cursor",
+    )
+    @action(detail=True, methods=["get"])
+    def replies(self, request, pk=None):
+        comment = self.get_object()
+        replies = comment.respostas.select_related("user").with_reply_count()
+
+        page = self.paginate_queryset(replies)
+        serializer = self.get_serializer(page, many=True)
+        return self.get_paginated_response(serializer.data)
@@ -1,33 +1,69 @@
-from django.db.models import Count, Q
+from django.db.models import F
 from django.utils import timezone
-from drf_spectacular.utils import extend_schema, extend_schema_view
+from drf_spectacular.utils import OpenApiParameter, extend_schema, extend_schema_view
 from rest_framework import status, viewsets
 from rest_framework.decorators import action
+from rest_framework.exceptions import ValidationError
 from rest_framework.permissions import IsAuthenticated, IsAuthenticatedOrReadOnly
 from rest_framework.response import Response
+from rest_framework.settings import api_settings
 
 from core.decorators import require_feature
 from talks.filters import IdeaFilter
-from talks.models import Idea, Vote
+from talks.models import Idea
 from talks.notifications.signals import (
     idea_rescheduled,
     idea_voted,
     volunteer_registered,
 )
+from talks.pagination import OptionalKeysetPaginationMixin
 from talks.permissions import IsPresenterOrOwnerOrAdmin
 from talks.serializers import (
     IdeaCreateUpdateSerializer,
     IdeaDetailSerializer,
     IdeaListSerializer,
     RescheduleSerializer,
+    VoterSerializer,
 )
+from talks.services.idea_stats import IdeaStatsService
+from talks.versioning import (
+    AnonymousResponseCacheMixin,
+    ConditionalGetMixin,
+    cache_anonymous_response,
+)
+from talks.versioning.handlers import IDEAS, IDEAS_EPOCH, idea_scope
+
+
+def _split_param(value):
+    if not value:
+        return None
+    return [name.strip() for name in value.split(",") if name.strip()]
+
+
+SPARSE_FIELDSET_PARAMETERS = [
+    OpenApiParameter(
+        "fields",
+        str,
+        description="Campos a retornar, separados por vírgula (ex: id,titulo,tags)",
+    ),
+    OpenApiParameter(
+        "expand",
+        str,
+        description="Campos opcionais a incluir, separados por vírgula (ex: votos)",
+    ),
+]
 
 
 @extend_schema(tags=["ideas"])
 @extend_schema_view(
     list=extend_schema(
         summary="Listar ideias",
-        description="Lista todas as ideias com paginação e filtros avançados",
+        description=(
+            "Lista todas as ideias com paginação e filtros avançados. "
+            "Use `?pagination=cursor` para paginação por cursor (sem COUNT; "
+            "não combina com `?search=`)"
+        ),
+        parameters=SPARSE_FIELDSET_PARAMETERS,
     ),
     create=extend_schema(
         summary="Criar ideia",
@@ -36,6 +72,7 @@ from talks.serializers import (
     retrieve=extend_schema(
         summary="Detalhes da ideia",
         description="Retorna detalhes completos de uma ideia",
+        parameters=SPARSE_FIELDSET_PARAMETERS,
     ),
     update=extend_schema(
         summary="Atualizar ideia",
@@ -50,23 +87,111 @@ from talks.serializers import (
         description="Deleta uma ideia (apenas autor)",
     ),
 )
-class IdeaViewSet(viewsets.ModelViewSet):
+class IdeaViewSet(
+    ConditionalGetMixin,
+    AnonymousResponseCacheMixin,
+    OptionalKeysetPaginationMixin,
+    viewsets.ModelViewSet,
+):
     permission_classes = [IsAuthenticatedOrReadOnly, IsPresenterOrOwnerOrAdmin]
     filterset_class = IdeaFilter
-    search_fields = ["titulo", "descricao", "conteudo"]
-    ordering_fields = ["created_at", "data_agendada", "total_votes"]
-    ordering = ["-created_at"]
+    ordering_fields = [
+        "created_at",
+        "data_agendada",
+        "vote_count",
+        "total_votes",
+        "comment_count",
+        "last_comment_at",
+    ]
+    keyset_actions = ("voters",)
+    search_with_cursor_message = (
+        "A busca é ordenada por relevância e não suporta paginação por cursor; "
+        "remova o parâmetro pagination."
+    )
+
+    @property
+    def ordering(self):
+        if self.is_searching():
+            return ["-search_rank", "-created_at"]
+        return ["-created_at"]
+
+    def is_searching(self):
+        request = getattr(self, "request", None)
+        return (
+            self.action == "list"
+            and request is not None
+            and bool(request.query_params.get("search"))
+        )
+
+    def paginate_queryset(self, queryset):
+        # O cursor usa uma ordenação fixa que descartaria a relevância
+        if self.is_searching() and self.use_keyset_pagination():
+            raise ValidationError(
+                {api_settings.SEARCH_PARAM: [self.search_with_cursor_message]}
+            )
+        return super().paginate_queryset(queryset)
+
+    @property
+    def keyset_ordering(self):
+        if self.action == "timeline":
+            return ("data_agendada", "id")
+        return ("-created_at", "-id")
+
+    def get_version_scopes(self):
+        shared = [IDEAS_EPOCH, "users", "tags"]
+        if self.action == "list":
+            return [IDEAS, *shared]
+        if self.action == "retrieve":
+            return [idea_scope(self.kwargs["pk"]), *shared]
+        return None
+
+    def get_response_cache_scopes(self):
+        if self.action in ("list", "upcoming", "timeline", "stats"):
+            return [IDEAS, IDEAS_EPOCH, "users", "tags"]
+        return None
+
+    def get_sparse_fieldset(self):
+        params = self.request.query_params
+        expand = _split_param(params.get("expand")) or []
+        if self.is_searching():
+            expand.append("search_snippet")
+        return {
+            "fields": _split_param(params.get("fields")),
+            "expand": expand,
+        }
+
+    def get_requested_fields(self):
+        """
+        Campos que o serializer da action vai renderizar, ou None quando o
+        serializer não suporta ``?fields=``/``?expand=`` (carrega tudo).
+        """
+        serializer_class = self.get_serializer_class()
+        if not hasattr(serializer_class, "select_field_names"):
+            return None
+        return serializer_class.select_field_names(**self.get_sparse_fieldset())
 
     def get_queryset(self):
-        return Idea.objects.with_vote_stats().annotate(
-            total_votes=Count("votos", filter=Q(votos__user__is_active=True))
+        if self.action == "voters":
+            # A ideia só é usada para 404/permissões; os votos são paginados
+            return Idea.objects.only("id")
+        return Idea.objects.for_fields(self.get_requested_fields()).annotate(
+            total_votes=F("vote_count")
         )
 
+    def get_serializer(self, *args, **kwargs):
+        serializer_class = self.get_serializer_class()
+        if hasattr(serializer_class, "select_field_names"):
+            for key, value in self.get_sparse_fieldset().items():
+                kwargs.setdefault(key, value)
+        return super().get_serializer(*args, **kwargs)
+
     def get_serializer_class(self):
         if self.action == "retrieve":
             return IdeaDetailSerializer
         elif self.action in ["create", "update", "partial_update"]:
             return IdeaCreateUpdateSerializer
+        elif self.action == "voters":
+            return VoterSerializer
         return IdeaListSerializer
 
     def perform_create(self, serializer):
@@ -130,22 +255,46 @@ class IdeaViewSet(viewsets.ModelViewSet):
         idea = self.get_object()
         user = request.user
 
-        vote, created = Vote.objects.get_or_create(user=user, idea=idea)
+        voted = idea.toggle_vote(user)
 
-        if not created:
-            vote.delete()
+        if not voted:
             return Response(
-                {"detail": "Voto removido com sucesso.", "voted": False},
+                {
+                    "detail": "Voto removido com sucesso.",
+                    "voted": False,
+                    "vote_count": idea.vote_count,
+                },
                 status=status.HTTP_200_OK,
             )
         else:
             idea_voted.send(sender=self.__class__, idea=idea, user=user, voted=True)
 
             return Response(
-                {"detail": "Voto registrado com sucesso.", "voted": True},
+                {
+                    "detail": "Voto registrado com sucesso.",
+                    "voted": True,
+                    "vote_count": idea.vote_count,
+                },
                 status=status.HTTP_201_CREATED,
             )
 
+    @extend_schema(
+        summary="Votantes da ideia",
+        description=(
+            "Lista os votos da ideia (usuários ativos), mais recentes primeiro, "
+            "com paginação por cursor"
+        ),
+        responses={200: VoterSerializer(many=True)},
+    )
+    @action(detail=True, methods=["get"])
+    def voters(self, request, pk=None):
+        idea = self.get_object()
+        votes = idea.votos.roster()
+
+        page = self.paginate_queryset(votes)
+        serializer = self.get_serializer(page, many=True)
+        return self.get_paginated_response(serializer.data)
+
     @extend_schema(
         summary="Voluntariar-se",
         description="Inscreve-se para apresentar a ideia",
@@ -164,7 +313,7 @@ class IdeaViewSet(viewsets.ModelViewSet):
             )
 
         idea.apresentador = user
-        idea.save()
+        idea.save(update_fields=["apresentador", "updated_at"])
 
         volunteer_registered.send(sender=self.__class__, idea=idea, user=user)
 
@@ -201,7 +350,7 @@ class IdeaViewSet(viewsets.ModelViewSet):
             )
 
         idea.apresentador = None
-        idea.save()
+        idea.save(update_fields=["apresentador", "updated_at"])
 
         return Response(
             {"detail": "Apresentador removido com sucesso."},
@@ -212,29 +361,31 @@ class IdeaViewSet(viewsets.ModelViewSet):
         summary="Próximas apresentações",
         description="Retorna as próximas 5 apresentações agendadas",
         responses={200: IdeaListSerializer(many=True)},
+        parameters=SPARSE_FIELDSET_PARAMETERS,
     )
     @action(detail=False, methods=["get"])
+    @cache_anonymous_response
     def upcoming(self, request):
         upcoming_ideas = (
-            Idea.objects.with_vote_stats()
+            Idea.objects.for_fields(self.get_requested_fields())
             .filter(data_agendada__gte=timezone.now())
             .order_by("data_agendada")[:5]
         )
 
-        serializer = IdeaListSerializer(
-            upcoming_ideas, many=True, context={"request": request}
-        )
+        serializer = self.get_serializer(upcoming_ideas, many=True)
         return Response(serializer.data)
 
     @extend_schema(
         summary="Timeline de apresentações",
-        description="Retorna todas as apresentações agendadas, ordenadas por data. Suporta filtro por status (pendente, agendado, concluido)",
+        description="Retorna todas as apresentações agendadas, ordenadas por data. Suporta filtro por status (pendente, agendado, concluido) e `?pagination=cursor` para paginação por cursor",
         responses={200: IdeaListSerializer(many=True)},
+        parameters=SPARSE_FIELDSET_PARAMETERS,
     )
     @action(detail=False, methods=["get"])
+    @cache_anonymous_response
     def timeline(self, request):
         timeline_ideas = (
-            Idea.objects.with_vote_stats()
+            Idea.objects.for_fields(self.get_requested_fields())
             .filter(data_agendada__isnull=False)
             .order_by("data_agendada")
         )
@@ -249,14 +400,10 @@ class IdeaViewSet(viewsets.ModelViewSet):
 
         page = self.paginate_queryset(timeline_ideas)
         if page is not None:
-            serializer = IdeaListSerializer(
-                page, many=True, context={"request": request}
-            )
+            serializer = self.get_serializer(page, many=True)
             return self.get_paginated_response(serializer.data)
 
-        serializer = IdeaListSerializer(
-            timeline_ideas, many=True, context={"request": request}
-        )
+        serializer = self.get_serializer(timeline_ideas, many=True)
         return Response({"results": serializer.data, "count": len(serializer.data)})
 
     @extend_schema(
@@ -279,7 +426,7 @@ class IdeaViewSet(viewsets.ModelViewSet):
 
         old_date = idea.data_agendada
         idea.data_agendada = serializer.validated_data["data_agendada"]
-        idea.save()
+        idea.save(update_fields=["data_agendada", "updated_at"])
 
         idea_rescheduled.send(
             sender=self.__class__,
@@ -297,22 +444,6 @@ class IdeaViewSet(viewsets.ModelViewSet):
         description="Retorna estatísticas gerais do sistema de ideias",
     )
     @action(detail=False, methods=["get"])
+    @cache_anonymous_response
     def stats(self, request):
-        today = timezone.now()
-        total_ideias = Idea.objects.count()
-        pendentes = Idea.objects.filter(data_agendada__isnull=True).count()
-        agendadas = Idea.objects.filter(data_agendada__gt=today).count()
-        concluidas = Idea.objects.filter(data_agendada__lte=today).count()
-        precisa_apresentador = Idea.objects.filter(apresentador__isnull=True).count()
-        total_votos = Vote.objects.count()
-
-        stats = {
-            "total_ideias": total_ideias,
-            "pendentes": pendentes,
-            "agendadas": agendadas,
-            "concluidas": concluidas,
-            "precisa_apresentador": precisa_apresentador,
-            "total_votos": total_votos,
-        }
-
-        return Response(stats)
+        return Response(IdeaStatsService.snapshot())
@@ -1,26 +1,37 @@
+from django.conf import settings
+from django.db import transaction
+from django.utils import timezone
 from drf_spectacular.utils import extend_schema
-from rest_framework import viewsets
+from rest_framework import status, viewsets
 from rest_framework.decorators import action
 from rest_framework.permissions import IsAuthenticated
 from rest_framework.response import Response
 
+from talks.filters import NotificationFilter
 from talks.models import Notification
+from talks.notifications.stream import StreamTicketService
+from talks.notifications.unread_counter import UnreadCounterService
+from talks.pagination import OptionalKeysetPaginationMixin
 from talks.serializers import (
+    IdeaReferenceSerializer,
     NotificationSerializer,
 )
 
 
 @extend_schema(tags=["notifications"])
-class NotificationViewSet(viewsets.ReadOnlyModelViewSet):
+class NotificationViewSet(OptionalKeysetPaginationMixin, viewsets.ReadOnlyModelViewSet):
     serializer_class = NotificationSerializer
     permission_classes = [IsAuthenticated]
-    filterset_fields = ["tipo", "lido"]
+    filterset_class = NotificationFilter
 
     def get_queryset(self):
+        # A ideia vem no mesmo SELECT, só com as colunas da referência
+        idea_columns = [f"idea__{name}" for name in IdeaReferenceSerializer.only_fields]
         return (
             Notification.objects.filter(user=self.request.user)
-            .select_related("user", "idea")
-            .order_by("-created_at")
+            .select_related("idea")
+            .only(*NotificationSerializer.Meta.fields, "user", *idea_columns)
+            .order_by("-created_at", "-id")
         )
 
     @extend_schema(
@@ -29,10 +40,54 @@ class NotificationViewSet(viewsets.ReadOnlyModelViewSet):
     )
     @action(detail=False, methods=["get"])
     def unread(self, request):
-        unread_notifications = self.get_queryset().filter(lido=False)
+        unread_notifications = self.get_queryset().unread(
+            request.user.notifications_last_read_at
+        )
         serializer = self.get_serializer(unread_notifications, many=True)
         return Response(serializer.data)
 
+    @extend_schema(
+        summary="Contador de não lidas",
+        description=(
+            "Retorna apenas o número de notificações não lidas (badge). "
+            "Servido por um contador mantido na linha do usuário"
+        ),
+        responses={
+            200: {"type": "object", "properties": {"count": {"type": "integer"}}}
+        },
+    )
+    @action(detail=False, methods=["get"])
+    def unread_count(self, request):
+        return Response({"count": UnreadCounterService.get(request.user.pk)})
+
+    @extend_schema(
+        summary="Ticket do stream",
+        description=(
+            "Emite um ticket de uso único e vida curta para abrir o stream SSE "
+            "(/api/notifications/stream/?ticket=...), já que o EventSource "
+            "não envia o header Authorization"
+        ),
+        request=None,
+        responses={
+            201: {
+                "type": "object",
+                "properties": {
+                    "ticket": {"type": "string"},
+                    "expires_in": {"type": "integer"},
+                },
+            }
+        },
+    )
+    @action(detail=False, methods=["post"])
+    def stream_ticket(self, request):
+        return Response(
+            {
+                "ticket": StreamTicketService.issue(request.user.pk),
+                "expires_in": settings.NOTIFICATION_STREAM_TICKET_TTL,
+            },
+            status=status.HTTP_201_CREATED,
+        )
+
     @extend_schema(
         summary="Marcar como lida",
         description="Marca uma notificação específica como lida",
@@ -41,16 +96,28 @@ class NotificationViewSet(viewsets.ReadOnlyModelViewSet):
     @action(detail=True, methods=["patch"])
     def mark_read(self, request, pk=None):
         notification = self.get_object()
-        notification.lido = True
-        notification.save()
+        # UPDATE condicional: só decrementa quem de fato mudou o estado
+        with transaction.atomic():
+            if (
+                Notification.objects.filter(pk=notification.pk)
+                .unread(request.user.notifications_last_read_at)
+                .update(lido=True)
+            ):
+                UnreadCounterService.decr(request.user.pk)
         return Response({"detail": "Notificação marcada como lida."})
 
     @extend_schema(
         summary="Marcar todas como lidas",
-        description="Marca todas as notificações do usuário como lidas",
+        description=(
+            "Marca todas as notificações do usuário como lidas, movendo a marca "
+            "d'água de leitura (uma única escrita, sem UPDATE nas notificações)"
+        ),
         request=None,
     )
     @action(detail=False, methods=["post"])
     def mark_all_read(self, request):
-        updated = self.get_queryset().filter(lido=False).update(lido=True)
+        user = request.user
+        updated = UnreadCounterService.get(user.pk)
+        user.notifications_last_read_at = timezone.now()
+        UnreadCounterService.reset(user.pk, user.notifications_last_read_at)
         return Response({"detail": f"{updated} notificações marcadas como lidas."})
@@ -21,9 +21,11 @@ from talks.serializers.retro_comparison_serializer import (
 from talks.services.action_items_tracker import ActionItemsTracker
 from talks.services.recurrence_analyzer import RecurrenceAnalyzer
 from talks.services.tendency_analyzer import TendencyAnalyzer
+from talks.versioning import ConditionalGetMixin
+from talks.versioning.handlers import retro_scope
 
 
-class RetroViewSet(viewsets.ModelViewSet):
+class RetroViewSet(ConditionalGetMixin, viewsets.ModelViewSet):
     def get_permissions(self) -> list:
         if self.action in ["join", "leave", "add_item", "vote_item"]:
             return [IsAuthenticated()]
@@ -31,16 +33,30 @@ class RetroViewSet(viewsets.ModelViewSet):
             return [IsAuthenticated(), IsStaffOrAdmin()]
         return [IsAuthenticated(), IsOwnerOrReadOnly()]
 
+    def get_version_scopes(self):
+        if self.action == "retrieve":
+            return [retro_scope(self.kwargs["pk"]), "users", "retro_templates"]
+        return None
+
     def get_queryset(self):
-        queryset = Retro.objects.select_related("autor", "template").prefetch_related(
-            "participantes",
-            Prefetch(
-                "items",
-                queryset=RetroItem.objects.select_related("autor")
-                .prefetch_related("votes")
-                .order_by("-ordem", "-id"),
-            ),
-        )
+        queryset = Retro.objects.all()
+
+        # Listagem: totais anotados e perfil do autor em prefetches (queries
+        # constantes por página); o board completo só é carregado no retrieve
+        if self.action == "list":
+            queryset = (
+                queryset.select_related("template").with_totals().with_author_profile()
+            )
+        elif self.action == "retrieve":
+            queryset = queryset.select_related("autor", "template").prefetch_related(
+                "participantes",
+                Prefetch(
+                    "items",
+                    queryset=RetroItem.objects.select_related("autor")
+                    .prefetch_related("votes")
+                    .order_by("-ordem", "-id"),
+                ),
+            )
 
         status_filter = self.request.query_params.get("status")
         if status_filter:
@@ -61,7 +77,7 @@ class RetroViewSet(viewsets.ModelViewSet):
         if data_fim:
             queryset = queryset.filter(data__lte=data_fim)
 
-        return queryset.distinct()
+        return queryset
 
     def get_serializer_class(self):
         if self.action == "list":
@@ -5,6 +5,7 @@ import { useAuthStore } from "@/stores/authStore";
 import { useState, useEffect } from "react";
 import { useQuery, useMutation, useQueryClient } from "@tanstack/react-query";
 import { notificationsService } from "@/services/notifications.service";
+import { useNotificationStream } from "@/hooks/useNotificationStream";
 import { formatDate } from "@/utils/formatDate";
 import { useNavigate } from "react-router-dom";
 import { toast } from "sonner";
@@ -20,21 +21,29 @@ export function Header({ className }: HeaderProps) {
   const [showNotifications, setShowNotifications] = useState(false);
   const [showUserMenu, setShowUserMenu] = useState(false);
 
-  // Fetch notifications
+  // Badge: pushed over SSE; polling is only a fallback while disconnected
+  const streamConnected = useNotificationStream();
+  const { data: notificationCount = 0 } = useQuery({
+    queryKey: ["unread-count"],
+    queryFn: () => notificationsService.getUnreadCount(),
+    refetchInterval: streamConnected ? false : 30000, // Refetch every 30 seconds
+  });
+
+  // The list is fetched only while the dropdown is open
   const { data: notificationsData } = useQuery({
     queryKey: ["notifications"],
     queryFn: () => notificationsService.getNotifications(1, true),
-    refetchInterval: 30000, // Refetch every 30 seconds
+    enabled: showNotifications,
   });
 
   const notifications = notificationsData?.results || [];
-  const notificationCount = notificationsData?.count || 0;
 
   // Mark as read mutation
   const markAsReadMutation = useMutation({
     mutationFn: (id: number) => notificationsService.markAsRead(id),
     onSuccess: () => {
       queryClient.invalidateQueries({ queryKey: ["notifications"] });
+      queryClient.invalidateQueries({ queryKey: ["unread-count"] });
     },
   });
 
@@ -43,6 +52,7 @@ export function Header({ className }: HeaderProps) {
     mutationFn: () => notificationsService.markAllAsRead(),
     onSuccess: () => {
       queryClient.invalidateQueries({ queryKey: ["notifications"] });
+      queryClient.invalidateQueries({ queryKey: ["unread-count"] });
       toast.success("Todas as notificações foram marcadas como lidas");
     },
   });
@@ -1,4 +1,5 @@
 export { useConfetti } from "./useConfetti";
 export { useIdeaPermissions } from "./useIdeaPermissions";
+export { useNotificationStream } from "./useNotificationStream";
 export { useRetroMetrics } from "./useRetroMetrics";
 export { useSessionManager } from "./useSessionManager";
@@ -0,0 +1,90 @@
+import { useEffect, useState } from "react";
+import { useQueryClient } from "@tanstack/react-query";
+import { useAuthStore } from "@/stores/authStore";
+import { notificationsService } from "@/services/notifications.service";
+import { API_BASE_URL, ENDPOINTS } from "@/utils/constants";
+import type { Notification } from "@/types";
+
+interface UnreadCountEvent {
+  unread_count: number;
+}
+
+interface NotificationEvent extends UnreadCountEvent {
+  notification: Notification;
+}
+
+// Mesmo intervalo que o servidor anuncia em `retry`
+const RECONNECT_DELAY = 5000;
+
+/**
+ * Mantém o badge de notificações atualizado via SSE.
+ *
+ * Retorna `true` enquanto o stream está conectado; nesse período o polling do
+ * contador pode ser desligado. O stream é aberto com um ticket de uso único
+ * (o JWT não vai na URL), então a reconexão automática do EventSource não
+ * serve: em caso de queda a conexão é fechada e reaberta com um ticket novo.
+ */
+export function useNotificationStream() {
+  const queryClient = useQueryClient();
+  const { token } = useAuthStore();
+  const [connected, setConnected] = useState(false);
+
+  useEffect(() => {
+    if (!token || typeof EventSource === "undefined") return;
+
+    let source: EventSource | null = null;
+    let reconnectTimer: ReturnType<typeof setTimeout> | undefined;
+    let cancelled = false;
+
+    const scheduleReconnect = () => {
+      if (cancelled) return;
+      reconnectTimer = setTimeout(connect, RECONNECT_DELAY);
+    };
+
+    async function connect() {
+      let ticket: string;
+      try {
+        ticket = await notificationsService.getStreamTicket();
+      } catch {
+        scheduleReconnect();
+        return;
+      }
+      if (cancelled) return;
+
+      const url = `${API_BASE_URL}${ENDPOINTS.NOTIFICATIONS_STREAM}?ticket=${encodeURIComponent(ticket)}`;
+      const current = new EventSource(url);
+      source = current;
+
+      current.onopen = () => setConnected(true);
+      current.onerror = () => {
+        setConnected(false);
+        current.close();
+        scheduleReconnect();
+      };
+
+      current.addEventListener("unread_count", (event) => {
+        const data: UnreadCountEvent = JSON.parse((event as MessageEvent).data);
+        queryClient.setQueryData(["unread-count"], data.unread_count);
+      });
+
+      current.addEventListener("notification", (event) => {
+        const data: NotificationEvent = JSON.parse(
+          (event as MessageEvent).data,
+        );
+        queryClient.setQueryData(["unread-count"], data.unread_count);
+        queryClient.invalidateQueries({ queryKey: ["notifications"] });
+      });
+    }
+
+    connect();
+
+    return () => {
+      cancelled = true;
+      clearTimeout(reconnectTimer);
+      source?.close();
+      setConnected(false);
+    };
+  }, [token, queryClient]);
+
+  return connected;
+}
@@ -42,7 +42,9 @@ class IdeasService {
    * Obtém detalhes de uma ideia
    */
   async getIdea(id: number): Promise<IdeaDetail> {
-    const response = await api.get<IdeaDetail>(`${ENDPOINTS.IDEAS}${id}/`);
+    const response = await api.get<IdeaDetail>(`${ENDPOINTS.IDEAS}${id}/`, {
+      params: { expand: "comentarios" },
+    });
     return response.data;
   }
 
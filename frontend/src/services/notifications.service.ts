@@ -42,12 +42,9 @@ class NotificationsService {
   /**
    * Marca uma notificação como lida
    */
-  async markAsRead(id: number): Promise<Notification> {
-    const response = await api.patch<Notification>(
-      `${ENDPOINTS.NOTIFICATIONS}${id}/`,
-      {
-        lido: true,
-      },
+  async markAsRead(id: number): Promise<MessageResponse> {
+    const response = await api.patch<MessageResponse>(
+      `${ENDPOINTS.NOTIFICATIONS}${id}/mark_read/`,
     );
     return response.data;
   }
@@ -73,8 +70,20 @@ class NotificationsService {
    * Obtém contador de notificações não lidas
    */
   async getUnreadCount(): Promise<number> {
-    const response = await this.getNotifications(1, true);
-    return response.count;
+    const response = await api.get<{ count: number }>(
+      ENDPOINTS.NOTIFICATIONS_UNREAD_COUNT,
+    );
+    return response.data.count;
+  }
+
+  /**
+   * Obtém um ticket de uso único para abrir o stream SSE
+   */
+  async getStreamTicket(): Promise<string> {
+    const response = await api.post<{ ticket: string; expires_in: number }>(
+      ENDPOINTS.NOTIFICATIONS_STREAM_TICKET,
+    );
+    return response.data.ticket;
   }
 }
 
@@ -111,9 +111,15 @@ export interface Comment {
   updated_at: string;
 }
 
+export interface VoteSummary {
+  total: number;
+  votantes: Pick<User, "id" | "username" | "avatar">[];
+}
+
 export interface IdeaDetail extends IdeaListItem {
   conteudo: string;
-  votos: Vote[];
+  votos?: Vote[];
+  votos_resumo: VoteSummary;
   comentarios: Comment[];
   is_presenter: boolean;
 }
@@ -136,11 +142,25 @@ export type NotificationType =
   | "comentario"
   | "mencao";
 
+export interface NotificationActor {
+  id: number;
+  username: string;
+}
+
+export interface IdeaReference {
+  id: number;
+  titulo: string;
+  status: IdeaStatus;
+  imagem: string | null;
+}
+
 export interface Notification {
   id: number;
   tipo: NotificationType;
   mensagem: string;
-  idea: IdeaListItem | null;
+  contagem: number;
+  atores: NotificationActor[];
+  idea: IdeaReference | null;
   lido: boolean;
   created_at: string;
 }
@@ -102,6 +102,9 @@ export const ENDPOINTS = {
   // Notifications
   NOTIFICATIONS: "/notifications/",
   NOTIFICATIONS_UNREAD: "/notifications/unread/",
+  NOTIFICATIONS_UNREAD_COUNT: "/notifications/unread_count/",
+  NOTIFICATIONS_STREAM: "/notifications/stream/",
+  NOTIFICATIONS_STREAM_TICKET: "/notifications/stream_ticket/",
   NOTIFICATIONS_MARK_ALL_READ: "/notifications/mark_all_read/",
 } as const;
 